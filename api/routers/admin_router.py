@@ -12,10 +12,13 @@ STRICT CONSTRAINTS:
 - No model activation
 """
 
-from fastapi import APIRouter, Request, status
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
 
 from api.schemas.common.metadata import Metadata
-from api.schemas.common.pagination import Pagination
+from api.schemas.common.pagination import cursor_pagination_meta
+from api.services.append_only_store import InvalidCursorError
 from api.services.audit_service import AuditService
 from api.services.report_service import ReportService
 
@@ -64,8 +67,15 @@ async def get_system_status(request: Request) -> dict:
 )
 async def list_audit_logs(
     request: Request,
-    page: int = 1,
-    page_size: int = 50,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    actor_id: Optional[str] = None,
+    trace_id: Optional[str] = None,
+    event_type: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    descending: bool = False,
+    include_total: bool = False,
 ) -> dict:
     """
     List audit log entries.
@@ -77,23 +87,31 @@ async def list_audit_logs(
 
     NOTE:
     Logs are append-only and immutable.
+    Keyset pagination: pass `next_cursor` back as `cursor`.
+    Exact totals are only computed when `include_total=true`.
     """
     request_id = getattr(request.state, "request_id", None)
 
     audit_service = AuditService()
-    logs, total = audit_service.list_audit_logs(
-        page=page,
-        page_size=page_size,
-        request_id=request_id,
-    )
+    try:
+        page = audit_service.list_audit_logs(
+            cursor=cursor,
+            limit=limit,
+            actor_id=actor_id,
+            trace_id=trace_id,
+            event_type=event_type,
+            since=since,
+            until=until,
+            descending=descending,
+            include_total=include_total,
+            request_id=request_id,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     return {
-        "items": [log.model_dump() for log in logs],
-        "pagination": Pagination(
-            page=page,
-            page_size=page_size,
-            total_items=total,
-        ).model_dump(),
+        "items": page.items,
+        "pagination": cursor_pagination_meta(page, cursor, limit),
         "metadata": Metadata(
             request_id=request_id,
         ).model_dump(),
@@ -107,8 +125,10 @@ async def list_audit_logs(
 )
 async def list_all_reports(
     request: Request,
-    page: int = 1,
-    page_size: int = 20,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=500),
+    valuation_id: Optional[str] = None,
+    include_total: bool = False,
 ) -> dict:
     """
     Admin-level report discovery endpoint.
@@ -120,23 +140,25 @@ async def list_all_reports(
 
     NOTE:
     This endpoint does NOT modify or regenerate reports.
+    Keyset pagination: pass `next_cursor` back as `cursor`.
     """
     request_id = getattr(request.state, "request_id", None)
 
     report_service = ReportService()
-    reports, total = report_service.list_reports(
-        page=page,
-        page_size=page_size,
-        request_id=request_id,
-    )
+    try:
+        page = report_service.list_reports(
+            cursor=cursor,
+            limit=limit,
+            valuation_id=valuation_id,
+            include_total=include_total,
+            request_id=request_id,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     return {
-        "items": [r.model_dump() for r in reports],
-        "pagination": Pagination(
-            page=page,
-            page_size=page_size,
-            total_items=total,
-        ).model_dump(),
+        "items": page.items,
+        "pagination": cursor_pagination_meta(page, cursor, limit),
         "metadata": Metadata(
             request_id=request_id,
         ).model_dump(),
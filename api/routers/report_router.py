@@ -12,11 +12,15 @@ STRICT CONSTRAINTS:
 - No decision authority
 """
 
-from fastapi import APIRouter, Request, status
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 from api.schemas.common.metadata import Metadata
-from api.schemas.common.pagination import Pagination
+from api.schemas.common.pagination import cursor_pagination_meta
+from api.services.append_only_store import InvalidCursorError
 from api.services.report_service import ReportService
+from api.services.response_cache import cached_artifact_response
 
 router = APIRouter(
     prefix="/reports",
@@ -32,7 +36,7 @@ router = APIRouter(
 async def get_valuation_report(
     valuation_id: str,
     request: Request,
-) -> dict:
+) -> Response:
     """
     Retrieve valuation report artifact.
 
@@ -43,21 +47,32 @@ async def get_valuation_report(
 
     NOTE:
     Returned report is immutable and non-decisive.
+    Served from the immutable response cache (ETag / If-None-Match),
+    keyed by the latest report's content hash; the ETag covers the report content, not the per-request metadata.
     """
     request_id = getattr(request.state, "request_id", None)
 
-    service = ReportService()
-    report = service.get_valuation_report(
-        valuation_id=valuation_id,
-        request_id=request_id,
-    )
-
-    return {
-        "report": report.model_dump(),
-        "metadata": Metadata(
+    def _load():
+        service = ReportService()
+        return service.get_valuation_report(
+            valuation_id=valuation_id,
             request_id=request_id,
-        ).model_dump(),
-    }
+        )
+
+    try:
+        return cached_artifact_response(
+            request,
+            artifact_type="valuation_report",
+            artifact_id=valuation_id,
+            loader=_load,
+            content_hash=ReportService.get_report_content_hash(valuation_id),
+            envelope_key="report",
+            envelope_metadata=Metadata(
+                request_id=request_id,
+            ).model_dump(),
+        )
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="Report not found") from exc
 
 
 @router.get(
@@ -67,8 +82,9 @@ async def get_valuation_report(
 )
 async def list_reports(
     request: Request,
-    page: int = 1,
-    page_size: int = 20,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=500),
+    include_total: bool = False,
 ) -> dict:
     """
     List existing reports.
@@ -80,23 +96,24 @@ async def list_reports(
 
     NOTE:
     No filtering by performance or outcome.
+    Keyset pagination: pass `next_cursor` back as `cursor`.
     """
     request_id = getattr(request.state, "request_id", None)
 
     service = ReportService()
-    reports, total = service.list_reports(
-        page=page,
-        page_size=page_size,
-        request_id=request_id,
-    )
+    try:
+        page = service.list_reports(
+            cursor=cursor,
+            limit=limit,
+            include_total=include_total,
+            request_id=request_id,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     return {
-        "items": [r.model_dump() for r in reports],
-        "pagination": Pagination(
-            page=page,
-            page_size=page_size,
-            total_items=total,
-        ).model_dump(),
+        "items": page.items,
+        "pagination": cursor_pagination_meta(page, cursor, limit),
         "metadata": Metadata(
             request_id=request_id,
         ).model_dump(),
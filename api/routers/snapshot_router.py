@@ -12,11 +12,12 @@ STRICT CONSTRAINTS:
 - Snapshot is immutable once created
 """
 
-from fastapi import APIRouter, Request, status
+from fastapi import APIRouter, Request, Response, status
 
 from api.schemas.request.feature_snapshot_request import FeatureSnapshotRequest
 from api.schemas.common.metadata import Metadata
 from api.services.snapshot_service import SnapshotService
+from api.services.response_cache import cached_artifact_response
 
 router = APIRouter(
     prefix="/snapshots",
@@ -70,7 +71,7 @@ async def create_snapshot(
 async def get_snapshot(
     snapshot_id: str,
     request: Request,
-) -> dict:
+) -> Response:
     """
     Retrieve an existing snapshot.
 
@@ -81,13 +82,22 @@ async def get_snapshot(
 
     NOTE:
     Snapshot content is returned AS-IS.
+    Served from the immutable response cache (ETag / If-None-Match),
+    keyed by snapshot_id (write-once artifact).
     """
     request_id = getattr(request.state, "request_id", None)
 
-    service = SnapshotService()
-    snapshot = service.get_snapshot(
-        snapshot_id=snapshot_id,
-        request_id=request_id,
+    def _load():
+        service = SnapshotService()
+        return service.get_snapshot(
+            snapshot_id=snapshot_id,
+            request_id=request_id,
+        )
+
+    return cached_artifact_response(
+        request,
+        artifact_type="snapshot",
+        artifact_id=snapshot_id,
+        loader=_load,
+        write_once=True,
     )
-
-    return snapshot.model_dump()
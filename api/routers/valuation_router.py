@@ -12,11 +12,12 @@ STRICT CONSTRAINTS:
 - No decision making
 """
 
-from fastapi import APIRouter, Request, status
+from fastapi import APIRouter, Request, Response, status
 
 from api.schemas.request.valuation_request import ValuationRequest
 from api.schemas.common.metadata import Metadata
 from api.services.valuation_service import ValuationService
+from api.services.response_cache import cached_artifact_response
 
 router = APIRouter(
     prefix="/valuations",
@@ -71,7 +72,7 @@ async def run_valuation(
 async def get_valuation(
     valuation_id: str,
     request: Request,
-) -> dict:
+) -> Response:
     """
     Retrieve valuation result.
 
@@ -82,13 +83,22 @@ async def get_valuation(
 
     NOTE:
     Returned data is immutable and AS-IS.
+    Served from the immutable response cache (ETag / If-None-Match),
+    keyed by valuation_id (write-once artifact).
     """
     request_id = getattr(request.state, "request_id", None)
 
-    service = ValuationService()
-    valuation_result = service.get_valuation(
-        valuation_id=valuation_id,
-        request_id=request_id,
+    def _load():
+        service = ValuationService()
+        return service.get_valuation(
+            valuation_id=valuation_id,
+            request_id=request_id,
+        )
+
+    return cached_artifact_response(
+        request,
+        artifact_type="valuation",
+        artifact_id=valuation_id,
+        loader=_load,
+        write_once=True,
     )
-
-    return valuation_result.model_dump()
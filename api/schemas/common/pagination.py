@@ -13,7 +13,7 @@ This file defines PAGINATION SCHEMA for API responses.
 Violation of this contract = SYSTEM VIOLATION (MASTER_SPEC.md)
 """
 
-from typing import Optional
+from typing import Any, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -77,3 +77,69 @@ class PaginationMeta(BaseModel):
         extra="forbid",             # Disallow undeclared fields
         validate_assignment=False,  # Prevent runtime mutation
     )
+
+
+class CursorPaginationMeta(BaseModel):
+    """
+    Keyset (cursor) pagination metadata for append-only listings.
+
+    Purpose:
+    - Constant-cost navigation at any depth
+    - Stable ordering while new records are appended
+
+    Cursor values are opaque and MUST NOT be parsed by clients.
+    """
+
+    limit: int = Field(
+        ...,
+        ge=1,
+        description="Maximum number of items per page.",
+        examples=[50],
+    )
+
+    cursor: Optional[str] = Field(
+        None,
+        description="Cursor used to produce this page (None = first page).",
+    )
+
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page, if one exists.",
+    )
+
+    has_next: bool = Field(
+        ...,
+        description="Indicates whether a next page exists. Informational only.",
+        examples=[True],
+    )
+
+    total_items: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Exact number of matching items, only when requested.",
+        examples=[245],
+    )
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False,
+    )
+
+
+def cursor_pagination_meta(
+    page: Any,
+    cursor: Optional[str],
+    limit: int,
+) -> dict:
+    """
+    Serialized CursorPaginationMeta for one keyset page
+    (api.services.append_only_store.KeysetPage).
+    """
+    return CursorPaginationMeta(
+        limit=limit,
+        cursor=cursor,
+        next_cursor=page.next_cursor,
+        has_next=page.has_next,
+        total_items=page.total_items,
+    ).model_dump()
@@ -0,0 +1,358 @@
+"""
+api/services/append_only_store.py
+
+GOVERNANCE NOTICE
+-----------------
+Append-only, indexed record store backing audit-log and report listing.
+
+STRICT CONSTRAINTS:
+- Append-only (no update, no delete)
+- No interpretation of records
+- No valuation logic
+- Indexes are derived data and never alter stored records
+
+Listing uses keyset (cursor) pagination:
+- Records are ordered by append sequence
+- Records whose timestamp does not go backwards form a run that is
+  ordered by both sequence and time; the few "late" records (concurrent
+  writers, clock steps, backdated reports) are kept in a small sorted
+  (timestamp, sequence) side index. Time-range pages binary-search the
+  run and merge in the matching late records, so a page never re-sorts
+  the whole range
+- A cursor pins the last returned record; the next page is located
+  by binary search instead of skipping `offset` rows
+- Exact totals are opt-in because they may require a scan
+"""
+
+import base64
+import binascii
+import heapq
+import threading
+import uuid
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be resolved."""
+
+
+@dataclass(frozen=True)
+class KeysetPage:
+    """
+    One page of a keyset listing.
+
+    - next_cursor: opaque cursor for the following page (None = last page)
+    - total_items: exact match count, only when requested
+    """
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str]
+    has_next: bool
+    total_items: Optional[int] = None
+
+
+class AppendOnlyIndexedStore:
+    """
+    Process-local append-only store with keyset pagination.
+
+    Indexes:
+    - primary: insertion sequence
+    - timestamp: in-order run (sequence and timestamp both ascending)
+      plus a sorted (timestamp, sequence) list of late records
+    - record id: id -> sequence, for cursor validation
+    - secondary: one posting list per (field, value), sorted by sequence
+    """
+
+    def __init__(
+        self,
+        *,
+        id_field: str,
+        timestamp_field: str,
+        indexed_fields: Sequence[str] = (),
+    ) -> None:
+        self._id_field = id_field
+        self._timestamp_field = timestamp_field
+        self._indexed_fields = tuple(indexed_fields)
+
+        self._records: List[Dict[str, Any]] = []
+        # Records appended with timestamp >= every earlier timestamp
+        self._run_positions: List[int] = []
+        self._run_timestamps: List[str] = []
+        # Records appended with a timestamp earlier than the run's last
+        self._late_index: List[Tuple[str, int]] = []
+        self._positions_by_id: Dict[str, int] = {}
+        self._postings: Dict[str, Dict[Any, List[int]]] = {
+            field: {} for field in self._indexed_fields
+        }
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+
+    def append(self, record: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Append a record.
+
+        - Missing record id is generated (UUID4)
+        - Timestamps may arrive out of order; records keep append order
+        """
+        stored = dict(record)
+        stored.setdefault(self._id_field, str(uuid.uuid4()))
+
+        record_id = str(stored[self._id_field])
+        timestamp = stored.get(self._timestamp_field)
+        if not isinstance(timestamp, str):
+            raise ValueError(
+                f"Record field '{self._timestamp_field}' must be an ISO timestamp string"
+            )
+
+        with self._lock:
+            if record_id in self._positions_by_id:
+                raise ValueError(f"Duplicate record id: {record_id}")
+            position = len(self._records)
+            self._records.append(stored)
+            if self._run_timestamps and timestamp < self._run_timestamps[-1]:
+                insort(self._late_index, (timestamp, position))
+            else:
+                self._run_positions.append(position)
+                self._run_timestamps.append(timestamp)
+            self._positions_by_id[record_id] = position
+
+            for field in self._indexed_fields:
+                value = stored.get(field)
+                if value is not None:
+                    self._postings[field].setdefault(value, []).append(position)
+
+        return dict(stored)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def list_page(
+        self,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        filters: Optional[Mapping[str, Any]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        descending: bool = False,
+        include_total: bool = False,
+    ) -> KeysetPage:
+        """
+        Return one page of records matching equality filters and an
+        optional [since, until) timestamp range.
+        """
+        if limit < 1:
+            raise ValueError("limit must be >= 1")
+
+        active_filters = {k: v for k, v in (filters or {}).items() if v is not None}
+        for field in active_filters:
+            if field not in self._postings:
+                raise ValueError(f"Field is not indexed: {field}")
+
+        with self._lock:
+            runs, time_checked = self._candidate_runs(active_filters, since, until)
+            residual = dict(active_filters)
+            residual_time = (since, until) if time_checked else None
+
+            anchor = self._resolve_cursor(cursor) if cursor is not None else None
+            candidates = _merge_runs(runs, anchor, descending)
+
+            items: List[Dict[str, Any]] = []
+            last_position: Optional[int] = None
+            has_next = False
+            for position in candidates:
+                record = self._records[position]
+                if not self._matches(record, residual, residual_time):
+                    continue
+                if len(items) == limit:
+                    has_next = True
+                    break
+                items.append(dict(record))
+                last_position = position
+
+            total_items = None
+            if include_total:
+                total_items = self._count(runs, residual, residual_time)
+
+            next_cursor = None
+            if has_next and last_position is not None:
+                next_cursor = self._encode_cursor(last_position)
+
+        return KeysetPage(
+            items=items,
+            next_cursor=next_cursor,
+            has_next=has_next,
+            total_items=total_items,
+        )
+
+    # ------------------------------------------------------------------
+    # Internal helpers (caller holds lock)
+    # ------------------------------------------------------------------
+
+    def _candidate_runs(
+        self,
+        active_filters: Mapping[str, Any],
+        since: Optional[str],
+        until: Optional[str],
+    ) -> Tuple[List["_Run"], bool]:
+        """
+        Sorted position runs covering every match.
+
+        Returns (runs, time_checked): when time_checked is True the runs
+        may include records outside [since, until) and each record's
+        timestamp is checked while paging.
+        """
+        if since is None and until is None:
+            if not active_filters:
+                return [_Run(range(len(self._records)))], False
+            return [_Run(self._smallest_posting(active_filters))], False
+
+        run_lo = bisect_left(self._run_timestamps, since) if since is not None else 0
+        run_hi = (
+            bisect_left(self._run_timestamps, until)
+            if until is not None
+            else len(self._run_timestamps)
+        )
+        run_hi = max(run_lo, run_hi)
+
+        late_lo = bisect_left(self._late_index, (since,)) if since is not None else 0
+        late_hi = (
+            bisect_left(self._late_index, (until,))
+            if until is not None
+            else len(self._late_index)
+        )
+        late_positions = sorted(
+            position for _, position in self._late_index[late_lo:late_hi]
+        )
+
+        if not active_filters:
+            runs = [_Run(self._run_positions, run_lo, run_hi)]
+            if late_positions:
+                runs.append(_Run(late_positions))
+            return runs, False
+
+        # Position bounds of all in-range records narrow the posting list
+        bounds: List[int] = []
+        if run_hi > run_lo:
+            bounds += [self._run_positions[run_lo], self._run_positions[run_hi - 1]]
+        if late_positions:
+            bounds += [late_positions[0], late_positions[-1]]
+        posting = self._smallest_posting(active_filters)
+        if not bounds:
+            return [_Run(posting, 0, 0)], False
+
+        narrowed = _Run(
+            posting,
+            bisect_left(posting, min(bounds)),
+            bisect_right(posting, max(bounds)),
+        )
+        # Without late records, every position within the bounds is in range
+        return [narrowed], bool(self._late_index)
+
+    def _smallest_posting(self, active_filters: Mapping[str, Any]) -> List[int]:
+        postings = [
+            self._postings[field].get(value, [])
+            for field, value in active_filters.items()
+        ]
+        return min(postings, key=len)
+
+    def _matches(
+        self,
+        record: Mapping[str, Any],
+        residual: Mapping[str, Any],
+        residual_time: Optional[Tuple[Optional[str], Optional[str]]],
+    ) -> bool:
+        for field, value in residual.items():
+            if record.get(field) != value:
+                return False
+        if residual_time is not None:
+            since, until = residual_time
+            timestamp = record[self._timestamp_field]
+            if since is not None and timestamp < since:
+                return False
+            if until is not None and timestamp >= until:
+                return False
+        return True
+
+    def _count(
+        self,
+        runs: Sequence["_Run"],
+        residual: Mapping[str, Any],
+        residual_time: Optional[Tuple[Optional[str], Optional[str]]],
+    ) -> int:
+        # The driving posting list already satisfies one filter
+        if len(residual) <= 1 and residual_time is None:
+            return sum(len(run) for run in runs)
+        return sum(
+            1
+            for run in runs
+            for position in run.iterate(None, False)
+            if self._matches(self._records[position], residual, residual_time)
+        )
+
+    def _encode_cursor(self, position: int) -> str:
+        record_id = str(self._records[position][self._id_field])
+        raw = f"{position}:{record_id}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    def _resolve_cursor(self, cursor: str) -> int:
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            position_text, record_id = raw.split(":", 1)
+            position = int(position_text)
+        except (ValueError, UnicodeError, binascii.Error) as exc:
+            raise InvalidCursorError("Malformed pagination cursor") from exc
+
+        if self._positions_by_id.get(record_id) != position:
+            raise InvalidCursorError("Pagination cursor does not match any record")
+
+        return position
+
+
+class _Run:
+    """
+    Ascending position sequence, restricted to [lo, hi).
+    """
+
+    def __init__(self, positions: Sequence[int], lo: int = 0, hi: Optional[int] = None) -> None:
+        self.positions = positions
+        self.lo = lo
+        self.hi = len(positions) if hi is None else hi
+
+    def __len__(self) -> int:
+        return max(0, self.hi - self.lo)
+
+    def iterate(self, anchor: Optional[int], descending: bool) -> Iterator[int]:
+        """
+        Positions after the anchor (before it when descending).
+        """
+        positions = self.positions
+        if descending:
+            stop = self.hi
+            if anchor is not None:
+                stop = min(stop, bisect_left(positions, anchor, self.lo, self.hi))
+            return (positions[i] for i in range(stop - 1, self.lo - 1, -1))
+
+        start = self.lo
+        if anchor is not None:
+            start = max(start, bisect_right(positions, anchor, self.lo, self.hi))
+        return (positions[i] for i in range(start, self.hi))
+
+
+def _merge_runs(
+    runs: Sequence[_Run],
+    anchor: Optional[int],
+    descending: bool,
+) -> Iterator[int]:
+    iterators = [run.iterate(anchor, descending) for run in runs]
+    if len(iterators) == 1:
+        return iterators[0]
+    return heapq.merge(*iterators, reverse=descending)
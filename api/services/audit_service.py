@@ -15,9 +15,20 @@ STRICT CONSTRAINTS:
 This service exists solely for auditability and legal traceability.
 """
 
+import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+from api.services.append_only_store import AppendOnlyIndexedStore, KeysetPage
+
+
+# Process-local append-only audit log, indexed for keyset listing.
+audit_log_store = AppendOnlyIndexedStore(
+    id_field="event_id",
+    timestamp_field="timestamp",
+    indexed_fields=("actor_id", "trace_id", "event_type", "reference_id"),
+)
+
 
 class AuditService:
     """
@@ -37,9 +48,10 @@ class AuditService:
         reference_id: str,
         payload: Dict[str, Any],
         actor_id: Optional[str] = None,
+        trace_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
-        Create an audit event record.
+        Create an audit event record and append it to the audit log.
 
         Parameters:
         - event_type:
@@ -50,20 +62,71 @@ class AuditService:
             Read-only evidence payload
         - actor_id:
             Optional human actor identifier
+        - trace_id:
+            Optional request / trace identifier
 
         Returns:
         - Audit event dictionary (append-only, non-decisive)
         """
 
         audit_event: Dict[str, Any] = {
+            "event_id": str(uuid.uuid4()),
             "event_type": event_type,
             "reference_id": reference_id,
             "actor_id": actor_id,
+            "trace_id": trace_id,
             "timestamp": datetime.utcnow().isoformat(),
             "payload": payload,
         }
 
-        return audit_event
+        return audit_log_store.append(audit_event)
+
+    @staticmethod
+    def list_audit_logs(
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        actor_id: Optional[str] = None,
+        trace_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        descending: bool = False,
+        include_total: bool = False,
+        request_id: Optional[str] = None,
+    ) -> KeysetPage:
+        """
+        List audit events using keyset pagination.
+
+        Parameters:
+        - cursor:
+            Opaque cursor returned by the previous page (None = first page)
+        - limit:
+            Maximum number of events to return
+        - actor_id / trace_id / event_type:
+            Optional equality filters (indexed)
+        - since / until:
+            Optional ISO timestamp range [since, until)
+        - include_total:
+            Compute exact match count (may require a scan)
+
+        Returns:
+        - KeysetPage (read-only copies of audit events)
+        """
+
+        return audit_log_store.list_page(
+            cursor=cursor,
+            limit=limit,
+            filters={
+                "actor_id": actor_id,
+                "trace_id": trace_id,
+                "event_type": event_type,
+            },
+            since=since,
+            until=until,
+            descending=descending,
+            include_total=include_total,
+        )
 
     @staticmethod
     def assemble_audit_bundle(
@@ -15,10 +15,21 @@ STRICT CONSTRAINTS:
 This service is a read-only report assembler.
 """
 
+import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional
 
 from api.schemas.common.metadata import Metadata
+from api.services.append_only_store import AppendOnlyIndexedStore, KeysetPage
+from api.services.response_cache import compute_content_hash
+
+
+# Process-local append-only report index, listed with keyset pagination.
+report_index_store = AppendOnlyIndexedStore(
+    id_field="report_id",
+    timestamp_field="report_generated_at",
+    indexed_fields=("valuation_id",),
+)
 
 
 class ReportService:
@@ -45,6 +56,9 @@ class ReportService:
         """
         Assemble valuation report payload.
 
+        Pure assembly: callers that persist the report register it with
+        register_report so it can be listed and retrieved.
+
         Parameters:
         - valuation_payload:
             Read-only valuation result (ensemble output)
@@ -68,3 +82,88 @@ class ReportService:
         }
 
         return report
+
+    @staticmethod
+    def register_report(
+        valuation_id: str,
+        report: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Append a generated report to the report index.
+
+        Returns:
+        - Index entry (report_id, valuation_id, report_generated_at,
+          content_hash, report)
+        """
+
+        entry: Dict[str, Any] = {
+            "report_id": str(uuid.uuid4()),
+            "valuation_id": valuation_id,
+            "report_generated_at": report.get(
+                "report_generated_at", datetime.utcnow().isoformat()
+            ),
+            "content_hash": compute_content_hash(report),
+            "report": report,
+        }
+
+        return report_index_store.append(entry)
+
+    @staticmethod
+    def get_valuation_report(
+        *,
+        valuation_id: str,
+        request_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Latest registered report for a valuation.
+
+        Raises:
+        - KeyError if no report has been registered
+        """
+
+        return ReportService._latest_entry(valuation_id)["report"]
+
+    @staticmethod
+    def get_report_content_hash(valuation_id: str) -> str:
+        """
+        Content hash of the latest registered report for a valuation
+        (response cache key; no report serialization needed).
+
+        Raises:
+        - KeyError if no report has been registered
+        """
+
+        return ReportService._latest_entry(valuation_id)["content_hash"]
+
+    @staticmethod
+    def _latest_entry(valuation_id: str) -> Dict[str, Any]:
+        page = report_index_store.list_page(
+            limit=1,
+            filters={"valuation_id": valuation_id},
+            descending=True,
+        )
+        if not page.items:
+            raise KeyError(f"No report registered for valuation: {valuation_id}")
+        return page.items[0]
+
+    @staticmethod
+    def list_reports(
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        valuation_id: Optional[str] = None,
+        include_total: bool = False,
+        request_id: Optional[str] = None,
+    ) -> KeysetPage:
+        """
+        List indexed reports using keyset pagination.
+
+        Exact totals are opt-in (include_total) to keep deep pages cheap.
+        """
+
+        return report_index_store.list_page(
+            cursor=cursor,
+            limit=limit,
+            filters={"valuation_id": valuation_id},
+            include_total=include_total,
+        )
@@ -0,0 +1,298 @@
+"""
+api/services/response_cache.py
+
+GOVERNANCE NOTICE
+-----------------
+This service caches serialized, write-once artifacts for read-only
+GET endpoints (valuations, snapshots, reports).
+
+STRICT CONSTRAINTS:
+- Transport optimisation only
+- No valuation logic
+- No mutation or interpretation of cached artifacts
+- Only immutable artifacts may be cached
+
+Entries are keyed by the artifact content hash as well as its ID, so
+an artifact regenerated under the same ID is never served stale.
+Write-once artifacts (valuations, snapshots), whose IDs are never
+reused, are keyed by ID alone. Invalidation is otherwise limited to
+LRU eviction.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+
+
+ETAG_HEADER = "ETag"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+CACHE_STATUS_HEADER = "X-Cache"
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 3600
+
+# Content-hash slot of the cache key for ID-keyed write-once artifacts
+WRITE_ONCE_CONTENT_HASH = "write-once"
+
+
+@dataclass(frozen=True)
+class CachedArtifact:
+    """
+    Serialized immutable artifact.
+
+    - body: canonical JSON bytes of the artifact
+    - etag: strong ETag derived from the content hash
+    - content_hash: cache key hash (WRITE_ONCE_CONTENT_HASH for
+      ID-keyed write-once artifacts)
+    """
+    artifact_type: str
+    artifact_id: str
+    content_hash: str
+    body: bytes
+    etag: str
+
+
+class ImmutableResponseCache:
+    """
+    Process-local LRU cache for immutable artifact responses.
+
+    Characteristics:
+    - Keyed by (artifact_type, artifact_id, content_hash)
+    - Bounded by total serialized byte size
+    - Content-addressed ETag (SHA-256 of canonical JSON)
+    - Thread-safe
+    - Non-persistent (process-local)
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str, str], CachedArtifact]" = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(
+        self,
+        artifact_type: str,
+        artifact_id: str,
+        content_hash: str,
+    ) -> Optional[CachedArtifact]:
+        key = (artifact_type, artifact_id, content_hash)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def put(
+        self,
+        artifact_type: str,
+        artifact_id: str,
+        content_hash: str,
+        artifact: Any,
+    ) -> CachedArtifact:
+        """
+        Serialize and store an artifact under its content hash.
+
+        Artifacts larger than the byte budget are returned but not stored.
+        """
+        entry = _build_entry(artifact_type, artifact_id, content_hash, artifact)
+        body = entry.body
+
+        if len(body) > self._max_bytes:
+            return entry
+
+        key = (artifact_type, artifact_id, content_hash)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= len(previous.body)
+
+            self._entries[key] = entry
+            self._current_bytes += len(body)
+
+            while self._current_bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._current_bytes -= len(evicted.body)
+
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+# ----------------------------------------------------------------------
+# Serialization helpers
+# ----------------------------------------------------------------------
+
+def serialize_artifact(artifact: Any) -> bytes:
+    """
+    Canonical JSON serialization (deterministic, content-based).
+    """
+    if hasattr(artifact, "model_dump"):
+        artifact = artifact.model_dump(mode="json")
+
+    return json.dumps(
+        artifact,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    ).encode("utf-8")
+
+
+def compute_content_hash(artifact: Any) -> str:
+    """
+    SHA-256 of the canonical JSON serialization.
+    """
+    return hashlib.sha256(serialize_artifact(artifact)).hexdigest()
+
+
+def compute_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest() + '"'
+
+
+def _build_entry(
+    artifact_type: str,
+    artifact_id: str,
+    content_hash: Optional[str],
+    artifact: Any,
+) -> CachedArtifact:
+    body = serialize_artifact(artifact)
+    etag = compute_etag(body)
+    return CachedArtifact(
+        artifact_type=artifact_type,
+        artifact_id=artifact_id,
+        content_hash=content_hash if content_hash is not None else etag.strip('"'),
+        body=body,
+        etag=etag,
+    )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    for candidate in candidates:
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+# ----------------------------------------------------------------------
+# Shared process-local cache
+# ----------------------------------------------------------------------
+
+response_cache = ImmutableResponseCache()
+
+
+def cached_artifact_response(
+    request: Request,
+    *,
+    artifact_type: str,
+    artifact_id: str,
+    loader: Callable[[], Any],
+    content_hash: Optional[str] = None,
+    write_once: bool = False,
+    envelope_key: Optional[str] = None,
+    envelope_metadata: Optional[Dict[str, Any]] = None,
+    cache: Optional[ImmutableResponseCache] = None,
+    max_age_seconds: int = DEFAULT_MAX_AGE_SECONDS,
+) -> Response:
+    """
+    Serve an immutable artifact with ETag / If-None-Match support.
+
+    Flow:
+    1. Lookup serialized artifact by (artifact_type, artifact_id,
+       content_hash)
+    2. On miss, call loader() once and cache the serialized result
+    3. Return 304 if the client ETag matches the content hash
+    4. Otherwise return the cached bytes (optionally wrapped in an
+       envelope with per-request metadata)
+
+    write_once=True keys the entry on the artifact ID alone; only for
+    artifacts whose ID is never reused for different content.
+
+    Without a content_hash and not write_once (no cheap way to resolve
+    the current version), the body cache is bypassed: loader() runs on
+    every request and only the ETag / 304 handling applies.
+
+    The ETag covers the artifact content only; per-request metadata is
+    transport context and does not alter it.
+    """
+    cache = cache or response_cache
+
+    if content_hash is None and write_once:
+        content_hash = WRITE_ONCE_CONTENT_HASH
+
+    if content_hash is None:
+        entry = _build_entry(artifact_type, artifact_id, None, loader())
+        cache_status = "BYPASS"
+    else:
+        entry = cache.get(artifact_type, artifact_id, content_hash)
+        cache_status = "HIT"
+        if entry is None:
+            entry = cache.put(artifact_type, artifact_id, content_hash, loader())
+            cache_status = "MISS"
+
+    headers = {
+        ETAG_HEADER: entry.etag,
+        "Cache-Control": f"private, max-age={max_age_seconds}, immutable",
+        CACHE_STATUS_HEADER: cache_status,
+    }
+
+    if _etag_matches(request.headers.get(IF_NONE_MATCH_HEADER), entry.etag):
+        return Response(status_code=304, headers=headers)
+
+    body = entry.body
+    if envelope_key is not None:
+        body = b"".join(
+            [
+                b"{",
+                json.dumps(envelope_key).encode("utf-8"),
+                b":",
+                entry.body,
+                b',"metadata":',
+                serialize_artifact(envelope_metadata),
+                b"}",
+            ]
+        )
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=headers,
+    )
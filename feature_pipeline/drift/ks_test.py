@@ -27,6 +27,32 @@ class KSTestError(Exception):
     """Raised when KS test inputs are invalid."""
 
 
+def approximate_p_value(d: float, n1: int, n2: int) -> float:
+    """
+    Asymptotic approximation of the two-sample KS test p-value.
+
+    Shared by KSTest and the batch / streaming drift engines so every
+    KS output uses the same approximation.
+
+    Reference
+    ---------
+    Kolmogorov distribution approximation.
+    """
+    if n1 <= 0 or n2 <= 0:
+        return 1.0
+
+    en = math.sqrt((n1 * n2) / (n1 + n2))
+    lambda_val = (en + 0.12 + 0.11 / en) * d
+
+    # Kolmogorov asymptotic formula
+    p = 2.0 * sum(
+        (-1) ** (k - 1) * math.exp(-2 * (k ** 2) * (lambda_val ** 2))
+        for k in range(1, 100)
+    )
+
+    return max(min(p, 1.0), 0.0)
+
+
 class KSTest:
     """
     Deterministic Kolmogorov–Smirnov test implementation.
@@ -34,6 +60,9 @@ class KSTest:
     Notes
     -----
     - Intended for continuous numeric features
+    - Tied values are consumed together before the ECDF gap is taken,
+      so the statistic is the exact two-sample sup |F1 - F2| also on
+      discrete / tied data
     - Output is descriptive only
     - Interpretation is strictly external
     """
@@ -80,12 +109,20 @@ class KSTest:
 
         while i < n1 and j < n2:
             if baseline_sorted[i] <= current_sorted[j]:
+                value = baseline_sorted[i]
                 i += 1
-                cdf1 = i / n1
             else:
+                value = current_sorted[j]
+                j += 1
+
+            # ECDFs are compared only after every copy of a tied value
+            while i < n1 and baseline_sorted[i] == value:
+                i += 1
+            while j < n2 and current_sorted[j] == value:
                 j += 1
-                cdf2 = j / n2
 
+            cdf1 = i / n1
+            cdf2 = j / n2
             ks_stat = max(ks_stat, abs(cdf1 - cdf2))
 
         # Catch remaining tail
@@ -99,7 +136,7 @@ class KSTest:
             cdf2 = j / n2
             ks_stat = max(ks_stat, abs(cdf1 - cdf2))
 
-        p_value = KSTest._approximate_p_value(ks_stat, n1, n2)
+        p_value = approximate_p_value(ks_stat, n1, n2)
 
         return {
             "ks_statistic": ks_stat,
@@ -110,29 +147,6 @@ class KSTest:
             ),
         }
 
-    @staticmethod
-    def _approximate_p_value(d: float, n1: int, n2: int) -> float:
-        """
-        Asymptotic approximation of KS test p-value.
-
-        Reference
-        ---------
-        Kolmogorov distribution approximation.
-        """
-        if n1 <= 0 or n2 <= 0:
-            return 1.0
-
-        en = math.sqrt((n1 * n2) / (n1 + n2))
-        lambda_val = (en + 0.12 + 0.11 / en) * d
-
-        # Kolmogorov asymptotic formula
-        p = 2.0 * sum(
-            (-1) ** (k - 1) * math.exp(-2 * (k ** 2) * (lambda_val ** 2))
-            for k in range(1, 100)
-        )
-
-        return max(min(p, 1.0), 0.0)
-
     @staticmethod
     def _validate_inputs(baseline: List[float], current: List[float]) -> None:
         """
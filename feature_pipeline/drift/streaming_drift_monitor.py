@@ -0,0 +1,359 @@
+"""
+feature_pipeline/drift/streaming_drift_monitor.py
+
+ROLE (MASTER_SPEC COMPLIANT)
+---------------------------
+Online (streaming) feature drift monitor.
+
+Maintains, per feature, a fixed-bin histogram and a mergeable quantile
+sketch of production values as valuations flow through. PSI and an
+approximate KS statistic can be computed at any moment without
+retaining raw values, and monitors from different worker processes
+can be merged.
+
+- PSI: histogram counts vs. baseline counts (O(bins)),
+  computed with PSICalculator
+- KS: max CDF gap between baseline and current quantile sketches
+  (O(sketch size)); p-value via ks_test.approximate_p_value
+
+ABSOLUTE PROHIBITIONS
+---------------------
+- No thresholds
+- No alerts
+- No decisions
+- No retraining trigger
+- No workflow impact
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+
+from feature_pipeline.drift.ks_test import approximate_p_value
+from feature_pipeline.drift.psi_calculator import PSICalculator
+
+
+class StreamingDriftError(Exception):
+    """Raised when streaming drift state is invalid or incompatible."""
+
+
+# =========================================================
+# QUANTILE SKETCH
+# =========================================================
+
+class QuantileSketch:
+    """
+    Mergeable KLL-style quantile sketch.
+
+    - Level h holds items of weight 2**h
+    - A full level is sorted and every other item is promoted
+      (alternating offset → deterministic, reproducible)
+    - Total weight always equals the number of inserted values
+    - Rank error is O(1/k) with high probability
+    """
+
+    def __init__(self, k: int = 200) -> None:
+        if k < 8:
+            raise StreamingDriftError("Sketch parameter k must be >= 8")
+        self.k = k
+        self._levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._n = 0
+        self._compactions = 0
+
+    @property
+    def n(self) -> int:
+        return self._n
+
+    @property
+    def retained(self) -> int:
+        return sum(level.shape[0] for level in self._levels)
+
+    def update(self, values: Any) -> None:
+        """
+        Add finite numeric values (NaN / Inf must be filtered by caller).
+        """
+        array = np.asarray(values, dtype=np.float64).ravel()
+        if array.size == 0:
+            return
+        self._levels[0] = np.concatenate((self._levels[0], array))
+        self._n += int(array.size)
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Merge another sketch into this one (in place).
+        """
+        if other.k != self.k:
+            raise StreamingDriftError("Cannot merge sketches with different k")
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0, dtype=np.float64))
+        for h, level in enumerate(other._levels):
+            self._levels[h] = np.concatenate((self._levels[h], level))
+        self._n += other._n
+        self._compress()
+
+    def cdf(self, points: Any) -> np.ndarray:
+        """
+        Estimated P(X <= x) for each point.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if self._n == 0:
+            return np.zeros(points.shape, dtype=np.float64)
+
+        rank = np.zeros(points.shape, dtype=np.float64)
+        for h, level in enumerate(self._levels):
+            if level.size:
+                rank += np.searchsorted(np.sort(level), points, side="right") * float(2 ** h)
+        return rank / self._n
+
+    def quantiles(self, probabilities: Any) -> np.ndarray:
+        """
+        Estimated quantiles for probabilities in [0, 1].
+        """
+        if self._n == 0:
+            raise StreamingDriftError("Sketch is empty")
+        items, weights = self._weighted_items()
+        cumulative = np.cumsum(weights) / self._n
+        idx = np.searchsorted(cumulative, np.asarray(probabilities, dtype=np.float64), side="left")
+        return items[np.clip(idx, 0, items.size - 1)]
+
+    def items(self) -> np.ndarray:
+        """Retained items (sorted); used as CDF evaluation points."""
+        return self._weighted_items()[0]
+
+    # -----------------------------------------------------
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - 1 - level
+        return max(2, int(np.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self) -> None:
+        h = 0
+        while h < len(self._levels):
+            level = self._levels[h]
+            if level.size > self._capacity(h):
+                level = np.sort(level)
+                keep = level[-1:] if level.size % 2 else level[:0]
+                pairs = level[: level.size - keep.size]
+                promoted = pairs[self._compactions % 2::2]
+                self._compactions += 1
+
+                self._levels[h] = keep
+                if h + 1 == len(self._levels):
+                    self._levels.append(np.empty(0, dtype=np.float64))
+                self._levels[h + 1] = np.concatenate((self._levels[h + 1], promoted))
+                # Capacities shift when a level is added; rescan from the bottom
+                h = 0
+                continue
+            h += 1
+
+    def _weighted_items(self):
+        items = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [np.full(level.size, float(2 ** h)) for h, level in enumerate(self._levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        return items[order], weights[order]
+
+
+# =========================================================
+# PER-FEATURE STATE
+# =========================================================
+
+class FeatureStreamState:
+    """
+    Fixed-bin histogram + quantile sketch for one feature.
+
+    Bins are defined by sorted interior edges e_1 < ... < e_m:
+    (-inf, e_1], (e_1, e_2], ..., (e_m, +inf)  → m + 1 bins.
+    Non-finite values are counted separately and excluded from metrics.
+    """
+
+    def __init__(self, bin_edges: Any, sketch_k: int = 200) -> None:
+        edges = np.unique(np.asarray(bin_edges, dtype=np.float64))
+        if edges.size == 0 or not np.all(np.isfinite(edges)):
+            raise StreamingDriftError("bin_edges must be non-empty and finite")
+        self.bin_edges = edges
+        self.counts = np.zeros(edges.size + 1, dtype=np.int64)
+        self.non_finite = 0
+        self.sketch = QuantileSketch(k=sketch_k)
+
+    @property
+    def n(self) -> int:
+        return int(self.counts.sum())
+
+    def update(self, values: Any) -> None:
+        array = np.asarray(values, dtype=np.float64).ravel()
+        finite = np.isfinite(array)
+        self.non_finite += int(array.size - np.count_nonzero(finite))
+        array = array[finite]
+        if array.size == 0:
+            return
+        bins = np.searchsorted(self.bin_edges, array, side="left")
+        self.counts += np.bincount(bins, minlength=self.counts.size)
+        self.sketch.update(array)
+
+    def merge(self, other: "FeatureStreamState") -> None:
+        if not np.array_equal(self.bin_edges, other.bin_edges):
+            raise StreamingDriftError("Cannot merge states with different bin edges")
+        self.counts += other.counts
+        self.non_finite += other.non_finite
+        self.sketch.merge(other.sketch)
+
+    def empty_like(self) -> "FeatureStreamState":
+        return FeatureStreamState(self.bin_edges, sketch_k=self.sketch.k)
+
+
+# =========================================================
+# MONITOR
+# =========================================================
+
+class StreamingDriftMonitor:
+    """
+    Online PSI / KS drift monitor over production feature streams.
+
+    Usage
+    -----
+    monitor = StreamingDriftMonitor.from_baseline(baseline_columns)
+    monitor.update(batch_columns)          # per valuation / micro-batch
+    monitor.merge(other_worker_monitor)    # across processes
+    monitor.snapshot()                     # PSI + approximate KS per feature
+    """
+
+    def __init__(
+        self,
+        baseline: Mapping[str, FeatureStreamState],
+    ) -> None:
+        self._baseline: Dict[str, FeatureStreamState] = dict(baseline)
+        self._current: Dict[str, FeatureStreamState] = {
+            name: state.empty_like() for name, state in self._baseline.items()
+        }
+
+    @classmethod
+    def from_baseline(
+        cls,
+        baseline_columns: Mapping[str, Any],
+        n_bins: int = 10,
+        sketch_k: int = 200,
+        bin_edges: Optional[Mapping[str, Any]] = None,
+    ) -> "StreamingDriftMonitor":
+        """
+        Build baseline states from reference columns.
+
+        Bin edges default to baseline deciles (n_bins quantile bins).
+        """
+        states: Dict[str, FeatureStreamState] = {}
+        for name, values in baseline_columns.items():
+            array = np.asarray(values, dtype=np.float64).ravel()
+            finite = array[np.isfinite(array)]
+            if bin_edges is not None and name in bin_edges:
+                edges = bin_edges[name]
+            else:
+                if finite.size == 0:
+                    raise StreamingDriftError(f"Baseline for '{name}' has no finite values")
+                edges = np.quantile(finite, np.linspace(0, 1, n_bins + 1)[1:-1])
+                if np.unique(edges).size == 0:
+                    edges = finite[:1]
+            state = FeatureStreamState(edges, sketch_k=sketch_k)
+            state.update(array)
+            states[name] = state
+        return cls(states)
+
+    @property
+    def features(self) -> List[str]:
+        return list(self._baseline)
+
+    def update(self, batch: Mapping[str, Any]) -> None:
+        """
+        Add current values for any subset of monitored features.
+        Unknown features are ignored (descriptive monitor only).
+        """
+        for name, values in batch.items():
+            state = self._current.get(name)
+            if state is not None:
+                state.update(values)
+
+    def update_record(self, feature_values: Mapping[str, Any]) -> None:
+        """
+        Add one valuation's feature values (scalar per feature).
+        """
+        self.update({name: [value] for name, value in feature_values.items()
+                     if isinstance(value, (int, float)) and not isinstance(value, bool)})
+
+    def merge(self, other: "StreamingDriftMonitor") -> None:
+        """
+        Merge current-window state from another worker (in place).
+        """
+        if set(other._current) != set(self._current):
+            raise StreamingDriftError("Cannot merge monitors with different features")
+        for name, state in other._current.items():
+            self._current[name].merge(state)
+
+    def reset_current(self) -> None:
+        """
+        Start a new comparison window (baseline is retained).
+        """
+        self._current = {
+            name: state.empty_like() for name, state in self._baseline.items()
+        }
+
+    # -----------------------------------------------------
+    # Metrics
+    # -----------------------------------------------------
+
+    def psi(self, feature_name: str, epsilon: float = 1e-6) -> Dict[str, Any]:
+        baseline, current = self._pair(feature_name)
+        return PSICalculator.calculate_with_breakdown(
+            expected_distribution=baseline.counts.astype(float).tolist(),
+            actual_distribution=current.counts.astype(float).tolist(),
+            epsilon=epsilon,
+        )
+
+    def ks(self, feature_name: str) -> Dict[str, Any]:
+        baseline, current = self._pair(feature_name)
+        points = np.union1d(baseline.sketch.items(), current.sketch.items())
+        gap = np.abs(baseline.sketch.cdf(points) - current.sketch.cdf(points))
+        statistic = float(gap.max()) if gap.size else 0.0
+        return {
+            "ks_statistic": statistic,
+            "p_value": approximate_p_value(statistic, baseline.n, current.n),
+            "approximate": True,
+            "governance_note": (
+                "KS statistic is estimated from quantile sketches. "
+                "Descriptive output only; no thresholds or decisions are applied."
+            ),
+        }
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        PSI and approximate KS for every feature with current data.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        for name in self._baseline:
+            current = self._current[name]
+            entry: Dict[str, Any] = {
+                "n_baseline": self._baseline[name].n,
+                "n_current": current.n,
+                "n_current_non_finite": current.non_finite,
+                "psi_value": None,
+                "ks_statistic": None,
+                "p_value": None,
+            }
+            if current.n:
+                ks = self.ks(name)
+                entry["psi_value"] = self.psi(name)["psi_value"]
+                entry["ks_statistic"] = ks["ks_statistic"]
+                entry["p_value"] = ks["p_value"]
+            results[name] = entry
+        return results
+
+    def _pair(self, feature_name: str):
+        if feature_name not in self._baseline:
+            raise StreamingDriftError(f"Unknown feature: {feature_name}")
+        baseline = self._baseline[feature_name]
+        current = self._current[feature_name]
+        if baseline.n == 0 or current.n == 0:
+            raise StreamingDriftError(f"No data for feature '{feature_name}'")
+        return baseline, current
@@ -11,15 +11,24 @@ Governance:
 - Deterministic
 """
 
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Any, Optional, Sequence
 from math import radians, sin, cos, sqrt, atan2
 from datetime import datetime
 import hashlib
 import json
 
+import numpy as np
+
+if TYPE_CHECKING:
+    from feature_pipeline.geo.poi_index import POIIndex
+
 
 EARTH_RADIUS_KM = 6371.0
 
+# Upper bound on N×M distance cells materialized per chunk (~32 MB float64)
+DEFAULT_MAX_CHUNK_CELLS = 4_000_000
+
 
 def _hash_payload(payload: Dict[str, Any]) -> str:
     """
@@ -52,7 +61,10 @@ def _haversine_km(
 
 def compute_distance_features(
     subject_location: Dict[str, Any],
-    reference_points: Dict[str, Dict[str, float]]
+    reference_points: Optional[Dict[str, Dict[str, float]]] = None,
+    poi_index: Optional["POIIndex"] = None,
+    poi_categories: Optional[Sequence[str]] = None,
+    poi_radii_km: Sequence[float] = ()
 ) -> Dict[str, Any]:
     """
     Compute distance features from subject location to reference points.
@@ -71,10 +83,15 @@ def compute_distance_features(
                 "landmark_x": {...}
             }
 
+        poi_index (optional):
+            POIIndex queried for the nearest POI per category and
+            POI counts within poi_radii_km (all categories by default)
+
     Output:
         DistanceFeatureSignal (descriptive only)
     """
 
+    reference_points = reference_points or {}
     latitude: Optional[float] = subject_location.get("latitude")
     longitude: Optional[float] = subject_location.get("longitude")
 
@@ -114,6 +131,223 @@ def compute_distance_features(
         )
     }
 
+    if poi_index is not None:
+        payload.update(
+            _poi_distance_features(
+                poi_index,
+                latitude,
+                longitude,
+                poi_categories,
+                poi_radii_km,
+            )
+        )
+
     payload["distance_hash"] = _hash_payload(payload)
 
     return payload
+
+
+def _poi_distance_features(
+    poi_index: "POIIndex",
+    latitude: Optional[float],
+    longitude: Optional[float],
+    categories: Optional[Sequence[str]],
+    radii_km: Sequence[float],
+) -> Dict[str, Any]:
+    """
+    Nearest-POI distance and radius counts per category.
+    """
+    categories = list(categories) if categories is not None else poi_index.categories
+    located = latitude is not None and longitude is not None
+
+    nearest: Dict[str, Optional[float]] = {}
+    counts: Dict[str, Dict[str, Optional[int]]] = {}
+
+    for category in categories:
+        matches = poi_index.nearest(latitude, longitude, category) if located else []
+        nearest[category] = round(matches[0].distance_km, 4) if matches else None
+        counts[category] = {
+            str(radius): (
+                poi_index.count_within(latitude, longitude, category, radius)
+                if located
+                else None
+            )
+            for radius in radii_km
+        }
+
+    features: Dict[str, Any] = {"nearest_poi_km": nearest}
+    if radii_km:
+        features["poi_count_within_km"] = counts
+    return features
+
+
+# =========================================================
+# BATCH (MANY-TO-MANY) DISTANCES
+# =========================================================
+
+@dataclass(frozen=True)
+class CategoryDistanceSummary:
+    """
+    Nearest-k distances and radius counts for one reference category.
+
+    - nearest_km: (N, k) distances, ascending; NaN where unavailable
+    - nearest_index: (N, k) indices into the reference arrays; -1 where unavailable
+    - counts_within_km: radius_km -> (N,) count of references within radius
+    """
+    category: str
+    nearest_km: np.ndarray
+    nearest_index: np.ndarray
+    counts_within_km: Dict[float, np.ndarray]
+
+
+def haversine_matrix_km(
+    subject_latitudes: Any,
+    subject_longitudes: Any,
+    reference_latitudes: Any,
+    reference_longitudes: Any,
+) -> np.ndarray:
+    """
+    Vectorized Haversine distances (N subjects × M references) in km.
+
+    Same formula as _haversine_km; missing coordinates (NaN) yield NaN.
+    """
+    lat1 = np.radians(np.asarray(subject_latitudes, dtype=np.float64))[:, None]
+    lon1 = np.radians(np.asarray(subject_longitudes, dtype=np.float64))[:, None]
+    lat2 = np.radians(np.asarray(reference_latitudes, dtype=np.float64))[None, :]
+    lon2 = np.radians(np.asarray(reference_longitudes, dtype=np.float64))[None, :]
+
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    np.clip(a, 0.0, 1.0, out=a)
+
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def compute_distance_matrix(
+    subject_latitudes: Any,
+    subject_longitudes: Any,
+    reference_latitudes: Any,
+    reference_longitudes: Any,
+    round_decimals: Optional[int] = 4,
+    max_chunk_cells: int = DEFAULT_MAX_CHUNK_CELLS,
+) -> np.ndarray:
+    """
+    Full N×M distance table, computed in subject chunks so that
+    intermediate arrays never exceed max_chunk_cells elements.
+
+    Distances are rounded like compute_distance_features (4 decimals).
+    """
+    subject_lat = np.asarray(subject_latitudes, dtype=np.float64)
+    subject_lon = np.asarray(subject_longitudes, dtype=np.float64)
+    ref_lat = np.asarray(reference_latitudes, dtype=np.float64)
+    ref_lon = np.asarray(reference_longitudes, dtype=np.float64)
+
+    out = np.empty((subject_lat.shape[0], ref_lat.shape[0]), dtype=np.float64)
+
+    for start, stop in _subject_chunks(subject_lat.shape[0], ref_lat.shape[0], max_chunk_cells):
+        block = haversine_matrix_km(
+            subject_lat[start:stop], subject_lon[start:stop], ref_lat, ref_lon
+        )
+        if round_decimals is not None:
+            np.round(block, round_decimals, out=block)
+        out[start:stop] = block
+
+    return out
+
+
+def compute_nearest_distance_features(
+    subject_latitudes: Any,
+    subject_longitudes: Any,
+    reference_latitudes: Any,
+    reference_longitudes: Any,
+    reference_categories: Sequence[str],
+    k: int = 1,
+    radii_km: Sequence[float] = (),
+    round_decimals: Optional[int] = 4,
+    max_chunk_cells: int = DEFAULT_MAX_CHUNK_CELLS,
+) -> Dict[str, CategoryDistanceSummary]:
+    """
+    Nearest-k distance per reference category plus counts within radii.
+
+    Input (Read-only):
+        subject_*:   N subject coordinates (NaN = missing location)
+        reference_*: M reference points (POIs) with one category each
+        k:           number of nearest references per category
+        radii_km:    radii for "count within" features
+
+    Output:
+        category -> CategoryDistanceSummary (descriptive only)
+
+    Only the nearest-k and counts are kept; the N×M table is never
+    materialized beyond one chunk.
+    """
+    if k < 1:
+        raise ValueError("k must be >= 1")
+
+    subject_lat = np.asarray(subject_latitudes, dtype=np.float64)
+    subject_lon = np.asarray(subject_longitudes, dtype=np.float64)
+    ref_lat = np.asarray(reference_latitudes, dtype=np.float64)
+    ref_lon = np.asarray(reference_longitudes, dtype=np.float64)
+    categories = np.asarray(reference_categories)
+
+    if not (ref_lat.shape == ref_lon.shape == categories.shape):
+        raise ValueError("Reference coordinates and categories must have equal length")
+
+    n_subjects = subject_lat.shape[0]
+    valid_ref = ~(np.isnan(ref_lat) | np.isnan(ref_lon))
+    radii = tuple(float(r) for r in radii_km)
+
+    summaries: Dict[str, CategoryDistanceSummary] = {}
+
+    for category in sorted(set(categories.tolist())):
+        ref_idx = np.flatnonzero((categories == category) & valid_ref)
+        k_eff = min(k, ref_idx.size)
+
+        nearest_km = np.full((n_subjects, k), np.nan, dtype=np.float64)
+        nearest_index = np.full((n_subjects, k), -1, dtype=np.int64)
+        counts = {r: np.zeros(n_subjects, dtype=np.int64) for r in radii}
+
+        if k_eff:
+            for start, stop in _subject_chunks(n_subjects, ref_idx.size, max_chunk_cells):
+                block = haversine_matrix_km(
+                    subject_lat[start:stop],
+                    subject_lon[start:stop],
+                    ref_lat[ref_idx],
+                    ref_lon[ref_idx],
+                )
+
+                if k_eff < ref_idx.size:
+                    part = np.argpartition(block, k_eff - 1, axis=1)[:, :k_eff]
+                else:
+                    part = np.broadcast_to(np.arange(ref_idx.size), block.shape)
+                part_km = np.take_along_axis(block, part, axis=1)
+                order = np.argsort(part_km, axis=1)
+                part = np.take_along_axis(part, order, axis=1)
+                part_km = np.take_along_axis(part_km, order, axis=1)
+
+                missing = np.isnan(part_km)
+                nearest_km[start:stop, :k_eff] = part_km
+                nearest_index[start:stop, :k_eff] = np.where(missing, -1, ref_idx[part])
+
+                for r in radii:
+                    counts[r][start:stop] = np.count_nonzero(block <= r, axis=1)
+
+        if round_decimals is not None:
+            np.round(nearest_km, round_decimals, out=nearest_km)
+
+        summaries[str(category)] = CategoryDistanceSummary(
+            category=str(category),
+            nearest_km=nearest_km,
+            nearest_index=nearest_index,
+            counts_within_km=counts,
+        )
+
+    return summaries
+
+
+def _subject_chunks(n_subjects: int, n_references: int, max_chunk_cells: int):
+    rows = max(1, max_chunk_cells // max(n_references, 1))
+    for start in range(0, n_subjects, rows):
+        yield start, min(start + rows, n_subjects)
@@ -11,12 +11,30 @@ Governance:
 - No inference
 """
 
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
 from datetime import datetime
 import hashlib
 import json
 import math
 
+import numpy as np
+
+
+# Fine → coarse grid resolutions (degrees); level 0 is the finest
+DEFAULT_RESOLUTIONS_DEG: Tuple[float, ...] = (0.005, 0.01, 0.05, 0.1)
+
+# Integer cell key layout (non-negative int64):
+#   bits 60-62: level | bits 30-59: lat bucket + offset | bits 0-29: lon bucket + offset
+_LEVEL_SHIFT = 60
+_LAT_SHIFT = 30
+_BUCKET_BITS = 30
+_BUCKET_MASK = (1 << _BUCKET_BITS) - 1
+_BUCKET_OFFSET = 1 << (_BUCKET_BITS - 1)
+_MAX_LEVELS = 8
+
+MISSING_CELL_KEY = -1
+
 
 def _hash_payload(payload: Dict[str, Any]) -> str:
     """
@@ -26,7 +44,7 @@ def _hash_payload(payload: Dict[str, Any]) -> str:
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
-def _grid_cluster_id(
+def grid_cluster_id(
     latitude: float,
     longitude: float,
     grid_size_deg: float
@@ -44,6 +62,10 @@ def _grid_cluster_id(
     return f"GRID_{lat_bucket}_{lon_bucket}"
 
 
+# Backward-compatible private alias
+_grid_cluster_id = grid_cluster_id
+
+
 def assign_geo_cluster(
     geo_signal: Dict[str, Any],
     cluster_config: Dict[str, Any]
@@ -75,7 +97,7 @@ def assign_geo_cluster(
     cluster_id: Optional[str] = None
 
     if latitude is not None and longitude is not None:
-        cluster_id = _grid_cluster_id(latitude, longitude, grid_size)
+        cluster_id = grid_cluster_id(latitude, longitude, grid_size)
 
     payload: Dict[str, Any] = {
         "feature_group": "GEO_CLUSTER",
@@ -99,3 +121,272 @@ def assign_geo_cluster(
     payload["cluster_hash"] = _hash_payload(payload)
 
     return payload
+
+
+
+# =========================================================
+# HIERARCHICAL MULTI-RESOLUTION GRID (BATCH)
+# =========================================================
+
+def encode_cell_key(level: int, lat_bucket: int, lon_bucket: int) -> int:
+    """
+    Pack (level, lat_bucket, lon_bucket) into one non-negative integer.
+    """
+    return (
+        (level << _LEVEL_SHIFT)
+        | ((lat_bucket + _BUCKET_OFFSET) << _LAT_SHIFT)
+        | (lon_bucket + _BUCKET_OFFSET)
+    )
+
+
+def format_cell_id(scheme_id: str, level: int, lat_bucket: int, lon_bucket: int) -> str:
+    """
+    String cell ID.
+
+    Level 0 uses the legacy "GRID_{lat}_{lon}" form (same buckets as
+    grid_cluster_id). Coarser levels are nested from the finest bucket
+    and can differ from grid_cluster_id at the same resolution for
+    points on or near a coarse boundary (common for rounded
+    coordinates), so they carry a scheme-specific prefix:
+    "{scheme_id}_L{level}_{lat}_{lon}".
+    """
+    if level == 0:
+        return f"GRID_{lat_bucket}_{lon_bucket}"
+    return f"{scheme_id}_L{level}_{lat_bucket}_{lon_bucket}"
+
+
+def decode_cell_key(cell_key: int) -> Tuple[int, int, int]:
+    """
+    Inverse of encode_cell_key → (level, lat_bucket, lon_bucket).
+    """
+    cell_key = int(cell_key)
+    level = cell_key >> _LEVEL_SHIFT
+    lat_bucket = ((cell_key >> _LAT_SHIFT) & _BUCKET_MASK) - _BUCKET_OFFSET
+    lon_bucket = (cell_key & _BUCKET_MASK) - _BUCKET_OFFSET
+    return level, lat_bucket, lon_bucket
+
+
+class HierarchicalGridScheme:
+    """
+    Static multi-resolution grid.
+
+    - Cells at every resolution are computed in one vectorized pass
+    - Cell IDs are compact int64 keys (see encode_cell_key)
+    - The finest level reproduces grid_cluster_id buckets; coarser
+      levels are derived from the finest integer bucket by floor
+      division, so cells nest exactly across levels (each resolution
+      must be an integer multiple of the previous one). Coarse cells
+      are therefore not grid_cluster_id cells (see format_cell_id)
+    - Neighbor enumeration supports fine → coarse search expansion
+
+    NOTE:
+    - Grid-based, not data-driven
+    - Deterministic & static
+    """
+
+    def __init__(
+        self,
+        resolutions_deg: Sequence[float] = DEFAULT_RESOLUTIONS_DEG,
+        scheme_id: str = "HGRID_V1",
+    ) -> None:
+        resolutions = tuple(float(r) for r in resolutions_deg)
+        if not resolutions or len(resolutions) > _MAX_LEVELS:
+            raise ValueError(f"resolutions_deg must have 1..{_MAX_LEVELS} levels")
+        if any(r <= 0 for r in resolutions):
+            raise ValueError("resolutions_deg must be positive")
+        if list(resolutions) != sorted(resolutions):
+            raise ValueError("resolutions_deg must be ordered fine → coarse")
+        if 180.0 / resolutions[0] >= _BUCKET_OFFSET:
+            raise ValueError("finest resolution exceeds cell key capacity")
+
+        # Size of each level in finest-level buckets
+        ratios: List[int] = []
+        for previous, size in zip((resolutions[0],) + resolutions, resolutions):
+            step = size / previous
+            if abs(step - round(step)) > 1e-9 * step:
+                raise ValueError(
+                    "each resolution must be an integer multiple of the previous one"
+                )
+            ratios.append((ratios[-1] if ratios else 1) * round(step))
+
+        self.resolutions_deg = resolutions
+        self.scheme_id = scheme_id
+        self._ratios: Tuple[int, ...] = tuple(ratios)
+
+    @property
+    def levels(self) -> int:
+        return len(self.resolutions_deg)
+
+    # -----------------------------------------------------
+    # Assignment
+    # -----------------------------------------------------
+
+    def assign_batch(
+        self,
+        latitudes: Any,
+        longitudes: Any,
+    ) -> np.ndarray:
+        """
+        Cell keys for N points at every level → int64 array (N, levels).
+
+        Missing coordinates (NaN) yield MISSING_CELL_KEY.
+        """
+        lat = np.asarray(latitudes, dtype=np.float64)
+        lon = np.asarray(longitudes, dtype=np.float64)
+        missing = np.isnan(lat) | np.isnan(lon)
+
+        keys = np.full((lat.shape[0], self.levels), MISSING_CELL_KEY, dtype=np.int64)
+        finest = self.resolutions_deg[0]
+        fine_lat = np.floor(np.where(missing, 0.0, lat) / finest).astype(np.int64)
+        fine_lon = np.floor(np.where(missing, 0.0, lon) / finest).astype(np.int64)
+
+        for level, ratio in enumerate(self._ratios):
+            lat_bucket = np.floor_divide(fine_lat, ratio)
+            lon_bucket = np.floor_divide(fine_lon, ratio)
+            level_keys = (
+                (np.int64(level) << _LEVEL_SHIFT)
+                | ((lat_bucket + _BUCKET_OFFSET) << _LAT_SHIFT)
+                | (lon_bucket + _BUCKET_OFFSET)
+            )
+            keys[:, level] = np.where(missing, MISSING_CELL_KEY, level_keys)
+
+        return keys
+
+    def assign(self, latitude: float, longitude: float) -> List[int]:
+        return self.assign_batch([latitude], [longitude])[0].tolist()
+
+    # -----------------------------------------------------
+    # Navigation
+    # -----------------------------------------------------
+
+    def cell_id(self, cell_key: int) -> str:
+        """
+        String form of a cell key (see format_cell_id).
+        """
+        level, lat_bucket, lon_bucket = decode_cell_key(cell_key)
+        return format_cell_id(self.scheme_id, level, lat_bucket, lon_bucket)
+
+    def neighbors(self, cell_key: int, ring: int = 1) -> List[int]:
+        """
+        Cells at Chebyshev distance exactly `ring` at the same level
+        (ring=0 returns the cell itself).
+        """
+        level, lat_bucket, lon_bucket = decode_cell_key(cell_key)
+        if ring == 0:
+            return [int(cell_key)]
+
+        cells: List[int] = []
+        for d_lat in range(-ring, ring + 1):
+            for d_lon in range(-ring, ring + 1):
+                if max(abs(d_lat), abs(d_lon)) != ring:
+                    continue
+                cells.append(encode_cell_key(level, lat_bucket + d_lat, lon_bucket + d_lon))
+        return cells
+
+    def parent(self, cell_key: int, level: Optional[int] = None) -> int:
+        """
+        Containing cell at a coarser level (default: next level),
+        by integer bucket division (consistent with assign_batch).
+        """
+        current, lat_bucket, lon_bucket = decode_cell_key(cell_key)
+        target = current + 1 if level is None else level
+        if not current <= target < self.levels:
+            raise ValueError(f"Invalid parent level {target} for level {current}")
+
+        step = self._ratios[target] // self._ratios[current]
+        return encode_cell_key(target, lat_bucket // step, lon_bucket // step)
+
+    def expansion(
+        self,
+        cell_key: int,
+        max_ring: int = 1,
+    ) -> Iterator[Tuple[int, int, List[int]]]:
+        """
+        Search expansion from fine to coarse.
+
+        Yields (level, ring, cells): the cell and its rings 1..max_ring,
+        then the same for each coarser parent. Consumers stop as soon as
+        enough data is found (e.g. comparables, market aggregates).
+        """
+        key = cell_key
+        level = decode_cell_key(key)[0]
+        while True:
+            for ring in range(0, max_ring + 1):
+                yield level, ring, self.neighbors(key, ring)
+            if level + 1 >= self.levels:
+                return
+            key = self.parent(key)
+            level += 1
+
+
+@dataclass(frozen=True)
+class GeoClusterBatch:
+    """
+    Multi-resolution cluster assignment for a batch of points.
+
+    - cell_keys: int64 (N, levels); MISSING_CELL_KEY where unlocated
+    - batch_hash: one provenance hash over scheme + inputs + keys
+    """
+    cluster_scheme_id: str
+    resolutions_deg: Tuple[float, ...]
+    cell_keys: np.ndarray
+    assigned_at_utc: str
+    batch_hash: str
+
+    def cluster_ids(self, level: int) -> List[Optional[str]]:
+        """
+        String cell IDs for one level (see format_cell_id): legacy
+        "GRID_{lat}_{lon}" at level 0, scheme-prefixed above.
+        """
+        out: List[Optional[str]] = []
+        for key in self.cell_keys[:, level].tolist():
+            if key == MISSING_CELL_KEY:
+                out.append(None)
+            else:
+                key_level, lat_bucket, lon_bucket = decode_cell_key(key)
+                out.append(
+                    format_cell_id(self.cluster_scheme_id, key_level, lat_bucket, lon_bucket)
+                )
+        return out
+
+
+def assign_geo_clusters_batch(
+    latitudes: Any,
+    longitudes: Any,
+    scheme: Optional[HierarchicalGridScheme] = None,
+) -> GeoClusterBatch:
+    """
+    Assign multi-resolution static clusters to N points at once.
+
+    Provenance is a single batch hash instead of one payload hash
+    per property.
+    """
+    scheme = scheme or HierarchicalGridScheme()
+
+    lat = np.ascontiguousarray(latitudes, dtype=np.float64)
+    lon = np.ascontiguousarray(longitudes, dtype=np.float64)
+    keys = scheme.assign_batch(lat, lon)
+
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            {
+                "feature_group": "GEO_CLUSTER_BATCH",
+                "feature_version": "v1.0.0",
+                "cluster_scheme_id": scheme.scheme_id,
+                "resolutions_deg": list(scheme.resolutions_deg),
+            },
+            sort_keys=True,
+        ).encode("utf-8")
+    )
+    digest.update(lat.tobytes())
+    digest.update(lon.tobytes())
+    digest.update(keys.tobytes())
+
+    return GeoClusterBatch(
+        cluster_scheme_id=scheme.scheme_id,
+        resolutions_deg=scheme.resolutions_deg,
+        cell_keys=keys,
+        assigned_at_utc=datetime.utcnow().isoformat(),
+        batch_hash=digest.hexdigest(),
+    )
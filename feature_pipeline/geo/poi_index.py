@@ -0,0 +1,428 @@
+"""
+POI Spatial Index
+-----------------
+Role:
+- Index points of interest (metro stations, schools, hospitals, roads, ...)
+  per category for nearest-k and radius queries
+- Pure geometry, no valuation semantics
+
+Design:
+- Points are stored as 3D unit-sphere (ECEF) vectors in one KD-tree per
+  category; chord distance is monotonic in great-circle distance, so
+  KD-tree results are exact and returned as Haversine kilometres
+- Loaded from a local POI file (.json / .csv); serialized to .npz for
+  fast startup (trees are rebuilt from stored arrays on load)
+
+Governance:
+- MASTER_SPEC.md compliant
+- Non-decisive
+- Deterministic
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import csv
+import json
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from feature_pipeline.geo.distance_features import EARTH_RADIUS_KM
+
+
+POI_INDEX_FORMAT_VERSION = "poi_index_v1"
+
+# Relative chord margin around the query radius. KD-tree balls are
+# searched with the outer chord and points in the thin inner/outer band
+# are re-checked with Haversine (<= radius_km), so count_within and
+# within() agree exactly at the radius edge.
+_EDGE_TOLERANCE = 1e-9
+
+
+class POIIndexError(Exception):
+    """Raised when the POI index cannot be built or queried."""
+
+
+@dataclass(frozen=True)
+class PointOfInterest:
+    """
+    Immutable point of interest.
+    """
+    poi_id: str
+    category: str
+    latitude: float
+    longitude: float
+    name: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class POIMatch:
+    """
+    Query result (distance is great-circle, km).
+    """
+    poi_id: str
+    category: str
+    distance_km: float
+
+
+class _CategoryIndex:
+    """
+    KD-tree over one category's unit-sphere vectors.
+    """
+
+    def __init__(
+        self,
+        poi_ids: np.ndarray,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        names: np.ndarray,
+    ) -> None:
+        self.poi_ids = poi_ids
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+        self.names = names
+        self.tree = cKDTree(_to_unit_vectors(latitudes, longitudes))
+
+    def __len__(self) -> int:
+        return self.poi_ids.shape[0]
+
+
+class POIIndex:
+    """
+    Per-category spatial index of points of interest.
+
+    Queries:
+    - nearest(lat, lon, category, k)
+    - count_within(lat, lon, category, radius_km)
+    - within(lat, lon, category, radius_km)
+    Batch variants accept coordinate arrays.
+    """
+
+    def __init__(self, points: Iterable[PointOfInterest]) -> None:
+        grouped: Dict[str, List[PointOfInterest]] = {}
+        for point in points:
+            if point.latitude is None or point.longitude is None:
+                continue
+            grouped.setdefault(point.category, []).append(point)
+
+        self._categories: Dict[str, _CategoryIndex] = {}
+        for category, members in sorted(grouped.items()):
+            self._categories[category] = _CategoryIndex(
+                poi_ids=np.array([p.poi_id for p in members], dtype=object),
+                latitudes=np.array([p.latitude for p in members], dtype=np.float64),
+                longitudes=np.array([p.longitude for p in members], dtype=np.float64),
+                names=np.array([p.name for p in members], dtype=object),
+            )
+
+    # ------------------------------------------------------------------
+    # Construction / serialization
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_file(cls, path: str) -> "POIIndex":
+        """
+        Load POIs from .json (list of objects), .csv (header row) or a
+        serialized .npz index.
+
+        Required fields: poi_id, category, latitude, longitude
+        Optional fields: name
+        """
+        file_path = Path(path)
+        suffix = file_path.suffix.lower()
+
+        if suffix == ".npz":
+            return cls.load(path)
+
+        if suffix == ".json":
+            with open(file_path, "r", encoding="utf-8") as handle:
+                rows = json.load(handle)
+        elif suffix == ".csv":
+            with open(file_path, "r", encoding="utf-8", newline="") as handle:
+                rows = list(csv.DictReader(handle))
+        else:
+            raise POIIndexError(f"Unsupported POI file format: {suffix}")
+
+        return cls(_point_from_row(row) for row in rows)
+
+    def save(self, path: str) -> None:
+        """
+        Serialize the index to a single .npz file.
+        """
+        arrays: Dict[str, np.ndarray] = {
+            "format_version": np.array(POI_INDEX_FORMAT_VERSION),
+            "categories": np.array(list(self._categories), dtype=str),
+        }
+        for i, index in enumerate(self._categories.values()):
+            arrays[f"c{i}_ids"] = index.poi_ids.astype(str)
+            arrays[f"c{i}_lat"] = index.latitudes
+            arrays[f"c{i}_lon"] = index.longitudes
+            arrays[f"c{i}_names"] = np.array(
+                ["" if n is None else n for n in index.names], dtype=str
+            )
+            arrays[f"c{i}_has_name"] = np.array([n is not None for n in index.names])
+
+        with open(path, "wb") as handle:
+            np.savez_compressed(handle, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "POIIndex":
+        with np.load(path, allow_pickle=False) as data:
+            if str(data["format_version"]) != POI_INDEX_FORMAT_VERSION:
+                raise POIIndexError("Unsupported POI index format version")
+
+            index = cls(())
+            for i, category in enumerate(data["categories"].tolist()):
+                names = np.where(
+                    data[f"c{i}_has_name"], data[f"c{i}_names"].astype(object), None
+                )
+                index._categories[category] = _CategoryIndex(
+                    poi_ids=data[f"c{i}_ids"].astype(object),
+                    latitudes=data[f"c{i}_lat"],
+                    longitudes=data[f"c{i}_lon"],
+                    names=names,
+                )
+        return index
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self._categories)
+
+    def category_size(self, category: str) -> int:
+        index = self._categories.get(category)
+        return 0 if index is None else len(index)
+
+    # ------------------------------------------------------------------
+    # Single-subject queries
+    # ------------------------------------------------------------------
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        category: str,
+        k: int = 1,
+    ) -> List[POIMatch]:
+        distances, indices = self.nearest_batch([latitude], [longitude], category, k)
+        index = self._categories.get(category)
+        return [
+            POIMatch(
+                poi_id=str(index.poi_ids[idx]),
+                category=category,
+                distance_km=float(dist),
+            )
+            for dist, idx in zip(distances[0], indices[0])
+            if idx >= 0
+        ]
+
+    def count_within(
+        self,
+        latitude: float,
+        longitude: float,
+        category: str,
+        radius_km: float,
+    ) -> int:
+        return int(self.count_within_batch([latitude], [longitude], category, radius_km)[0])
+
+    def within(
+        self,
+        latitude: float,
+        longitude: float,
+        category: str,
+        radius_km: float,
+    ) -> List[POIMatch]:
+        """
+        All POIs of a category within radius_km, nearest first.
+        """
+        index = self._categories.get(category)
+        if index is None or not _is_valid(latitude, longitude):
+            return []
+
+        query = _to_unit_vectors(np.array([latitude]), np.array([longitude]))[0]
+        candidates = index.tree.query_ball_point(
+            query, _km_to_chord(radius_km) * (1.0 + _EDGE_TOLERANCE)
+        )
+        if not candidates:
+            return []
+
+        candidates = np.asarray(candidates, dtype=np.int64)
+        distances = _haversine_to_many(
+            latitude, longitude, index.latitudes[candidates], index.longitudes[candidates]
+        )
+        order = np.argsort(distances, kind="stable")
+        return [
+            POIMatch(
+                poi_id=str(index.poi_ids[candidates[i]]),
+                category=category,
+                distance_km=float(distances[i]),
+            )
+            for i in order
+            if distances[i] <= radius_km
+        ]
+
+    # ------------------------------------------------------------------
+    # Batch queries
+    # ------------------------------------------------------------------
+
+    def nearest_batch(
+        self,
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        category: str,
+        k: int = 1,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Nearest-k for N subjects.
+
+        Returns (distances_km (N, k), indices (N, k)); NaN / -1 where
+        unavailable (missing subject location or fewer than k POIs).
+        """
+        if k < 1:
+            raise POIIndexError("k must be >= 1")
+
+        lat = np.asarray(latitudes, dtype=np.float64)
+        lon = np.asarray(longitudes, dtype=np.float64)
+        distances = np.full((lat.shape[0], k), np.nan, dtype=np.float64)
+        indices = np.full((lat.shape[0], k), -1, dtype=np.int64)
+
+        index = self._categories.get(category)
+        if index is None or len(index) == 0:
+            return distances, indices
+
+        valid = ~(np.isnan(lat) | np.isnan(lon))
+        if not valid.any():
+            return distances, indices
+
+        k_eff = min(k, len(index))
+        chord, idx = index.tree.query(_to_unit_vectors(lat[valid], lon[valid]), k=k_eff)
+        chord = np.asarray(chord, dtype=np.float64).reshape(-1, k_eff)
+        idx = np.asarray(idx, dtype=np.int64).reshape(-1, k_eff)
+
+        distances[valid, :k_eff] = _chord_to_km(chord)
+        indices[valid, :k_eff] = idx
+        return distances, indices
+
+    def count_within_batch(
+        self,
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        category: str,
+        radius_km: float,
+    ) -> np.ndarray:
+        """
+        POI counts within radius_km for N subjects (same Haversine
+        edge rule as within()).
+
+        Ball counts at the inner and outer chord bound the answer; only
+        subjects with points in that thin band are refined per point.
+        """
+        lat = np.asarray(latitudes, dtype=np.float64)
+        lon = np.asarray(longitudes, dtype=np.float64)
+        counts = np.zeros(lat.shape[0], dtype=np.int64)
+
+        index = self._categories.get(category)
+        if index is None or len(index) == 0:
+            return counts
+
+        valid = ~(np.isnan(lat) | np.isnan(lon))
+        if not valid.any():
+            return counts
+
+        lat, lon = lat[valid], lon[valid]
+        vectors = _to_unit_vectors(lat, lon)
+        chord = _km_to_chord(radius_km)
+        inner = index.tree.query_ball_point(
+            vectors, chord * (1.0 - _EDGE_TOLERANCE), return_length=True
+        )
+        outer = index.tree.query_ball_point(
+            vectors, chord * (1.0 + _EDGE_TOLERANCE), return_length=True
+        )
+
+        valid_counts = np.asarray(inner, dtype=np.int64)
+        for i in np.flatnonzero(np.asarray(outer) != valid_counts):
+            candidates = np.asarray(
+                index.tree.query_ball_point(vectors[i], chord * (1.0 + _EDGE_TOLERANCE)),
+                dtype=np.int64,
+            )
+            distances = _haversine_to_many(
+                lat[i],
+                lon[i],
+                index.latitudes[candidates],
+                index.longitudes[candidates],
+            )
+            valid_counts[i] = int(np.count_nonzero(distances <= radius_km))
+
+        counts[valid] = valid_counts
+        return counts
+
+    def poi_ids(self, category: str, indices: np.ndarray) -> np.ndarray:
+        """
+        Map index arrays from batch queries to POI IDs (None for -1).
+        """
+        index = self._categories[category]
+        out = np.full(indices.shape, None, dtype=object)
+        mask = indices >= 0
+        out[mask] = index.poi_ids[indices[mask]]
+        return out
+
+
+# =========================================================
+# GEOMETRY HELPERS
+# =========================================================
+
+def _to_unit_vectors(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    lat = np.radians(latitudes)
+    lon = np.radians(longitudes)
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def _km_to_chord(distance_km: float) -> float:
+    """Great-circle km → unit-sphere chord length."""
+    angle = min(distance_km / EARTH_RADIUS_KM, np.pi)
+    return float(2.0 * np.sin(angle / 2.0))
+
+
+def _chord_to_km(chord: np.ndarray) -> np.ndarray:
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2.0, 0.0, 1.0))
+
+
+def _haversine_to_many(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+) -> np.ndarray:
+    lat1, lon1 = np.radians(latitude), np.radians(longitude)
+    lat2, lon2 = np.radians(latitudes), np.radians(longitudes)
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    a = np.clip(a, 0.0, 1.0)
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def _is_valid(latitude: Optional[float], longitude: Optional[float]) -> bool:
+    return (
+        latitude is not None
+        and longitude is not None
+        and not (np.isnan(latitude) or np.isnan(longitude))
+    )
+
+
+def _point_from_row(row: Dict[str, Any]) -> PointOfInterest:
+    try:
+        return PointOfInterest(
+            poi_id=str(row["poi_id"]),
+            category=str(row["category"]),
+            latitude=float(row["latitude"]),
+            longitude=float(row["longitude"]),
+            name=row.get("name") or None,
+        )
+    except (KeyError, TypeError, ValueError) as exc:
+        raise POIIndexError(f"Invalid POI row: {row}") from exc
@@ -12,11 +12,14 @@ Governance:
 - Deterministic & auditable
 """
 
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 from datetime import datetime
 import hashlib
 import json
 
+if TYPE_CHECKING:
+    from feature_pipeline.geo.poi_index import POIIndex
+
 
 def _hash_payload(payload: Dict[str, Any]) -> str:
     """
@@ -27,7 +30,9 @@ def _hash_payload(payload: Dict[str, Any]) -> str:
 
 
 def compute_road_access_score(
-    road_access_info: Dict[str, Any]
+    road_access_info: Dict[str, Any],
+    poi_index: Optional["POIIndex"] = None,
+    road_category: str = "road"
 ) -> Dict[str, Any]:
     """
     Compute a descriptive road access score.
@@ -39,6 +44,11 @@ def compute_road_access_score(
             access_distance_m (optional)  # distance from property to road
             vehicle_access (optional)  # boolean or descriptive string
             source (optional)
+            latitude / longitude (optional)  # used with poi_index
+
+        poi_index (optional):
+            POIIndex with road access points under road_category.
+            Used only when access_distance_m is not declared.
 
     Output:
         RoadAccessSignal (descriptive only)
@@ -46,6 +56,18 @@ def compute_road_access_score(
 
     road_width: Optional[float] = road_access_info.get("road_width_m")
     access_distance: Optional[float] = road_access_info.get("access_distance_m")
+
+    access_distance_source: Optional[str] = None
+    if access_distance is not None:
+        access_distance_source = "declared"
+    elif poi_index is not None:
+        latitude = road_access_info.get("latitude")
+        longitude = road_access_info.get("longitude")
+        if latitude is not None and longitude is not None:
+            matches = poi_index.nearest(latitude, longitude, road_category)
+            if matches:
+                access_distance = round(matches[0].distance_km * 1000.0, 2)
+                access_distance_source = "poi_index"
     road_type: Optional[str] = road_access_info.get("road_type")
     vehicle_access = road_access_info.get("vehicle_access")
 
@@ -97,6 +119,9 @@ def compute_road_access_score(
         )
     }
 
+    if poi_index is not None:
+        payload["road_access_input"]["access_distance_source"] = access_distance_source
+
     payload["signal_hash"] = _hash_payload(payload)
 
     return payload
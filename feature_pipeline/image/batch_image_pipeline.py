@@ -0,0 +1,365 @@
+"""
+feature_pipeline/image/batch_image_pipeline.py
+
+ROLE (MASTER_SPEC COMPLIANT)
+----------------------------
+Batch Image Feature Pipeline (Image Feature Layer).
+
+Runs the image feature extractors over listing photo sets:
+- decode (shared ImageLoader, one decode per photo)
+- image quality metrics
+- condition proxy
+- facade width proxy / floor count proxy (when a bbox is supplied)
+
+Execution
+---------
+- Photos are processed in a process pool (decode + pixel statistics
+  are CPU-bound and only partially release the GIL); one worker per
+  CPU by default, max_workers=1 runs in-process
+- Per-image results are streamed in input order
+- At most `max_in_flight` photos are queued or running at any time,
+  which caps memory regardless of batch size
+- Per-listing summaries are emitted as soon as a listing's last
+  photo completes
+
+Resolution
+----------
+Pixel metrics are computed at full resolution by default, so results
+equal the scalar extractors. analysis_max_side caps the decode size
+for throughput; brightness / contrast / sharpness (and therefore
+condition_score) then differ from full-resolution values. Every
+result records its analysis resolution (analysis_width_px /
+analysis_height_px) and each summary records the cap used.
+
+ABSOLUTE PROHIBITIONS
+---------------------
+- No property condition inference
+- No valuation logic
+- No trust / risk scoring
+- No workflow influence
+
+GOVERNANCE GUARANTEES
+--------------------
+- Deterministic (output order = input order)
+- No ML / No AI inference
+- Per-image failures are recorded, never hidden
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+import os
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from feature_pipeline.image.condition_score import (
+    ConditionScoreError,
+    compute_image_condition_score,
+)
+from feature_pipeline.image.facade_width_estimator import (
+    FacadeWidthEstimationError,
+    estimate_facade_width,
+)
+from feature_pipeline.image.floor_count_estimator import (
+    FloorCountEstimationError,
+    estimate_floor_count,
+)
+from feature_pipeline.image.image_loader import (
+    ImageLoadError,
+    ImageLoader,
+)
+from feature_pipeline.image.image_quality_metrics import (
+    ImageQualityError,
+    extract_image_quality_metrics,
+)
+
+
+DEFAULT_MAX_IN_FLIGHT = 64
+
+SUMMARY_METRICS = (
+    "brightness_mean",
+    "contrast_stddev",
+    "sharpness_proxy",
+    "condition_score",
+    "facade_width_ratio",
+    "floor_count_proxy",
+)
+
+_EXTRACTION_ERRORS = (
+    ImageLoadError,
+    ImageQualityError,
+    ConditionScoreError,
+    FacadeWidthEstimationError,
+    FloorCountEstimationError,
+)
+
+
+@dataclass(frozen=True)
+class ImageTask:
+    """
+    One listing photo to process.
+
+    source: file path or raw bytes
+    facade_bbox: optional upstream bbox (x_min, x_max, y_min, y_max)
+    """
+    listing_id: str
+    image_index: int
+    source: Union[str, bytes]
+    facade_bbox: Optional[Dict[str, int]] = None
+
+
+@dataclass(frozen=True)
+class ImageFeatureResult:
+    """
+    Descriptive image features for one photo (error set on failure).
+    """
+    listing_id: str
+    image_index: int
+    content_hash: Optional[str]
+    quality_metrics: Optional[Dict[str, Any]]
+    condition: Optional[Dict[str, Any]]
+    facade_width: Optional[Dict[str, Any]]
+    floor_count: Optional[Dict[str, Any]]
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ListingImageSummary:
+    """
+    Per-listing aggregate over its photos. Descriptive only.
+
+    metrics: name -> {"mean", "min", "max", "count"} over photos
+    where the metric is available
+    analysis_max_side: decode cap the pixel metrics were computed
+    with (None = full resolution)
+    """
+    listing_id: str
+    n_images: int
+    n_failed: int
+    n_distinct_images: int
+    metrics: Dict[str, Dict[str, Optional[float]]]
+    analysis_max_side: Optional[int] = None
+
+
+# =========================================================
+# STREAMING EXECUTION
+# =========================================================
+
+def iter_image_features(
+    tasks: Iterable[ImageTask],
+    *,
+    max_workers: Optional[int] = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    analysis_max_side: Optional[int] = None,
+    assumed_floor_height_px: int = 80,
+) -> Iterator[ImageFeatureResult]:
+    """
+    Stream per-image results in input order.
+
+    max_workers None uses one worker process per CPU; 1 runs
+    in-process. analysis_max_side None keeps full resolution (see
+    module notes). Tasks are pulled lazily from `tasks`, so
+    generators of arbitrary length are fine.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be >= 1")
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    options = (analysis_max_side, assumed_floor_height_px)
+
+    if max_workers <= 1:
+        for task in tasks:
+            yield _process_image(task, *options)
+        return
+
+    in_flight: Deque[Future] = deque()
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(analysis_max_side,),
+    ) as pool:
+        for task in tasks:
+            if len(in_flight) >= max_in_flight:
+                yield in_flight.popleft().result()
+            in_flight.append(pool.submit(_process_image, task, *options))
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def iter_listing_image_summaries(
+    listings: Mapping[str, Sequence[Union[str, bytes, Mapping[str, Any]]]],
+    *,
+    on_image: Optional[Callable[[ImageFeatureResult], None]] = None,
+    **options: Any,
+) -> Iterator[ListingImageSummary]:
+    """
+    Process every listing's photos and yield one summary per listing
+    as soon as its last photo completes.
+
+    Photo entries are a path / bytes, or a mapping with "source" and
+    optional "facade_bbox". `on_image` receives each per-image result
+    as it streams. Remaining keyword options go to iter_image_features.
+    """
+    expected: Dict[str, int] = {
+        listing_id: len(photos) for listing_id, photos in listings.items()
+    }
+    pending: Dict[str, List[ImageFeatureResult]] = {}
+
+    analysis_max_side = options.get("analysis_max_side")
+
+    for listing_id, count in expected.items():
+        if count == 0:
+            yield summarize_listing_images(listing_id, [], analysis_max_side=analysis_max_side)
+
+    for result in iter_image_features(_listing_tasks(listings), **options):
+        if on_image is not None:
+            on_image(result)
+        collected = pending.setdefault(result.listing_id, [])
+        collected.append(result)
+        if len(collected) == expected[result.listing_id]:
+            yield summarize_listing_images(
+                result.listing_id,
+                pending.pop(result.listing_id),
+                analysis_max_side=analysis_max_side,
+            )
+
+
+def summarize_listing_images(
+    listing_id: str,
+    results: Sequence[ImageFeatureResult],
+    analysis_max_side: Optional[int] = None,
+) -> ListingImageSummary:
+    """
+    Aggregate per-image results for one listing.
+
+    analysis_max_side is recorded on the summary (the decode cap the
+    results were produced with).
+    """
+    values: Dict[str, List[float]] = {name: [] for name in SUMMARY_METRICS}
+    hashes = set()
+
+    for result in results:
+        if result.error is not None:
+            continue
+        if result.content_hash is not None:
+            hashes.add(result.content_hash)
+        for name, value in _result_metrics(result).items():
+            if value is not None:
+                values[name].append(float(value))
+
+    return ListingImageSummary(
+        listing_id=listing_id,
+        n_images=len(results),
+        n_failed=sum(1 for r in results if r.error is not None),
+        n_distinct_images=len(hashes),
+        metrics={
+            name: {
+                "mean": sum(vals) / len(vals) if vals else None,
+                "min": min(vals) if vals else None,
+                "max": max(vals) if vals else None,
+                "count": len(vals),
+            }
+            for name, vals in values.items()
+        },
+        analysis_max_side=analysis_max_side,
+    )
+
+
+# =========================================================
+# WORKER
+# =========================================================
+
+_WORKER_LOADER: Optional[ImageLoader] = None
+
+
+def _init_worker(analysis_max_side: Optional[int]) -> None:
+    global _WORKER_LOADER
+    _WORKER_LOADER = ImageLoader(analysis_max_side=analysis_max_side)
+
+
+def _loader_for(analysis_max_side: Optional[int]) -> ImageLoader:
+    global _WORKER_LOADER
+    if _WORKER_LOADER is None or _WORKER_LOADER.analysis_max_side != analysis_max_side:
+        _WORKER_LOADER = ImageLoader(analysis_max_side=analysis_max_side)
+    return _WORKER_LOADER
+
+
+def _process_image(
+    task: ImageTask,
+    analysis_max_side: Optional[int],
+    assumed_floor_height_px: int,
+) -> ImageFeatureResult:
+    try:
+        loaded = _loader_for(analysis_max_side).load(task.source)
+        quality = extract_image_quality_metrics(loaded)
+        return ImageFeatureResult(
+            listing_id=task.listing_id,
+            image_index=task.image_index,
+            content_hash=loaded.content_hash,
+            quality_metrics=quality,
+            condition=compute_image_condition_score(quality),
+            facade_width=estimate_facade_width(loaded, _bbox(task.facade_bbox, "x")),
+            floor_count=estimate_floor_count(
+                loaded,
+                _bbox(task.facade_bbox, "y"),
+                assumed_floor_height_px=assumed_floor_height_px,
+            ),
+        )
+    except _EXTRACTION_ERRORS as exc:
+        return ImageFeatureResult(
+            listing_id=task.listing_id,
+            image_index=task.image_index,
+            content_hash=None,
+            quality_metrics=None,
+            condition=None,
+            facade_width=None,
+            floor_count=None,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+
+
+# =========================================================
+# HELPERS
+# =========================================================
+
+def _listing_tasks(
+    listings: Mapping[str, Sequence[Union[str, bytes, Mapping[str, Any]]]],
+) -> Iterator[ImageTask]:
+    for listing_id, photos in listings.items():
+        for index, photo in enumerate(photos):
+            if isinstance(photo, Mapping):
+                yield ImageTask(
+                    listing_id=listing_id,
+                    image_index=index,
+                    source=photo["source"],
+                    facade_bbox=photo.get("facade_bbox"),
+                )
+            else:
+                yield ImageTask(listing_id=listing_id, image_index=index, source=photo)
+
+
+def _bbox(facade_bbox: Optional[Dict[str, int]], axis: str) -> Optional[Dict[str, int]]:
+    """
+    Axis-specific bbox for the estimators (None when that axis is absent).
+    """
+    if not facade_bbox:
+        return None
+    keys = (f"{axis}_min", f"{axis}_max")
+    if not all(key in facade_bbox for key in keys):
+        return None
+    return {key: facade_bbox[key] for key in keys}
+
+
+def _result_metrics(result: ImageFeatureResult) -> Dict[str, Any]:
+    quality = result.quality_metrics or {}
+    return {
+        "brightness_mean": quality.get("brightness_mean"),
+        "contrast_stddev": quality.get("contrast_stddev"),
+        "sharpness_proxy": quality.get("sharpness_proxy"),
+        "condition_score": (result.condition or {}).get("condition_score"),
+        "facade_width_ratio": (result.facade_width or {}).get("facade_width_ratio"),
+        "floor_count_proxy": (result.floor_count or {}).get("floor_count_proxy"),
+    }
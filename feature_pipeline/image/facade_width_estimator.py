@@ -24,7 +24,7 @@ Output is a TECHNICAL IMAGE-BASED PROXY ONLY.
 
 from __future__ import annotations
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 
 try:
     from PIL import Image
@@ -33,6 +33,8 @@ except ImportError as exc:
         "Pillow is required for facade_width_estimator"
     ) from exc
 
+from feature_pipeline.image.image_loader import LoadedImage, image_size
+
 
 class FacadeWidthEstimationError(Exception):
     """Raised when facade width estimation fails."""
@@ -53,18 +55,18 @@ class FacadeWidthEstimator:
     def __init__(self) -> None:
         pass
 
-    def _validate_image(self, image: Image.Image) -> None:
+    def _validate_image(self, image: Union[Image.Image, LoadedImage]) -> None:
         if image is None:
             raise FacadeWidthEstimationError("Image must not be None")
 
-        if not isinstance(image, Image.Image):
+        if not isinstance(image, (Image.Image, LoadedImage)):
             raise FacadeWidthEstimationError(
                 f"Expected PIL.Image.Image, got {type(image).__name__}"
             )
 
     def estimate(
         self,
-        image: Image.Image,
+        image: Union[Image.Image, LoadedImage],
         facade_bbox: Optional[Dict[str, int]] = None,
     ) -> Dict[str, Any]:
         """
@@ -72,8 +74,9 @@ class FacadeWidthEstimator:
 
         Parameters
         ----------
-        image : PIL.Image.Image
-            Input image.
+        image : PIL.Image.Image | LoadedImage
+            Input image. Only original dimensions are used, so a
+            LoadedImage needs no full-resolution decode.
         facade_bbox : Optional[Dict[str, int]]
             Optional pre-validated bounding box:
             {
@@ -100,7 +103,7 @@ class FacadeWidthEstimator:
         """
         self._validate_image(image)
 
-        image_width, _ = image.size
+        image_width, _ = image_size(image)
 
         if image_width <= 0:
             raise FacadeWidthEstimationError(
@@ -152,7 +155,7 @@ class FacadeWidthEstimator:
 
 
 def estimate_facade_width(
-    image: Image.Image,
+    image: Union[Image.Image, LoadedImage],
     facade_bbox: Optional[Dict[str, int]] = None,
 ) -> Dict[str, Any]:
     """
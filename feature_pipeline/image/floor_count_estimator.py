@@ -24,7 +24,7 @@ Output is a TECHNICAL IMAGE-BASED PROXY ONLY.
 
 from __future__ import annotations
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 
 try:
     from PIL import Image
@@ -33,6 +33,8 @@ except ImportError as exc:
         "Pillow is required for floor_count_estimator"
     ) from exc
 
+from feature_pipeline.image.image_loader import LoadedImage, image_size
+
 
 class FloorCountEstimationError(Exception):
     """Raised when floor count estimation fails."""
@@ -68,18 +70,18 @@ class FloorCountEstimator:
 
         self.assumed_floor_height_px = assumed_floor_height_px
 
-    def _validate_image(self, image: Image.Image) -> None:
+    def _validate_image(self, image: Union[Image.Image, LoadedImage]) -> None:
         if image is None:
             raise FloorCountEstimationError("Image must not be None")
 
-        if not isinstance(image, Image.Image):
+        if not isinstance(image, (Image.Image, LoadedImage)):
             raise FloorCountEstimationError(
                 f"Expected PIL.Image.Image, got {type(image).__name__}"
             )
 
     def estimate(
         self,
-        image: Image.Image,
+        image: Union[Image.Image, LoadedImage],
         facade_bbox: Optional[Dict[str, int]] = None,
     ) -> Dict[str, Any]:
         """
@@ -87,8 +89,9 @@ class FloorCountEstimator:
 
         Parameters
         ----------
-        image : PIL.Image.Image
-            Input image.
+        image : PIL.Image.Image | LoadedImage
+            Input image. Only original dimensions are used, so a
+            LoadedImage needs no full-resolution decode.
         facade_bbox : Optional[Dict[str, int]]
             Optional pre-validated bounding box:
             {
@@ -115,7 +118,7 @@ class FloorCountEstimator:
         """
         self._validate_image(image)
 
-        _, image_height = image.size
+        _, image_height = image_size(image)
 
         if image_height <= 0:
             raise FloorCountEstimationError(
@@ -168,7 +171,7 @@ class FloorCountEstimator:
 
 
 def estimate_floor_count(
-    image: Image.Image,
+    image: Union[Image.Image, LoadedImage],
     facade_bbox: Optional[Dict[str, int]] = None,
     assumed_floor_height_px: int = 80,
 ) -> Dict[str, Any]:
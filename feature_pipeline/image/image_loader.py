@@ -0,0 +1,233 @@
+"""
+feature_pipeline/image/image_loader.py
+
+ROLE (MASTER_SPEC COMPLIANT)
+----------------------------
+Shared Image Loading Layer (Image Feature Layer).
+
+Decodes each listing photo ONCE into a grayscale analysis array that
+all image feature extractors share:
+- ImageQualityMetricsExtractor  (pixel statistics)
+- FacadeWidthEstimator          (original geometry only)
+- FloorCountEstimator           (original geometry only)
+
+Decode-time reduction
+---------------------
+- Original dimensions are read from the file header
+- JPEG sources use draft mode (Image.draft) to decode directly to
+  grayscale at a 1/2, 1/4 or 1/8 DCT scale
+- The result is box-resized down to the configured analysis resolution
+- Decoded arrays are cached by content hash (bounded LRU)
+
+ABSOLUTE PROHIBITIONS
+---------------------
+- No image interpretation
+- No property inference
+- No valuation logic
+- No workflow influence
+
+GOVERNANCE GUARANTEES
+--------------------
+- Deterministic (same bytes + same resolution -> same array)
+- No ML / No AI inference
+- Audit-friendly (content hash recorded)
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+import hashlib
+import io
+import threading
+
+import numpy as np
+
+try:
+    from PIL import Image
+except ImportError as exc:
+    raise ImportError(
+        "Pillow is required for image_loader"
+    ) from exc
+
+
+# Longest side (pixels) of the grayscale analysis array; None = full size
+DEFAULT_ANALYSIS_MAX_SIDE = 1024
+
+DEFAULT_CACHE_ENTRIES = 64
+
+ImageSource = Union[str, bytes, Image.Image]
+
+
+class ImageLoadError(Exception):
+    """Raised when an image cannot be decoded."""
+
+
+@dataclass(frozen=True)
+class LoadedImage:
+    """
+    Decoded photo shared across image extractors.
+
+    - width / height: ORIGINAL pixel dimensions (bbox coordinates
+      and geometric proxies refer to these)
+    - gray: uint8 (H, W) grayscale array at analysis resolution
+    """
+    content_hash: Optional[str]
+    width: int
+    height: int
+    format: Optional[str]
+    gray: np.ndarray
+
+    @property
+    def analysis_size(self) -> Tuple[int, int]:
+        return int(self.gray.shape[1]), int(self.gray.shape[0])
+
+    @property
+    def is_downsampled(self) -> bool:
+        return self.analysis_size != (self.width, self.height)
+
+
+class ImageLoader:
+    """
+    Decode-once image loader with content-hash LRU cache.
+    """
+
+    def __init__(
+        self,
+        analysis_max_side: Optional[int] = DEFAULT_ANALYSIS_MAX_SIDE,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+    ) -> None:
+        if analysis_max_side is not None and analysis_max_side < 1:
+            raise ValueError("analysis_max_side must be positive or None")
+        if max_entries < 0:
+            raise ValueError("max_entries must be >= 0")
+
+        self.analysis_max_side = analysis_max_side
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Optional[int]], LoadedImage]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def load(self, source: ImageSource) -> LoadedImage:
+        """
+        Load a photo from a file path, raw bytes or a PIL image.
+
+        PIL images are already decoded; they are converted but not cached.
+        """
+        if isinstance(source, Image.Image):
+            return LoadedImage(
+                content_hash=None,
+                width=source.size[0],
+                height=source.size[1],
+                format=source.format,
+                gray=self._analysis_array(source),
+            )
+
+        data = read_image_bytes(source)
+        key = (hashlib.sha256(data).hexdigest(), self.analysis_max_side)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        loaded = self._decode(data, key[0])
+
+        if self.max_entries:
+            with self._lock:
+                self._entries[key] = loaded
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return loaded
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "analysis_max_side": self.analysis_max_side,
+            }
+
+    # ------------------------------------------------------------------
+    # Decoding
+    # ------------------------------------------------------------------
+
+    def _decode(self, data: bytes, content_hash: str) -> LoadedImage:
+        try:
+            image = Image.open(io.BytesIO(data))
+            width, height = image.size
+            image_format = image.format
+
+            target = self._target_size(width, height)
+            if target is not None and image_format == "JPEG":
+                # DCT-domain reduction: decodes at >= target size, already grayscale
+                image.draft("L", target)
+
+            gray = self._analysis_array(image)
+        except (OSError, ValueError, Image.DecompressionBombError) as exc:
+            raise ImageLoadError(f"Unable to decode image ({type(exc).__name__})") from exc
+
+        return LoadedImage(
+            content_hash=content_hash,
+            width=width,
+            height=height,
+            format=image_format,
+            gray=gray,
+        )
+
+    def _analysis_array(self, image: Image.Image) -> np.ndarray:
+        gray = image.convert("L")
+        target = self._target_size(*gray.size)
+        if target is not None:
+            gray = gray.resize(target, Image.Resampling.BOX)
+        return np.asarray(gray)
+
+    def _target_size(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        longest = max(width, height)
+        if self.analysis_max_side is None or longest <= self.analysis_max_side:
+            return None
+        scale = self.analysis_max_side / longest
+        return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def read_image_bytes(source: Union[str, bytes]) -> bytes:
+    """
+    Raw bytes of an image file path or bytes-like source.
+
+    Shared with the EXIF metadata layer so both raise ImageLoadError
+    for unreadable paths and unsupported source types.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if isinstance(source, str):
+        try:
+            with open(source, "rb") as handle:
+                return handle.read()
+        except OSError as exc:
+            raise ImageLoadError(f"Unable to read image file: {source}") from exc
+    raise ImageLoadError(f"Unsupported image source type: {type(source).__name__}")
+
+
+def image_size(image: Union[Image.Image, LoadedImage]) -> Tuple[int, int]:
+    """
+    Original (width, height) of a PIL image or a LoadedImage.
+    """
+    if isinstance(image, LoadedImage):
+        return image.width, image.height
+    return image.size
+
+
+# Process-wide shared loader
+image_loader = ImageLoader()
@@ -31,10 +31,12 @@ GOVERNANCE GUARANTEES
 
 from __future__ import annotations
 
-from typing import Dict, Any
+from typing import Dict, Any, Union
 
 import math
 
+import numpy as np
+
 try:
     from PIL import Image, ImageStat
 except ImportError as exc:
@@ -42,6 +44,8 @@ except ImportError as exc:
         "Pillow is required for image_quality_metrics"
     ) from exc
 
+from feature_pipeline.image.image_loader import LoadedImage
+
 
 class ImageQualityError(Exception):
     """Raised when image quality metric extraction fails."""
@@ -68,30 +72,33 @@ class ImageQualityMetricsExtractor:
     def __init__(self) -> None:
         pass
 
-    def _validate_image(self, image: Image.Image) -> None:
+    def _validate_image(self, image: Union[Image.Image, LoadedImage]) -> None:
         if image is None:
             raise ImageQualityError("Image must not be None")
 
-        if not isinstance(image, Image.Image):
+        if not isinstance(image, (Image.Image, LoadedImage)):
             raise ImageQualityError(
                 f"Expected PIL.Image.Image, got {type(image).__name__}"
             )
 
+    @staticmethod
+    def _grayscale_array(image: Image.Image) -> np.ndarray:
+        """
+        Single grayscale conversion, exposed as a uint8 (H, W) array.
+        """
+        return np.asarray(image.convert("L"))
+
     def _compute_brightness(self, image: Image.Image) -> float:
         """
         Compute mean brightness using grayscale conversion.
         """
-        gray = image.convert("L")
-        stat = ImageStat.Stat(gray)
-        return float(stat.mean[0])
+        return float(_histogram_stat(self._grayscale_array(image)).mean[0])
 
     def _compute_contrast(self, image: Image.Image) -> float:
         """
         Compute contrast as standard deviation of grayscale pixel values.
         """
-        gray = image.convert("L")
-        stat = ImageStat.Stat(gray)
-        return float(stat.stddev[0])
+        return float(_histogram_stat(self._grayscale_array(image)).stddev[0])
 
     def _compute_sharpness_proxy(self, image: Image.Image) -> float:
         """
@@ -102,32 +109,19 @@ class ImageQualityMetricsExtractor:
         This is NOT a perceptual quality score.
         It is a mathematical edge-variation proxy only.
         """
-        gray = image.convert("L")
-        pixels = list(gray.getdata())
-
-        if len(pixels) < 2:
-            return 0.0
-
-        diffs = [
-            abs(pixels[i] - pixels[i - 1])
-            for i in range(1, len(pixels))
-        ]
+        return _sharpness_proxy(self._grayscale_array(image))
 
-        mean_diff = sum(diffs) / len(diffs)
-        variance = sum(
-            (d - mean_diff) ** 2 for d in diffs
-        ) / len(diffs)
-
-        return math.sqrt(variance)
-
-    def extract(self, image: Image.Image) -> Dict[str, Any]:
+    def extract(self, image: Union[Image.Image, LoadedImage]) -> Dict[str, Any]:
         """
         Extract image quality metrics.
 
         Parameters
         ----------
-        image : PIL.Image.Image
-            Loaded image object.
+        image : PIL.Image.Image | LoadedImage
+            Loaded image object. A LoadedImage (shared image loader)
+            reuses its cached grayscale array; pixel metrics are then
+            computed at its analysis resolution, reported as
+            analysis_width_px / analysis_height_px.
 
         Returns
         -------
@@ -136,23 +130,78 @@ class ImageQualityMetricsExtractor:
         """
         self._validate_image(image)
 
-        width, height = image.size
+        if isinstance(image, LoadedImage):
+            width, height = image.width, image.height
+            gray = image.gray
+        else:
+            width, height = image.size
+            gray = self._grayscale_array(image)
+
         aspect_ratio = width / height if height > 0 else None
 
         metrics = {
             "width": width,
             "height": height,
             "aspect_ratio": aspect_ratio,
-            "brightness_mean": self._compute_brightness(image),
-            "contrast_stddev": self._compute_contrast(image),
-            "sharpness_proxy": self._compute_sharpness_proxy(image),
         }
+        metrics.update(compute_gray_quality_metrics(gray))
+
+        if isinstance(image, LoadedImage):
+            metrics["analysis_width_px"], metrics["analysis_height_px"] = image.analysis_size
 
         return metrics
 
 
+def compute_gray_quality_metrics(gray: np.ndarray) -> Dict[str, float]:
+    """
+    Brightness, contrast and sharpness proxy from one grayscale array.
+
+    - brightness / contrast: ImageStat on the pixel histogram
+      (same values as ImageStat.Stat on the grayscale image)
+    - sharpness: std of absolute differences between consecutive
+      pixels in row-major order, from a 256-bin histogram of the
+      differences with exact integer moments
+    """
+    if gray.ndim != 2 or gray.dtype != np.uint8:
+        raise ImageQualityError("Expected a 2D uint8 grayscale array")
+
+    stat = _histogram_stat(gray)
+
+    return {
+        "brightness_mean": float(stat.mean[0]),
+        "contrast_stddev": float(stat.stddev[0]),
+        "sharpness_proxy": _sharpness_proxy(gray),
+    }
+
+
+def _histogram_stat(gray: np.ndarray) -> ImageStat.Stat:
+    """
+    ImageStat over the 256-bin pixel histogram (brightness / contrast
+    without the sharpness pass).
+    """
+    return ImageStat.Stat(np.bincount(gray.ravel(), minlength=256).tolist())
+
+
+def _sharpness_proxy(gray: np.ndarray) -> float:
+    pixels = gray.ravel()
+    if pixels.size < 2:
+        return 0.0
+
+    diffs = np.abs(np.diff(pixels.astype(np.int16)))
+    counts = np.bincount(diffs, minlength=256).astype(np.int64)
+    values = np.arange(256, dtype=np.int64)
+
+    n = int(pixels.size - 1)
+    total = int(counts @ values)
+    total_sq = int(counts @ (values * values))
+
+    # Population variance with exact integer moments: (n*S2 - S^2) / n^2
+    variance = (n * total_sq - total * total) / (n * n)
+    return math.sqrt(variance)
+
+
 def extract_image_quality_metrics(
-    image: Image.Image,
+    image: Union[Image.Image, LoadedImage],
 ) -> Dict[str, Any]:
     """
     Functional wrapper for image quality metric extraction.
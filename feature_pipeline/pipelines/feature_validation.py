@@ -22,7 +22,18 @@ This is a GOVERNANCE & QUALITY GATE ONLY.
 from __future__ import annotations
 
 import math
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from feature_pipeline.pipelines.feature_error_handler import (
+    FeatureErrorHandler,
+    FeatureValidationError as PipelineFeatureValidationError,
+)
+
+
+METADATA_FIELDS: Tuple[str, ...] = ("method", "disclaimer")
 
 
 class FeatureValidationError(Exception):
@@ -64,6 +75,7 @@ class FeatureValidator:
         """
         self.required_fields = required_fields or []
         self.numeric_ranges = numeric_ranges or {}
+        self._compiled: Optional[CompiledFeatureSchema] = None
 
     def _validate_required_fields(
         self,
@@ -126,7 +138,7 @@ class FeatureValidator:
         - method
         - disclaimer
         """
-        for meta_key in ("method", "disclaimer"):
+        for meta_key in METADATA_FIELDS:
             if meta_key not in feature:
                 raise FeatureValidationError(
                     f"Missing metadata field: {meta_key}"
@@ -170,6 +182,279 @@ class FeatureValidator:
 
         return feature
 
+    def compile(self) -> "CompiledFeatureSchema":
+        """
+        Compile required_fields / numeric_ranges into column checks.
+
+        The compiled schema is cached; validator configuration is
+        treated as immutable after the first batch call.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledFeatureSchema.from_rules(
+                required_fields=self.required_fields,
+                numeric_ranges=self.numeric_ranges,
+            )
+        return self._compiled
+
+    def validate_batch(
+        self,
+        batch: Mapping[str, Any],
+        *,
+        stage: str = "validation",
+    ) -> "FeatureBatchValidationResult":
+        """
+        Validate a columnar batch (column name -> 1-D array / Series,
+        or a pandas DataFrame).
+
+        Unlike validate(), this does NOT raise on the first failure;
+        every violation is reported as a per-row error record.
+        """
+        return self.compile().validate_batch(batch, stage=stage)
+
+
+# =========================================================
+# COMPILED (COLUMNAR) VALIDATION
+# =========================================================
+
+@dataclass(frozen=True)
+class _RangeCheck:
+    name: str
+    min_v: Optional[float]
+    max_v: Optional[float]
+
+
+@dataclass(frozen=True)
+class FeatureBatchValidationResult:
+    """
+    Result of columnar batch validation.
+
+    - valid_mask: True for rows without any violation
+    - errors: FeatureErrorHandler-compatible records, each with row_index
+    """
+    n_rows: int
+    valid_mask: np.ndarray
+    errors: List[Dict[str, Any]]
+
+    @property
+    def n_invalid(self) -> int:
+        return int(self.n_rows - np.count_nonzero(self.valid_mask))
+
+
+class CompiledFeatureSchema:
+    """
+    Schema compiled once into vectorized column checks.
+
+    Row i is validated as the dict {column: value[i]} would be by
+    FeatureValidator.validate (a row is valid iff validate() accepts
+    it, and its first error record carries validate()'s message):
+    - required / metadata field missing: column absent from the batch
+    - non-numeric value in a ranged field (None included)
+    - NaN / Inf in a ranged field
+    - value below min / above max
+    - metadata value not a string (None included)
+
+    A columnar batch has no per-row key absence: every cell of a present
+    column is a present value. Missing cells that the container stores
+    as NaN (e.g. pandas) are therefore NaN values, exactly as in a dict
+    holding NaN. Values of numeric-dtype columns count as Python numbers.
+    """
+
+    def __init__(
+        self,
+        required_fields: Tuple[str, ...],
+        range_checks: Tuple[_RangeCheck, ...],
+    ) -> None:
+        self.required_fields = required_fields
+        self.range_checks = range_checks
+        self._error_handler = FeatureErrorHandler()
+
+    @classmethod
+    def from_rules(
+        cls,
+        *,
+        required_fields: List[str],
+        numeric_ranges: Dict[str, Dict[str, float]],
+    ) -> "CompiledFeatureSchema":
+        return cls(
+            required_fields=tuple(required_fields),
+            range_checks=tuple(
+                _RangeCheck(
+                    name=name,
+                    min_v=constraints.get("min"),
+                    max_v=constraints.get("max"),
+                )
+                for name, constraints in numeric_ranges.items()
+            ),
+        )
+
+    def validate_batch(
+        self,
+        batch: Mapping[str, Any],
+        *,
+        stage: str = "validation",
+    ) -> FeatureBatchValidationResult:
+        columns = self._columns(batch)
+        n_rows = self._row_count(columns)
+
+        # (row_indices, messages, feature_name), in rule order
+        failures: List[Tuple[np.ndarray, List[str], str]] = []
+
+        for field in self.required_fields:
+            if field not in columns and n_rows:
+                rows = np.arange(n_rows)
+                failures.append((rows, [f"Missing required field: {field}"] * rows.size, field))
+
+        for check in self.range_checks:
+            column = columns.get(check.name)
+            if column is None:
+                continue
+            failures.extend(self._check_range(check, column))
+
+        for meta_key in METADATA_FIELDS:
+            column = columns.get(meta_key)
+            if column is None:
+                rows = np.arange(n_rows)
+                if rows.size:
+                    failures.append((rows, [f"Missing metadata field: {meta_key}"] * rows.size, meta_key))
+                continue
+
+            if column.dtype.kind != "U":
+                rows = np.flatnonzero(~_isinstance_mask(column, str))
+                if rows.size:
+                    failures.append(
+                        (rows, [f"Metadata field '{meta_key}' must be string"] * rows.size, meta_key)
+                    )
+
+        valid_mask = np.ones(n_rows, dtype=bool)
+        for rows, _, _ in failures:
+            valid_mask[rows] = False
+
+        errors = self._to_error_records(failures, stage=stage)
+
+        return FeatureBatchValidationResult(
+            n_rows=n_rows,
+            valid_mask=valid_mask,
+            errors=errors,
+        )
+
+    # -----------------------------------------------------
+
+    @staticmethod
+    def _columns(batch: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+        names = batch.columns if hasattr(batch, "columns") else batch.keys()
+        columns: Dict[str, np.ndarray] = {}
+        for name in names:
+            column = np.asarray(batch[name])
+            if column.ndim != 1:
+                raise FeatureValidationError(
+                    f"Batch column '{name}' must be 1-dimensional"
+                )
+            columns[name] = column
+        return columns
+
+    @staticmethod
+    def _row_count(columns: Dict[str, np.ndarray]) -> int:
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise FeatureValidationError(
+                f"Batch columns have inconsistent lengths: {sorted(lengths)}"
+            )
+        return lengths.pop() if lengths else 0
+
+    @staticmethod
+    def _check_range(
+        check: _RangeCheck,
+        column: np.ndarray,
+    ) -> List[Tuple[np.ndarray, List[str], str]]:
+        name = check.name
+        failures: List[Tuple[np.ndarray, List[str], str]] = []
+
+        if column.dtype.kind in "biuf":
+            checked = np.ones(len(column), dtype=bool)
+            values = column.astype(np.float64, copy=False)
+        else:
+            if column.dtype.kind != "O":
+                column = column.astype(object)
+            numeric = _isinstance_mask(column, (int, float))
+            bad_type = np.flatnonzero(~numeric)
+            if bad_type.size:
+                failures.append(
+                    (
+                        bad_type,
+                        [
+                            f"Feature '{name}' must be numeric, "
+                            f"got {type(column[i]).__name__}"
+                            for i in bad_type
+                        ],
+                        name,
+                    )
+                )
+            checked = numeric
+            values = np.full(len(column), np.nan, dtype=np.float64)
+            values[checked] = column[checked].astype(np.float64)
+
+        non_finite = checked & ~np.isfinite(values)
+        rows = np.flatnonzero(non_finite)
+        if rows.size:
+            failures.append((rows, [f"Feature '{name}' contains NaN or Inf"] * rows.size, name))
+
+        finite = checked & ~non_finite
+        if check.min_v is not None:
+            rows = np.flatnonzero(finite & (values < check.min_v))
+            if rows.size:
+                failures.append(
+                    (
+                        rows,
+                        [
+                            f"Feature '{name}' below minimum: {column[i]} < {check.min_v}"
+                            for i in rows
+                        ],
+                        name,
+                    )
+                )
+        if check.max_v is not None:
+            rows = np.flatnonzero(finite & (values > check.max_v))
+            if rows.size:
+                failures.append(
+                    (
+                        rows,
+                        [
+                            f"Feature '{name}' above maximum: {column[i]} > {check.max_v}"
+                            for i in rows
+                        ],
+                        name,
+                    )
+                )
+
+        return failures
+
+    def _to_error_records(
+        self,
+        failures: List[Tuple[np.ndarray, List[str], str]],
+        *,
+        stage: str,
+    ) -> List[Dict[str, Any]]:
+        records: List[Tuple[int, int, Dict[str, Any]]] = []
+        for rule_order, (rows, messages, feature_name) in enumerate(failures):
+            for row, message in zip(rows.tolist(), messages):
+                error = PipelineFeatureValidationError(
+                    message,
+                    stage=stage,
+                    feature_name=feature_name,
+                )
+                record = self._error_handler.to_error_record(error)
+                record["row_index"] = row
+                records.append((row, rule_order, record))
+
+        records.sort(key=lambda item: (item[0], item[1]))
+        return [record for _, _, record in records]
+
+
+def _isinstance_mask(column: np.ndarray, types: Any) -> np.ndarray:
+    return np.fromiter(
+        (isinstance(v, types) for v in column), dtype=bool, count=len(column)
+    )
+
 
 def validate_features(
     features: Dict[str, Dict[str, Any]],
@@ -207,3 +492,21 @@ def validate_features(
             ) from exc
 
     return validated
+
+
+def validate_feature_batch(
+    batch: Mapping[str, Any],
+    required_fields: Optional[List[str]] = None,
+    numeric_ranges: Optional[Dict[str, Dict[str, float]]] = None,
+) -> FeatureBatchValidationResult:
+    """
+    Columnar batch validation (one row per property).
+
+    Reports every violation as a per-row error record instead of
+    raising on the first failure.
+    """
+    validator = FeatureValidator(
+        required_fields=required_fields,
+        numeric_ranges=numeric_ranges,
+    )
+    return validator.validate_batch(batch)
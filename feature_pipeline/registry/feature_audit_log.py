@@ -14,13 +14,27 @@
 # - No decision authority
 # ============================================================
 
-from dataclasses import dataclass
-from typing import List
+from bisect import bisect_left, insort
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
 import hashlib
 import json
+import logging
+import os
 from datetime import datetime, timezone
 
 
+logger = logging.getLogger(__name__)
+
+
+GENESIS_CHAIN_HASH = "0" * 64
+SEGMENT_PREFIX = "segment_"
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx.jsonl"
+CHECKPOINT_FILE = "checkpoints.jsonl"
+
+
 class FeatureAuditViolation(Exception):
     """Raised when audit log governance is violated."""
     pass
@@ -45,6 +59,18 @@ class FeatureAuditEvent:
     event_comment: str | None = None
 
 
+@dataclass(frozen=True)
+class AuditChainCheckpoint:
+    """
+    Hash-chain checkpoint.
+
+    chain_hash is the chain value AFTER event `seq` was appended.
+    Checkpoints may be exported and anchored externally.
+    """
+    seq: int
+    chain_hash: str
+
+
 class FeatureAuditLog:
     """
     Append-only audit log for feature registry actions.
@@ -57,10 +83,65 @@ class FeatureAuditLog:
     ✅ Does:
     - Persist immutable audit events
     - Generate deterministic audit hashes
+    - Maintain an incremental hash chain
+      chain[n] = SHA-256(chain[n-1] + event_hash[n])
+
+    Storage:
+    - storage_dir=None  → process-local (in-memory)
+    - storage_dir=path  → durable append-only segment files
+        segment_000001.jsonl      one JSON record per line
+        segment_000001.idx.jsonl  sidecar index (seq, offset, feature, time)
+        checkpoints.jsonl         periodic chain checkpoints
+
+    Queries use in-memory indexes by feature ID, feature version and
+    event time; only matching records are read from disk.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        storage_dir: Optional[str] = None,
+        *,
+        max_segment_events: int = 100_000,
+        checkpoint_interval: int = 1_000,
+        fsync: bool = True,
+    ) -> None:
+        if max_segment_events < 1:
+            raise FeatureAuditViolation("max_segment_events must be >= 1")
+        if checkpoint_interval < 1:
+            raise FeatureAuditViolation("checkpoint_interval must be >= 1")
+
+        self._storage_dir = Path(storage_dir) if storage_dir is not None else None
+        self._max_segment_events = max_segment_events
+        self._checkpoint_interval = checkpoint_interval
+        self._fsync = fsync
+
+        # In-memory backend
         self._events: List[FeatureAuditEvent] = []
+        self._event_hashes: List[str] = []
+        self._chain_hashes: List[str] = []
+
+        # Durable backend: seq → (segment_no, byte offset)
+        self._locations: List[Tuple[int, int]] = []
+        self._readers: Dict[int, BinaryIO] = {}
+        self._active_segment = 0
+        self._active_segment_events = 0
+
+        # Indexes
+        self._by_feature: Dict[str, List[int]] = {}
+        self._by_feature_version: Dict[Tuple[str, str], List[int]] = {}
+        self._by_time: List[Tuple[str, int]] = []
+        self._checkpoints: List[AuditChainCheckpoint] = []
+
+        self._count = 0
+        self._head = GENESIS_CHAIN_HASH
+
+        if self._storage_dir is not None:
+            self._storage_dir.mkdir(parents=True, exist_ok=True)
+            self._load()
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
 
     def append_event(self, event: FeatureAuditEvent) -> str:
         """
@@ -75,14 +156,160 @@ class FeatureAuditLog:
         if not isinstance(event, FeatureAuditEvent):
             raise FeatureAuditViolation("Invalid audit event type")
 
-        self._events.append(event)
-        return self._generate_event_hash(event)
+        seq = self._count
+        event_hash = self._generate_event_hash(event)
+        chain_hash = self._chain(self._head, event_hash)
+
+        if self._storage_dir is None:
+            self._events.append(event)
+            self._event_hashes.append(event_hash)
+            self._chain_hashes.append(chain_hash)
+        else:
+            self._write_record(seq, event, event_hash, chain_hash)
+
+        self._index(seq, event)
+        self._count += 1
+        self._head = chain_hash
+
+        if self._count % self._checkpoint_interval == 0:
+            self._add_checkpoint(AuditChainCheckpoint(seq=seq, chain_hash=chain_hash))
+
+        return event_hash
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def chain_head(self) -> str:
+        """Current hash-chain value (covers every appended event)."""
+        return self._head
+
+    def checkpoints(self) -> List[AuditChainCheckpoint]:
+        """Read-only copy of recorded chain checkpoints."""
+        return list(self._checkpoints)
 
     def list_events(self) -> List[FeatureAuditEvent]:
         """
         Read-only snapshot of audit events.
+
+        Materializes the whole log; prefer iter_events for queries.
+        """
+        return [event for _, event in self._iter_range(0, self._count)]
+
+    def iter_events(
+        self,
+        *,
+        feature_id: Optional[str] = None,
+        feature_version: Optional[str] = None,
+        since_utc: Optional[str] = None,
+        until_utc: Optional[str] = None,
+        event_type: Optional[str] = None,
+    ) -> Iterator[FeatureAuditEvent]:
+        """
+        Lazily yield events matching the filters, in append order.
+
+        - feature_id / feature_version use the feature indexes
+        - since_utc / until_utc select [since, until) on event time
+        - event_type is checked per candidate event
+        """
+
+        if feature_version is not None and feature_id is None:
+            raise FeatureAuditViolation("feature_version filter requires feature_id")
+
+        candidates: Optional[List[int]] = None
+        if feature_id is not None and feature_version is not None:
+            candidates = self._by_feature_version.get((feature_id, feature_version), [])
+        elif feature_id is not None:
+            candidates = self._by_feature.get(feature_id, [])
+
+        if since_utc is not None or until_utc is not None:
+            lo = bisect_left(self._by_time, (since_utc, -1)) if since_utc is not None else 0
+            hi = (
+                bisect_left(self._by_time, (until_utc, -1))
+                if until_utc is not None
+                else len(self._by_time)
+            )
+            in_range = sorted(seq for _, seq in self._by_time[lo:hi])
+            if candidates is None:
+                candidates = in_range
+            else:
+                allowed = set(in_range)
+                candidates = [seq for seq in candidates if seq in allowed]
+
+        seqs = candidates if candidates is not None else range(self._count)
+        for seq in seqs:
+            event = self._read_event(seq)
+            if event_type is not None and event.event_type != event_type:
+                continue
+            yield event
+
+    # ------------------------------------------------------------------
+    # Integrity verification
+    # ------------------------------------------------------------------
+
+    def verify_chain(
+        self,
+        checkpoint: Optional[AuditChainCheckpoint] = None,
+    ) -> str:
         """
-        return list(self._events)
+        Verify event hashes and the hash chain.
+
+        - checkpoint=None → verify from genesis
+        - checkpoint given → trust it and verify only later events
+
+        Returns the verified chain head.
+        Raises FeatureAuditViolation on the first inconsistency.
+        """
+
+        if checkpoint is None:
+            start, chain_hash = 0, GENESIS_CHAIN_HASH
+        else:
+            if not 0 <= checkpoint.seq < self._count:
+                raise FeatureAuditViolation(
+                    f"Checkpoint seq out of range: {checkpoint.seq}"
+                )
+            if self._stored_chain_hash(checkpoint.seq) != checkpoint.chain_hash:
+                raise FeatureAuditViolation(
+                    f"Chain mismatch at checkpoint seq {checkpoint.seq}"
+                )
+            start, chain_hash = checkpoint.seq + 1, checkpoint.chain_hash
+
+        for seq, event, stored_event_hash, stored_chain_hash in self._iter_records(
+            start, self._count
+        ):
+            event_hash = self._generate_event_hash(event)
+            if event_hash != stored_event_hash:
+                raise FeatureAuditViolation(f"Event hash mismatch at seq {seq}")
+            chain_hash = self._chain(chain_hash, event_hash)
+            if chain_hash != stored_chain_hash:
+                raise FeatureAuditViolation(f"Chain hash mismatch at seq {seq}")
+
+        if chain_hash != self._head:
+            raise FeatureAuditViolation("Chain head mismatch")
+
+        return chain_hash
+
+    def latest_checkpoint(self, at_or_before_seq: Optional[int] = None) -> Optional[AuditChainCheckpoint]:
+        """Latest recorded checkpoint at or before the given seq."""
+        if at_or_before_seq is None:
+            return self._checkpoints[-1] if self._checkpoints else None
+
+        seqs = [cp.seq for cp in self._checkpoints]
+        idx = bisect_left(seqs, at_or_before_seq + 1) - 1
+        return self._checkpoints[idx] if idx >= 0 else None
+
+    def close(self) -> None:
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
+
+    # ------------------------------------------------------------------
+    # Hashing
+    # ------------------------------------------------------------------
 
     def _generate_event_hash(self, event: FeatureAuditEvent) -> str:
         """
@@ -108,6 +335,299 @@ class FeatureAuditLog:
 
         return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
 
+    @staticmethod
+    def _chain(previous_chain_hash: str, event_hash: str) -> str:
+        return hashlib.sha256(
+            (previous_chain_hash + event_hash).encode("ascii")
+        ).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def _index(self, seq: int, event: FeatureAuditEvent) -> None:
+        self._by_feature.setdefault(event.feature_id, []).append(seq)
+        self._by_feature_version.setdefault(
+            (event.feature_id, event.feature_version), []
+        ).append(seq)
+        insort(self._by_time, (event.event_timestamp_utc, seq))
+
+    def _add_checkpoint(self, checkpoint: AuditChainCheckpoint, persist: bool = True) -> None:
+        self._checkpoints.append(checkpoint)
+        if persist and self._storage_dir is not None:
+            self._append_line(
+                self._storage_dir / CHECKPOINT_FILE,
+                asdict(checkpoint),
+            )
+
+    # ------------------------------------------------------------------
+    # Record access (both backends)
+    # ------------------------------------------------------------------
+
+    def _read_event(self, seq: int) -> FeatureAuditEvent:
+        if self._storage_dir is None:
+            return self._events[seq]
+        return self._read_record(seq)[1]
+
+    def _stored_chain_hash(self, seq: int) -> str:
+        if self._storage_dir is None:
+            return self._chain_hashes[seq]
+        return self._read_record(seq)[3]
+
+    def _iter_range(self, start: int, end: int) -> Iterator[Tuple[int, FeatureAuditEvent]]:
+        for seq, event, _, _ in self._iter_records(start, end):
+            yield seq, event
+
+    def _iter_records(
+        self,
+        start: int,
+        end: int,
+    ) -> Iterator[Tuple[int, FeatureAuditEvent, str, str]]:
+        if self._storage_dir is None:
+            for seq in range(start, end):
+                yield seq, self._events[seq], self._event_hashes[seq], self._chain_hashes[seq]
+            return
+
+        # Sequential scan per segment (no per-record seek)
+        if start >= end:
+            return
+        segment_no, offset = self._locations[start]
+        seq = start
+        while seq < end:
+            with open(self._segment_path(segment_no), "rb") as handle:
+                handle.seek(offset)
+                for line in handle:
+                    if seq >= end:
+                        break
+                    yield self._decode_record(seq, line)
+                    seq += 1
+            segment_no += 1
+            offset = 0
+
+    # ------------------------------------------------------------------
+    # Durable backend
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, segment_no: int) -> Path:
+        return self._storage_dir / f"{SEGMENT_PREFIX}{segment_no:06d}{SEGMENT_SUFFIX}"
+
+    def _index_path(self, segment_no: int) -> Path:
+        return self._storage_dir / f"{SEGMENT_PREFIX}{segment_no:06d}{INDEX_SUFFIX}"
+
+    def _append_line(self, path: Path, payload: Dict) -> int:
+        """Append one JSON line; returns the byte offset of the line."""
+        line = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+        with open(path, "ab") as handle:
+            offset = handle.tell()
+            handle.write(line.encode("ascii") + b"\n")
+            handle.flush()
+            if self._fsync:
+                os.fsync(handle.fileno())
+        return offset
+
+    def _write_record(
+        self,
+        seq: int,
+        event: FeatureAuditEvent,
+        event_hash: str,
+        chain_hash: str,
+    ) -> None:
+        if self._active_segment == 0 or self._active_segment_events >= self._max_segment_events:
+            self._active_segment += 1
+            self._active_segment_events = 0
+
+        offset = self._append_line(
+            self._segment_path(self._active_segment),
+            {
+                "seq": seq,
+                "event": asdict(event),
+                "event_hash": event_hash,
+                "chain_hash": chain_hash,
+            },
+        )
+        self._append_line(
+            self._index_path(self._active_segment),
+            {
+                "seq": seq,
+                "offset": offset,
+                "feature_id": event.feature_id,
+                "feature_version": event.feature_version,
+                "event_timestamp_utc": event.event_timestamp_utc,
+            },
+        )
+        self._locations.append((self._active_segment, offset))
+        self._active_segment_events += 1
+
+    def _read_record(self, seq: int) -> Tuple[int, FeatureAuditEvent, str, str]:
+        segment_no, offset = self._locations[seq]
+        reader = self._readers.get(segment_no)
+        if reader is None:
+            reader = open(self._segment_path(segment_no), "rb")
+            self._readers[segment_no] = reader
+        reader.seek(offset)
+        return self._decode_record(seq, reader.readline())
+
+    @staticmethod
+    def _decode_record(seq: int, line: bytes) -> Tuple[int, FeatureAuditEvent, str, str]:
+        if not line.endswith(b"\n"):
+            raise FeatureAuditViolation(f"Truncated audit record at seq {seq}")
+        record = json.loads(line)
+        if record["seq"] != seq:
+            raise FeatureAuditViolation(f"Audit record out of sequence at seq {seq}")
+        return seq, FeatureAuditEvent(**record["event"]), record["event_hash"], record["chain_hash"]
+
+    def _load(self) -> None:
+        """
+        Rebuild in-memory indexes from sidecar index files.
+
+        Segments whose sidecar is missing or behind (e.g. crash between
+        the two writes) are re-indexed from the segment itself. A partial
+        trailing line in the active (last) segment is an unacknowledged
+        write interrupted by a crash; it is truncated and logged.
+        """
+
+        segment_numbers = sorted(
+            int(path.name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+            for path in self._storage_dir.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}")
+            if not path.name.endswith(INDEX_SUFFIX)
+        )
+
+        for segment_no in segment_numbers:
+            entries = self._read_index(segment_no)
+            segment_size = self._segment_path(segment_no).stat().st_size
+            indexed_end = entries[-1][1] if entries else 0
+            if not entries or self._line_end(segment_no, indexed_end) < segment_size:
+                entries = self._reindex_segment(
+                    segment_no,
+                    active=segment_no == segment_numbers[-1],
+                )
+
+            for seq, offset, feature_id, feature_version, timestamp in entries:
+                if seq != self._count:
+                    raise FeatureAuditViolation(f"Audit segment out of sequence at seq {seq}")
+                self._locations.append((segment_no, offset))
+                self._by_feature.setdefault(feature_id, []).append(seq)
+                self._by_feature_version.setdefault((feature_id, feature_version), []).append(seq)
+                self._by_time.append((timestamp, seq))
+                self._count += 1
+
+            self._active_segment = segment_no
+            self._active_segment_events = len(entries)
+
+        self._by_time.sort()
+
+        if self._count:
+            self._head = self._read_record(self._count - 1)[3]
+
+        checkpoint_path = self._storage_dir / CHECKPOINT_FILE
+        if checkpoint_path.exists():
+            with open(checkpoint_path, "r+b") as handle:
+                offset = 0
+                for line in handle:
+                    if not line.endswith(b"\n"):
+                        handle.truncate(offset)
+                        logger.warning(
+                            "Discarded partial trailing audit checkpoint (%d bytes at offset %d)",
+                            len(line),
+                            offset,
+                        )
+                        break
+                    if line.strip():
+                        self._add_checkpoint(AuditChainCheckpoint(**json.loads(line)), persist=False)
+                    offset += len(line)
+
+    def _read_index(self, segment_no: int) -> List[Tuple[int, int, str, str, str]]:
+        path = self._index_path(segment_no)
+        if not path.exists():
+            return []
+        entries = []
+        with open(path, "rb") as handle:
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                entry = json.loads(line)
+                entries.append(
+                    (
+                        entry["seq"],
+                        entry["offset"],
+                        entry["feature_id"],
+                        entry["feature_version"],
+                        entry["event_timestamp_utc"],
+                    )
+                )
+        return entries
+
+    def _line_end(self, segment_no: int, offset: int) -> int:
+        with open(self._segment_path(segment_no), "rb") as handle:
+            handle.seek(offset)
+            return offset + len(handle.readline())
+
+    def _reindex_segment(
+        self,
+        segment_no: int,
+        active: bool = False,
+    ) -> List[Tuple[int, int, str, str, str]]:
+        entries = []
+        partial_bytes = 0
+        segment_path = self._segment_path(segment_no)
+        with open(segment_path, "rb") as handle:
+            offset = 0
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    if not active:
+                        raise FeatureAuditViolation(
+                            f"Truncated audit record in segment {segment_no}"
+                        )
+                    partial_bytes = len(line)
+                    break
+                record = json.loads(line)
+                event = record["event"]
+                entries.append(
+                    (
+                        record["seq"],
+                        offset,
+                        event["feature_id"],
+                        event["feature_version"],
+                        event["event_timestamp_utc"],
+                    )
+                )
+                offset += len(line)
+
+        if partial_bytes:
+            with open(segment_path, "r+b") as handle:
+                handle.truncate(offset)
+                if self._fsync:
+                    os.fsync(handle.fileno())
+            logger.warning(
+                "Discarded partial trailing audit record in segment %d "
+                "(%d bytes at offset %d)",
+                segment_no,
+                partial_bytes,
+                offset,
+            )
+
+        index_path = self._index_path(segment_no)
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as handle:
+            for seq, entry_offset, feature_id, feature_version, timestamp in entries:
+                handle.write(
+                    json.dumps(
+                        {
+                            "seq": seq,
+                            "offset": entry_offset,
+                            "feature_id": feature_id,
+                            "feature_version": feature_version,
+                            "event_timestamp_utc": timestamp,
+                        },
+                        sort_keys=True,
+                        separators=(",", ":"),
+                        ensure_ascii=True,
+                    ).encode("ascii")
+                    + b"\n"
+                )
+        os.replace(tmp_path, index_path)
+        return entries
+
 
 # ============================================================
 # HELPER (OPTIONAL – GOVERNANCE SAFE)
@@ -0,0 +1,491 @@
+"""
+Batch (Columnar) Tabular Feature Extraction
+-------------------------------------------
+Role:
+- Run structural, legal, market and time extractors over a whole table
+- Emit one combined feature table (one row per property)
+- Compute per-row provenance hashes in bulk, or lazily on demand
+- No valuation logic
+- No scoring / thresholds
+
+Governance:
+- MASTER_SPEC.md compliant
+- Output is identical to the per-record extractors:
+    structural_features.extract_structural_features
+    legal_features.extract_legal_features
+    market_features.extract_market_features
+    time_features.extract_time_features
+  for the same extracted_at_utc / reference_time_utc
+- List-of-dicts input is read key by key with the per-record
+  `.get(source, default)` semantics (a key present with value None is
+  kept distinct from an absent key; ints stay ints)
+- DataFrame / Arrow input: missing cells (absent column, None, NaN)
+  behave like absent record keys
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+
+
+FEATURE_VERSION = "v1.0.0"
+
+# (feature_name, source_field, default when the source is absent)
+FieldSpec = Tuple[str, str, Any]
+
+STRUCTURAL_FIELDS: Tuple[FieldSpec, ...] = (
+    ("land_area_sqm", "land_area_sqm", None),
+    ("gross_floor_area_sqm", "gross_floor_area_sqm", None),
+    ("num_floors", "num_floors", None),
+    ("frontage_m", "frontage_m", None),
+    ("access_road_width_m", "access_road_width_m", None),
+    ("plot_shape", "plot_shape", None),
+    ("corner_lot_flag", "corner_lot_flag", False),
+    ("construction_year", "construction_year", None),
+    ("building_age_years", "building_age_years", None),
+    ("remaining_quality_ratio", "remaining_quality_ratio", None),
+    ("zoning_label", "zoning_label", None),
+    ("planning_disclosure_flag", "planning_disclosure_flag", False),
+)
+
+LEGAL_FIELDS: Tuple[FieldSpec, ...] = (
+    ("ownership_type", "ownership_type", None),
+    ("num_declared_owners", "num_declared_owners", None),
+    ("ownership_disclosure_flag", "ownership_disclosure_flag", False),
+    ("has_land_use_right_certificate", "has_land_use_right_certificate", None),
+    ("certificate_type", "certificate_type", None),
+    ("certificate_issue_year", "certificate_issue_year", None),
+    ("declared_zoning_label", "declared_zoning_label", None),
+    ("planning_disclosure_flag", "planning_disclosure_flag", False),
+    ("planning_notes_present", "planning_notes_present", False),
+    ("declared_mortgage_flag", "declared_mortgage_flag", False),
+    ("declared_dispute_flag", "declared_dispute_flag", False),
+    ("usage_restriction_flag", "usage_restriction_flag", False),
+)
+
+MARKET_FIELDS: Tuple[FieldSpec, ...] = (
+    ("nearby_listing_count", "nearby_listing_count", None),
+    ("nearby_project_count", "nearby_project_count", None),
+    ("new_supply_flag", "new_supply_flag", False),
+    ("recent_transaction_count", "recent_transaction_count", None),
+    ("transaction_observation_window_months", "transaction_observation_window_months", None),
+    ("avg_days_on_market", "avg_days_on_market", None),
+    ("listing_turnover_rate", "listing_turnover_rate", None),
+    ("market_segment_label", "market_segment_label", None),
+    ("locality_market_code", "locality_market_code", None),
+)
+
+TIME_FIELDS: Tuple[FieldSpec, ...] = (
+    ("construction_year", "construction_year", None),
+    ("last_renovation_year", "last_renovation_year", None),
+    ("listing_created_at", "listing_created_at", None),
+    ("last_transaction_year", "last_transaction_year", None),
+    ("data_snapshot_year", "data_snapshot_year", None),
+)
+
+# (feature_name, source year field) → max(reference_year - year, 0)
+TIME_YEAR_DIFFS: Tuple[Tuple[str, str], ...] = (
+    ("asset_age_years", "construction_year"),
+    ("years_since_renovation", "last_renovation_year"),
+    ("years_since_last_transaction", "last_transaction_year"),
+    ("years_since_data_snapshot", "data_snapshot_year"),
+)
+
+# Feature order inside each per-record payload
+TIME_FEATURE_ORDER: Tuple[str, ...] = (
+    "construction_year",
+    "asset_age_years",
+    "last_renovation_year",
+    "years_since_renovation",
+    "listing_created_at",
+    "last_transaction_year",
+    "years_since_last_transaction",
+    "data_snapshot_year",
+    "years_since_data_snapshot",
+)
+
+FEATURE_GROUPS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "structural": ("STRUCTURAL_TABULAR", tuple(f for f, _, _ in STRUCTURAL_FIELDS)),
+    "legal": ("LEGAL_TABULAR", tuple(f for f, _, _ in LEGAL_FIELDS)),
+    "market": ("MARKET_TABULAR", tuple(f for f, _, _ in MARKET_FIELDS)),
+    "time": ("TIME_TABULAR", TIME_FEATURE_ORDER),
+}
+
+
+@dataclass(frozen=True)
+class TabularFeatureBatch:
+    """
+    Combined tabular feature table for a batch of properties.
+
+    - features: one column per feature (shared features appear once)
+    - feature_hashes: '<group>_feature_hash' columns, or None when lazy
+    """
+    features: pd.DataFrame
+    extracted_at_utc: str
+    reference_time_utc: str
+    feature_hashes: Optional[pd.DataFrame] = None
+
+    def compute_feature_hashes(
+        self,
+        groups: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Compute per-row provenance hashes (identical to per-record
+        feature_hash) for the requested groups.
+        """
+        return _compute_hashes(
+            self.features,
+            groups=groups or tuple(FEATURE_GROUPS),
+            extracted_at_utc=self.extracted_at_utc,
+            reference_time_utc=self.reference_time_utc,
+        )
+
+    def record_payload(self, row: int, group: str) -> Dict[str, Any]:
+        """
+        Rebuild the per-record payload for one row and group.
+        """
+        feature_group, names = FEATURE_GROUPS[group]
+        values = self.features.iloc[[row]].to_dict("records")[0]
+        payload: Dict[str, Any] = {
+            "feature_group": feature_group,
+            "feature_version": FEATURE_VERSION,
+        }
+        if group == "time":
+            payload["reference_time_utc"] = self.reference_time_utc
+        payload["extracted_at_utc"] = self.extracted_at_utc
+        payload["features"] = {name: _to_python(values[name]) for name in names}
+        payload["feature_hash"] = _hash_canonical(_canonical_json(payload))
+        return payload
+
+
+def extract_tabular_features_batch(
+    records: Any,
+    reference_time_utc: Optional[str] = None,
+    extracted_at_utc: Optional[str] = None,
+    hash_mode: str = "eager",
+) -> TabularFeatureBatch:
+    """
+    Extract structural, legal, market and time features for a table.
+
+    Input (Read-only):
+        records: pandas DataFrame, Arrow table (to_pandas) or list of dicts
+        reference_time_utc: ISO timestamp for time features (default: now)
+        extracted_at_utc: ISO timestamp shared by the whole batch (default: now)
+        hash_mode: "eager" computes hash columns now, "lazy" defers them
+
+    Output:
+        TabularFeatureBatch (non-decisive)
+    """
+    if hash_mode not in ("eager", "lazy"):
+        raise ValueError("hash_mode must be 'eager' or 'lazy'")
+
+    now = (
+        datetime.fromisoformat(reference_time_utc)
+        if reference_time_utc
+        else datetime.utcnow()
+    )
+    reference_iso = now.isoformat()
+    extracted_iso = extracted_at_utc or datetime.utcnow().isoformat()
+
+    if _is_tabular(records):
+        frame = _as_frame(records)
+        index = frame.index
+        select = partial(_select, frame)
+        year_diff = partial(_year_diff, frame, current_year=now.year)
+    else:
+        rows = list(records)
+        index = pd.RangeIndex(len(rows))
+        select = partial(_record_column, rows)
+        year_diff = partial(_record_year_diff, rows, current_year=now.year)
+
+    columns: Dict[str, pd.Series] = {}
+    for specs in (STRUCTURAL_FIELDS, LEGAL_FIELDS, MARKET_FIELDS, TIME_FIELDS):
+        for name, source, default in specs:
+            if name not in columns:
+                columns[name] = select(source, default)
+
+    for name, source in TIME_YEAR_DIFFS:
+        columns[name] = year_diff(source)
+
+    features = pd.DataFrame(columns, index=index)
+
+    batch = TabularFeatureBatch(
+        features=features,
+        extracted_at_utc=extracted_iso,
+        reference_time_utc=reference_iso,
+    )
+
+    if hash_mode == "eager":
+        batch = TabularFeatureBatch(
+            features=features,
+            extracted_at_utc=extracted_iso,
+            reference_time_utc=reference_iso,
+            feature_hashes=batch.compute_feature_hashes(),
+        )
+
+    return batch
+
+
+def check_record_parity(
+    records: Any,
+    batch: TabularFeatureBatch,
+    sample_rows: Optional[Sequence[int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Compare batch output against the per-record extractors.
+
+    List-of-dicts input is compared against the caller's original
+    records (pass a sequence, not a one-shot iterator). DataFrame /
+    Arrow rows are converted to records with missing cells dropped,
+    which is the documented table semantics.
+
+    Per-record payloads carry their own extraction timestamp, so hashes
+    are compared after aligning extracted_at_utc to the batch value.
+
+    Returns a list of mismatch records (empty list = parity).
+    """
+    from feature_pipeline.tabular.legal_features import extract_legal_features
+    from feature_pipeline.tabular.market_features import extract_market_features
+    from feature_pipeline.tabular.structural_features import extract_structural_features
+    from feature_pipeline.tabular.time_features import extract_time_features
+
+    extractors: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+        "structural": extract_structural_features,
+        "legal": extract_legal_features,
+        "market": extract_market_features,
+        "time": lambda record: extract_time_features(
+            record, reference_time_utc=batch.reference_time_utc
+        ),
+    }
+
+    if _is_tabular(records):
+        frame = _as_frame(records)
+        originals: Optional[List[Dict[str, Any]]] = None
+        row_count = len(frame)
+    else:
+        originals = list(records)
+        row_count = len(originals)
+
+    rows = sample_rows if sample_rows is not None else range(row_count)
+    mismatches: List[Dict[str, Any]] = []
+
+    for row in rows:
+        if originals is not None:
+            record = originals[row]
+        else:
+            record = {
+                key: _to_python(value)
+                for key, value in frame.iloc[[row]].to_dict("records")[0].items()
+                if not _is_missing(value)
+            }
+        for group, extractor in extractors.items():
+            expected = extractor(record)
+            expected["extracted_at_utc"] = batch.extracted_at_utc
+            expected.pop("feature_hash")
+            expected_hash = _hash_canonical(_canonical_json(expected))
+
+            actual = batch.record_payload(row, group)
+            if actual["features"] != expected["features"] or actual["feature_hash"] != expected_hash:
+                mismatches.append(
+                    {
+                        "row": row,
+                        "feature_group": expected["feature_group"],
+                        "expected_features": expected["features"],
+                        "actual_features": actual["features"],
+                    }
+                )
+
+    return mismatches
+
+
+# =========================================================
+# INTERNAL HELPERS
+# =========================================================
+
+def _is_tabular(records: Any) -> bool:
+    return isinstance(records, pd.DataFrame) or hasattr(records, "to_pandas")
+
+
+def _as_frame(records: Any) -> pd.DataFrame:
+    if isinstance(records, pd.DataFrame):
+        return records
+    return records.to_pandas()
+
+
+def _record_column(
+    rows: Sequence[Dict[str, Any]],
+    source: str,
+    default: Any,
+) -> pd.Series:
+    """
+    Object column of `record.get(source, default)` (values kept as-is).
+    """
+    return pd.Series(
+        [record.get(source, default) for record in rows],
+        index=pd.RangeIndex(len(rows)),
+        dtype=object,
+    )
+
+
+def _record_year_diff(
+    rows: Sequence[Dict[str, Any]],
+    source: str,
+    current_year: int,
+) -> pd.Series:
+    """
+    Per-record max(current_year - year, 0); None where the year is None.
+    """
+    years = [record.get(source) for record in rows]
+    return pd.Series(
+        [None if year is None else max(current_year - year, 0) for year in years],
+        index=pd.RangeIndex(len(rows)),
+        dtype=object,
+    )
+
+
+def _select(frame: pd.DataFrame, source: str, default: Any) -> pd.Series:
+    """
+    Column copy with per-record `.get(source, default)` semantics.
+    """
+    if source not in frame.columns:
+        return pd.Series([default] * len(frame), index=frame.index, dtype=object)
+
+    column = frame[source]
+    missing = column.isna().to_numpy()
+    if not missing.any():
+        return column
+
+    out = column.astype(object).copy()
+    out[missing] = default
+    return out
+
+
+def _year_diff(frame: pd.DataFrame, source: str, current_year: int) -> pd.Series:
+    """
+    Vectorized max(current_year - year, 0); None where the year is absent.
+    """
+    if source not in frame.columns:
+        return pd.Series([None] * len(frame), index=frame.index, dtype=object)
+
+    column = frame[source]
+    if column.dtype.kind in "iu":
+        return pd.Series(np.maximum(current_year - column.to_numpy(), 0), index=frame.index)
+
+    if column.dtype.kind == "f":
+        # max(diff, 0) yields the int 0 for negative float diffs
+        diff = current_year - column.to_numpy()
+        out = pd.Series(diff, index=frame.index).astype(object)
+        out[diff < 0] = 0
+        out[column.isna().to_numpy()] = None
+        return out
+
+    return pd.Series(
+        [
+            None if _is_missing(year) else max(current_year - _to_python(year), 0)
+            for year in column.tolist()
+        ],
+        index=frame.index,
+        dtype=object,
+    )
+
+
+def _compute_hashes(
+    features: pd.DataFrame,
+    *,
+    groups: Sequence[str],
+    extracted_at_utc: str,
+    reference_time_utc: str,
+) -> pd.DataFrame:
+    """
+    Bulk per-row hashes.
+
+    Canonical JSON (sort_keys) places 'features' between the static
+    metadata keys, so the static part is encoded once per group. Feature
+    values are encoded once per distinct value per column and joined
+    into the row's feature object in sorted key order.
+    """
+    hashes: Dict[str, List[str]] = {}
+    encoder = json.JSONEncoder(sort_keys=True, ensure_ascii=False)
+
+    for group in groups:
+        feature_group, names = FEATURE_GROUPS[group]
+        head: Dict[str, Any] = {
+            "extracted_at_utc": extracted_at_utc,
+            "feature_group": feature_group,
+            "feature_version": FEATURE_VERSION,
+        }
+        prefix = encoder.encode(head)[:-1] + ', "features": {'
+        suffix = "}}"
+        if group == "time":
+            suffix = '}, "reference_time_utc": ' + encoder.encode(reference_time_utc) + "}"
+
+        fragments = [
+            _encode_fragments(encoder, name, _python_values(features[name]))
+            for name in sorted(names)
+        ]
+        hashes[f"{group}_feature_hash"] = [
+            _hash_canonical(prefix + ", ".join(row) + suffix)
+            for row in zip(*fragments)
+        ]
+
+    return pd.DataFrame(hashes, index=features.index)
+
+
+def _encode_fragments(
+    encoder: json.JSONEncoder,
+    name: str,
+    values: List[Any],
+) -> List[str]:
+    """
+    Encode '"name": value' for each row, reusing encodings of repeated
+    values (keyed by type so that True / 1 / 1.0 stay distinct).
+    """
+    key = encoder.encode(name) + ": "
+    cache: Dict[Tuple[type, Any], str] = {}
+    out: List[str] = []
+    for value in values:
+        try:
+            cache_key = (type(value), value)
+            fragment = cache.get(cache_key)
+            if fragment is None:
+                fragment = key + encoder.encode(value)
+                cache[cache_key] = fragment
+        except TypeError:
+            fragment = key + encoder.encode(value)
+        out.append(fragment)
+    return out
+
+
+def _python_values(column: pd.Series) -> List[Any]:
+    if column.dtype.kind in "biuf":
+        return column.to_numpy().tolist()
+    return [_to_python(value) for value in column.tolist()]
+
+
+def _to_python(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _is_missing(value: Any) -> bool:
+    if value is None:
+        return True
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def _canonical_json(payload: Dict[str, Any]) -> str:
+    return json.dumps(payload, sort_keys=True, ensure_ascii=False)
+
+
+def _hash_canonical(canonical: str) -> str:
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
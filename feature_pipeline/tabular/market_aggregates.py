@@ -0,0 +1,411 @@
+"""
+Market Aggregate Engine
+-----------------------
+Role:
+- Maintain rolling-window market activity aggregates per geo cluster
+  and per locality market code
+- Incremental updates as listings / transactions arrive
+- O(1) point lookup at valuation time
+- Full-rebuild mode for backfills (replay in event-time order)
+- No price prediction
+- No trend inference
+- No valuation logic
+
+Aggregates (descriptive only):
+- nearby_listing_count        active listings in the area
+- recent_transaction_count    transactions within the window
+- avg_days_on_market          mean days on market of listings closed
+                              within the window
+- listing_turnover_rate       closed listings in window /
+                              (active listings + closed listings in window)
+
+Governance:
+- MASTER_SPEC.md compliant
+- Deterministic & replayable
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import heapq
+
+from feature_pipeline.geo.geo_cluster_assigner import grid_cluster_id
+
+
+AreaKey = Tuple[str, str]   # ("cluster" | "locality", id)
+
+DAYS_PER_MONTH = 30
+
+
+class MarketAggregateError(Exception):
+    """Raised when market aggregate events are inconsistent."""
+
+
+@dataclass
+class _DayBucket:
+    transactions: int = 0
+    closed_listings: int = 0
+    days_on_market_sum: float = 0.0
+
+
+@dataclass
+class _AreaState:
+    """
+    Rolling state for one area. Totals always equal the sum of buckets.
+    """
+    active_listings: int = 0
+    transactions: int = 0
+    closed_listings: int = 0
+    days_on_market_sum: float = 0.0
+    buckets: Dict[int, _DayBucket] = field(default_factory=dict)
+    bucket_days: List[int] = field(default_factory=list)   # min-heap
+
+
+@dataclass(frozen=True)
+class _OpenListing:
+    listed_day: int
+    areas: Tuple[AreaKey, ...]
+
+
+class MarketAggregateEngine:
+    """
+    Incremental rolling-window market aggregates.
+
+    Time is bucketed by UTC day. The window ends at the engine
+    watermark (latest event time seen, or an explicit advance_to).
+    Buckets leaving the window are evicted lazily, so each event and
+    each lookup costs amortized O(1) per area.
+    """
+
+    def __init__(
+        self,
+        window_days: int = 180,
+        grid_size_deg: float = 0.01,
+    ) -> None:
+        if window_days < 1:
+            raise MarketAggregateError("window_days must be >= 1")
+
+        self.window_days = window_days
+        self.grid_size_deg = grid_size_deg
+
+        self._areas: Dict[AreaKey, _AreaState] = {}
+        self._open_listings: Dict[str, _OpenListing] = {}
+        self._seen_transactions: set = set()
+        self._watermark_day: Optional[int] = None
+
+        # Rows repaired or skipped by rebuild(), by reason
+        self.rebuild_issues: Dict[str, int] = {
+            "closed_before_listed": 0,
+            "relisted_while_active": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    def record_listing(
+        self,
+        listing_id: str,
+        listed_at_utc: str,
+        *,
+        cluster_id: Optional[str] = None,
+        locality_code: Optional[str] = None,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+    ) -> None:
+        """
+        Register a newly active listing.
+        """
+        if listing_id in self._open_listings:
+            raise MarketAggregateError(f"Listing already active: {listing_id}")
+
+        day = _to_day(listed_at_utc)
+        areas = self._area_keys(cluster_id, locality_code, latitude, longitude)
+
+        self._open_listings[listing_id] = _OpenListing(listed_day=day, areas=areas)
+        for key in areas:
+            self._state(key).active_listings += 1
+
+        self._advance_watermark(day)
+
+    def record_delisting(
+        self,
+        listing_id: str,
+        closed_at_utc: str,
+    ) -> None:
+        """
+        Close an active listing (sold, withdrawn or expired).
+        """
+        listing = self._open_listings.pop(listing_id, None)
+        if listing is None:
+            raise MarketAggregateError(f"Unknown or already closed listing: {listing_id}")
+
+        day = _to_day(closed_at_utc)
+        days_on_market = max(day - listing.listed_day, 0)
+
+        for key in listing.areas:
+            state = self._state(key)
+            state.active_listings -= 1
+            bucket = self._bucket(state, day)
+            if bucket is not None:
+                bucket.closed_listings += 1
+                bucket.days_on_market_sum += days_on_market
+                state.closed_listings += 1
+                state.days_on_market_sum += days_on_market
+
+        self._advance_watermark(day)
+
+    def record_transaction(
+        self,
+        transaction_id: str,
+        transacted_at_utc: str,
+        *,
+        cluster_id: Optional[str] = None,
+        locality_code: Optional[str] = None,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+    ) -> None:
+        """
+        Register a closed transaction. Duplicate IDs are ignored.
+        """
+        if transaction_id in self._seen_transactions:
+            return
+        self._seen_transactions.add(transaction_id)
+
+        day = _to_day(transacted_at_utc)
+        for key in self._area_keys(cluster_id, locality_code, latitude, longitude):
+            state = self._state(key)
+            bucket = self._bucket(state, day)
+            if bucket is not None:
+                bucket.transactions += 1
+                state.transactions += 1
+
+        self._advance_watermark(day)
+
+    def advance_to(self, as_of_utc: str) -> None:
+        """
+        Move the window end forward without an event (e.g. daily tick).
+        """
+        self._advance_watermark(_to_day(as_of_utc))
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get_aggregates(
+        self,
+        *,
+        cluster_id: Optional[str] = None,
+        locality_code: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        O(1) lookup. Cluster aggregates are preferred; the locality is
+        used when the cluster is unknown to the engine.
+        """
+        for key in (("cluster", cluster_id), ("locality", locality_code)):
+            if key[1] is None:
+                continue
+            state = self._areas.get(key)
+            if state is not None:
+                self._evict(state)
+                return self._snapshot(key, state)
+        return None
+
+    def cluster_id_for(self, latitude: float, longitude: float) -> str:
+        return grid_cluster_id(latitude, longitude, self.grid_size_deg)
+
+    # ------------------------------------------------------------------
+    # Full rebuild
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def rebuild(
+        cls,
+        listings: Iterable[Dict[str, Any]],
+        transactions: Iterable[Dict[str, Any]],
+        *,
+        as_of_utc: Optional[str] = None,
+        window_days: int = 180,
+        grid_size_deg: float = 0.01,
+    ) -> "MarketAggregateEngine":
+        """
+        Build an engine from full listing / transaction tables.
+
+        listings rows:      listing_id, listed_at_utc, closed_at_utc (optional),
+                            cluster_id / locality_code / latitude / longitude
+        transactions rows:  transaction_id, transacted_at_utc,
+                            cluster_id / locality_code / latitude / longitude
+
+        Events are replayed in event-time order, so the result equals
+        the state reached by incremental updates.
+
+        Inconsistent rows do not abort the rebuild; they are counted in
+        engine.rebuild_issues:
+        - closed_before_listed: close is clamped to the listing day
+          (0 days on market)
+        - relisted_while_active: a listing_id listed again while its
+          previous row is still active; the row (and its close) is skipped
+        """
+        engine = cls(window_days=window_days, grid_size_deg=grid_size_deg)
+
+        # (day, order, seq, kind, row); opens before closes on the same day
+        events: List[Tuple[int, int, int, str, Dict[str, Any]]] = []
+        seq = 0
+        for row in listings:
+            listed_day = _to_day(row["listed_at_utc"])
+            events.append((listed_day, 0, seq, "open", row))
+            seq += 1
+            if row.get("closed_at_utc"):
+                closed_day = _to_day(row["closed_at_utc"])
+                if closed_day < listed_day:
+                    engine.rebuild_issues["closed_before_listed"] += 1
+                    closed_day = listed_day
+                events.append((closed_day, 2, seq, "close", row))
+                seq += 1
+        for row in transactions:
+            events.append((_to_day(row["transacted_at_utc"]), 1, seq, "txn", row))
+            seq += 1
+
+        events.sort(key=lambda event: event[:3])
+
+        skipped_rows: set = set()
+        for day, _, _, kind, row in events:
+            if kind == "open":
+                listing_id = str(row["listing_id"])
+                if listing_id in engine._open_listings:
+                    engine.rebuild_issues["relisted_while_active"] += 1
+                    skipped_rows.add(id(row))
+                    continue
+                engine.record_listing(
+                    listing_id,
+                    row["listed_at_utc"],
+                    **_location_kwargs(row),
+                )
+            elif kind == "close":
+                if id(row) in skipped_rows:
+                    continue
+                engine.record_delisting(str(row["listing_id"]), _from_day(day))
+            else:
+                engine.record_transaction(
+                    str(row["transaction_id"]),
+                    row["transacted_at_utc"],
+                    **_location_kwargs(row),
+                )
+
+        if as_of_utc is not None:
+            engine.advance_to(as_of_utc)
+
+        return engine
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _area_keys(
+        self,
+        cluster_id: Optional[str],
+        locality_code: Optional[str],
+        latitude: Optional[float],
+        longitude: Optional[float],
+    ) -> Tuple[AreaKey, ...]:
+        if cluster_id is None and latitude is not None and longitude is not None:
+            cluster_id = self.cluster_id_for(latitude, longitude)
+
+        keys: List[AreaKey] = []
+        if cluster_id is not None:
+            keys.append(("cluster", cluster_id))
+        if locality_code is not None:
+            keys.append(("locality", locality_code))
+        if not keys:
+            raise MarketAggregateError(
+                "Event requires cluster_id, locality_code or coordinates"
+            )
+        return tuple(keys)
+
+    def _state(self, key: AreaKey) -> _AreaState:
+        state = self._areas.get(key)
+        if state is None:
+            state = _AreaState()
+            self._areas[key] = state
+        return state
+
+    def _window_start(self) -> Optional[int]:
+        if self._watermark_day is None:
+            return None
+        return self._watermark_day - self.window_days + 1
+
+    def _bucket(self, state: _AreaState, day: int) -> Optional[_DayBucket]:
+        """
+        Bucket for `day`, or None if the day is already outside the window.
+        """
+        start = self._window_start()
+        if start is not None and day < start:
+            return None
+
+        bucket = state.buckets.get(day)
+        if bucket is None:
+            bucket = _DayBucket()
+            state.buckets[day] = bucket
+            heapq.heappush(state.bucket_days, day)
+        return bucket
+
+    def _advance_watermark(self, day: int) -> None:
+        if self._watermark_day is None or day > self._watermark_day:
+            self._watermark_day = day
+
+    def _evict(self, state: _AreaState) -> None:
+        start = self._window_start()
+        if start is None:
+            return
+        while state.bucket_days and state.bucket_days[0] < start:
+            day = heapq.heappop(state.bucket_days)
+            bucket = state.buckets.pop(day)
+            state.transactions -= bucket.transactions
+            state.closed_listings -= bucket.closed_listings
+            state.days_on_market_sum -= bucket.days_on_market_sum
+
+    def _snapshot(self, key: AreaKey, state: _AreaState) -> Dict[str, Any]:
+        avg_dom = (
+            round(state.days_on_market_sum / state.closed_listings, 4)
+            if state.closed_listings
+            else None
+        )
+        turnover_base = state.active_listings + state.closed_listings
+        turnover = (
+            round(state.closed_listings / turnover_base, 4) if turnover_base else None
+        )
+        return {
+            "area_type": key[0],
+            "area_id": key[1],
+            "window_days": self.window_days,
+            "window_end_day": (
+                _from_day(self._watermark_day) if self._watermark_day is not None else None
+            ),
+            "nearby_listing_count": state.active_listings,
+            "recent_transaction_count": state.transactions,
+            "avg_days_on_market": avg_dom,
+            "listing_turnover_rate": turnover,
+            "transaction_observation_window_months": round(
+                self.window_days / DAYS_PER_MONTH, 2
+            ),
+        }
+
+
+def _location_kwargs(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "cluster_id": row.get("cluster_id"),
+        "locality_code": row.get("locality_code"),
+        "latitude": row.get("latitude"),
+        "longitude": row.get("longitude"),
+    }
+
+
+def _to_day(timestamp_utc: str) -> int:
+    moment = datetime.fromisoformat(timestamp_utc)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.date().toordinal()
+
+
+def _from_day(day: int) -> str:
+    return datetime.fromordinal(day).date().isoformat()
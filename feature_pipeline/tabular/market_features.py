@@ -12,11 +12,24 @@ Governance:
 - Deterministic & replayable
 """
 
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Optional
 from datetime import datetime
 import hashlib
 import json
 
+if TYPE_CHECKING:
+    from feature_pipeline.tabular.market_aggregates import MarketAggregateEngine
+
+
+# Features that may be served by the market aggregate engine
+ENGINE_FEATURES = (
+    "nearby_listing_count",
+    "recent_transaction_count",
+    "transaction_observation_window_months",
+    "avg_days_on_market",
+    "listing_turnover_rate",
+)
+
 
 def _hash_payload(payload: Dict[str, Any]) -> str:
     """
@@ -26,7 +39,10 @@ def _hash_payload(payload: Dict[str, Any]) -> str:
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
-def extract_market_features(property_record: Dict[str, Any]) -> Dict[str, Any]:
+def extract_market_features(
+    property_record: Dict[str, Any],
+    market_engine: Optional["MarketAggregateEngine"] = None
+) -> Dict[str, Any]:
     """
     Extract market-related tabular features.
 
@@ -34,6 +50,10 @@ def extract_market_features(property_record: Dict[str, Any]) -> Dict[str, Any]:
         property_record: dict
             Normalized, validated upstream.
             No enrichment or inference here.
+        market_engine: MarketAggregateEngine (optional)
+            Precomputed rolling aggregates looked up by geo_cluster_id
+            (or locality_market_code). Only fills features that the
+            record does not declare.
 
     Output:
         MarketFeaturePayload (non-decisive)
@@ -62,6 +82,23 @@ def extract_market_features(property_record: Dict[str, Any]) -> Dict[str, Any]:
     features["market_segment_label"] = property_record.get("market_segment_label")
     features["locality_market_code"] = property_record.get("locality_market_code")
 
+    # --- Precomputed aggregates (engine lookup, declared values win) ---
+    aggregate_source: Optional[Dict[str, Any]] = None
+    if market_engine is not None:
+        aggregates = market_engine.get_aggregates(
+            cluster_id=property_record.get("geo_cluster_id"),
+            locality_code=property_record.get("locality_market_code"),
+        )
+        if aggregates is not None:
+            for name in ENGINE_FEATURES:
+                if features[name] is None:
+                    features[name] = aggregates[name]
+            aggregate_source = {
+                "area_type": aggregates["area_type"],
+                "area_id": aggregates["area_id"],
+                "window_end_day": aggregates["window_end_day"],
+            }
+
     # --- Feature metadata ---
     feature_payload = {
         "feature_group": "MARKET_TABULAR",
@@ -70,6 +107,9 @@ def extract_market_features(property_record: Dict[str, Any]) -> Dict[str, Any]:
         "features": features
     }
 
+    if market_engine is not None:
+        feature_payload["aggregate_source"] = aggregate_source
+
     feature_payload["feature_hash"] = _hash_payload(feature_payload)
 
     return feature_payload
@@ -31,8 +31,9 @@ GOVERNANCE GUARANTEES
 
 from __future__ import annotations
 
-import re
-from typing import Dict, List, Pattern, Any
+from typing import Dict, Iterable, List, Pattern, Any
+
+from feature_pipeline.text.phrase_matcher import PhraseMatcher
 
 
 class AmenityExtractionError(Exception):
@@ -70,34 +71,12 @@ class AmenityExtractor:
             )
 
         self.amenity_catalog = amenity_catalog
-        self._compiled_patterns = self._compile_patterns()
-
-    def _compile_patterns(self) -> Dict[str, Pattern[str]]:
-        """
-        Compile amenity phrases into regex patterns.
-
-        Governance Rules
-        ----------------
-        - Literal matching only
-        - Escaped phrases
-        - Word-boundary matching
-        - Case-insensitive
-        """
-        compiled: Dict[str, Pattern[str]] = {}
-
-        for category, phrases in self.amenity_catalog.items():
-            if not phrases:
-                continue
-
-            escaped_phrases = [re.escape(p) for p in phrases]
-            pattern_str = r"\b(" + "|".join(escaped_phrases) + r")\b"
-
-            compiled[category] = re.compile(
-                pattern_str,
-                flags=re.IGNORECASE | re.UNICODE
-            )
-
-        return compiled
+        # Literal, escaped, word-boundary, case-insensitive matching;
+        # all categories resolved from one scan per text
+        self._matcher = PhraseMatcher(amenity_catalog, result_key="amenity")
+        self._compiled_patterns: Dict[str, Pattern[str]] = (
+            self._matcher.category_patterns
+        )
 
     def extract(self, text: str) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -129,24 +108,19 @@ class AmenityExtractor:
                 f"Input text must be str, got {type(text).__name__}"
             )
 
-        results: Dict[str, List[Dict[str, Any]]] = {}
-
-        for category, pattern in self._compiled_patterns.items():
-            matches: List[Dict[str, Any]] = []
+        return self._matcher.find(text)
 
-            for match in pattern.finditer(text):
-                matches.append(
-                    {
-                        "amenity": match.group(0),
-                        "start": match.start(),
-                        "end": match.end(),
-                    }
-                )
-
-            if matches:
-                results[category] = matches
+    def extract_batch(
+        self,
+        texts: Iterable[str],
+    ) -> List[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Extract from many texts with the same compiled catalog.
 
-        return results
+        Returns one result per input text, in input order (same format
+        as `extract`).
+        """
+        return [self.extract(text) for text in texts]
 
 
 def extract_amenities(
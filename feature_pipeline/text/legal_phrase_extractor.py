@@ -37,8 +37,9 @@ Governance & Audit
 
 from __future__ import annotations
 
-import re
-from typing import Dict, List, Pattern, Any
+from typing import Dict, Iterable, List, Pattern, Any
+
+from feature_pipeline.text.phrase_matcher import PhraseMatcher
 
 
 class LegalPhraseExtractionError(Exception):
@@ -81,33 +82,12 @@ class LegalPhraseExtractor:
             )
 
         self.phrase_patterns = phrase_patterns
-        self._compiled_patterns = self._compile_patterns()
-
-    def _compile_patterns(self) -> Dict[str, Pattern[str]]:
-        """
-        Compile literal phrases into regex patterns.
-
-        Governance Rules
-        ----------------
-        - Escape all phrases
-        - Word-boundary matching
-        - Case-insensitive only
-        """
-        compiled: Dict[str, Pattern[str]] = {}
-
-        for category, phrases in self.phrase_patterns.items():
-            if not phrases:
-                continue
-
-            escaped = [re.escape(p) for p in phrases]
-            pattern_str = r"\b(" + "|".join(escaped) + r")\b"
-
-            compiled[category] = re.compile(
-                pattern_str,
-                flags=re.IGNORECASE | re.UNICODE
-            )
-
-        return compiled
+        # Literal, escaped, word-boundary, case-insensitive matching;
+        # all categories resolved from one scan per text
+        self._matcher = PhraseMatcher(phrase_patterns, result_key="phrase")
+        self._compiled_patterns: Dict[str, Pattern[str]] = (
+            self._matcher.category_patterns
+        )
 
     def extract(self, text: str) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -139,24 +119,19 @@ class LegalPhraseExtractor:
                 f"Input text must be str, got {type(text).__name__}"
             )
 
-        results: Dict[str, List[Dict[str, Any]]] = {}
-
-        for category, pattern in self._compiled_patterns.items():
-            matches: List[Dict[str, Any]] = []
-
-            for match in pattern.finditer(text):
-                matches.append(
-                    {
-                        "phrase": match.group(0),
-                        "start": match.start(),
-                        "end": match.end(),
-                    }
-                )
+        return self._matcher.find(text)
 
-            if matches:
-                results[category] = matches
+    def extract_batch(
+        self,
+        texts: Iterable[str],
+    ) -> List[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Extract from many texts with the same compiled catalog.
 
-        return results
+        Returns one result per input text, in input order (same format
+        as `extract`).
+        """
+        return [self.extract(text) for text in texts]
 
 
 def extract_legal_phrases(
@@ -0,0 +1,195 @@
+"""
+feature_pipeline/text/phrase_matcher.py
+
+ROLE (MASTER_SPEC COMPLIANT)
+----------------------------
+Shared literal phrase matcher for catalog-driven text extractors:
+- AmenityExtractor
+- LegalPhraseExtractor
+
+Matching rules (unchanged from the per-category extractors)
+-----------------------------------------------------------
+- Literal matching only (escaped phrases)
+- Word-boundary matching
+- Case-insensitive
+- Within a category: leftmost match, phrases tried in catalog order,
+  non-overlapping (identical to `finditer` on the category regex)
+- Across categories: matches are independent and may overlap
+
+Single-pass design
+------------------
+One scanner regex (a zero-width lookahead over a prefix trie of all
+phrases) finds every position where any catalog phrase starts, in a
+single C-level pass over the text. Category regexes are then anchored
+only at those candidate positions, and only for categories with a
+phrase starting with the candidate character (resolved once per
+distinct character with the same case-insensitive rules), instead of
+scanning the whole text once per category.
+
+ABSOLUTE PROHIBITIONS
+---------------------
+- No synonym expansion
+- No semantic interpretation
+- No scoring / weighting
+
+GOVERNANCE GUARANTEES
+--------------------
+- Deterministic
+- Rule-based
+- No ML / No LLM
+- Output identical to per-category regex scanning
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Pattern, Sequence, Tuple
+
+
+_FLAGS = re.IGNORECASE | re.UNICODE
+
+
+class PhraseMatcher:
+    """
+    Compiled multi-category phrase matcher, built once per catalog.
+    """
+
+    def __init__(self, catalog: Mapping[str, Sequence[str]], result_key: str) -> None:
+        """
+        Parameters
+        ----------
+        catalog : Mapping[str, Sequence[str]]
+            Category -> literal phrases (categories without phrases are skipped)
+        result_key : str
+            Key holding the matched text in each result entry
+            (e.g. "amenity", "phrase")
+        """
+        self.result_key = result_key
+        self.category_patterns: Dict[str, Pattern[str]] = {}
+
+        # (category, anchored pattern, needs full scan)
+        self._categories: List[Tuple[str, Pattern[str], bool]] = []
+        self._first_chars: List[Optional[Pattern[str]]] = []
+        self._by_first_char: Dict[str, Tuple[int, ...]] = {}
+        trie: Dict[str, Any] = {}
+
+        for category, phrases in catalog.items():
+            if not phrases:
+                continue
+
+            escaped = [re.escape(p) for p in phrases]
+            pattern = re.compile(r"\b(" + "|".join(escaped) + r")\b", flags=_FLAGS)
+            self.category_patterns[category] = pattern
+
+            # Empty phrases produce empty matches, whose finditer
+            # semantics are kept by scanning that category directly
+            self._categories.append((category, pattern, "" in phrases))
+            first_chars = "".join(re.escape(p[0]) for p in phrases if p)
+            self._first_chars.append(
+                re.compile("[" + first_chars + "]", flags=_FLAGS) if first_chars else None
+            )
+            for phrase in phrases:
+                _trie_insert(trie, phrase)
+
+        self._scanner: Pattern[str] = re.compile(
+            r"\b(?=" + _trie_regex(trie) + r")",
+            flags=_FLAGS,
+        )
+
+    def find(self, text: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        All category matches in `text`:
+        {category: [{result_key: str, "start": int, "end": int}]},
+        categories in catalog order, only those with matches.
+        """
+        starts = [m.start() for m in self._scanner.finditer(text)]
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        if not starts:
+            return results
+
+        # Candidate starts per category, in ascending order
+        candidates: List[List[int]] = [[] for _ in self._categories]
+        for start in starts:
+            for index in self._categories_starting_with(text[start:start + 1]):
+                candidates[index].append(start)
+
+        key = self.result_key
+        for (category, pattern, full_scan), category_starts in zip(
+            self._categories, candidates
+        ):
+            if full_scan:
+                found = pattern.finditer(text)
+            elif category_starts:
+                found = _anchored_matches(pattern, text, category_starts)
+            else:
+                continue
+
+            matches = [
+                {key: match.group(0), "start": match.start(), "end": match.end()}
+                for match in found
+            ]
+            if matches:
+                results[category] = matches
+
+        return results
+
+    def find_batch(self, texts: Iterable[str]) -> List[Dict[str, List[Dict[str, Any]]]]:
+        return [self.find(text) for text in texts]
+
+    def _categories_starting_with(self, char: str) -> Tuple[int, ...]:
+        indices = self._by_first_char.get(char)
+        if indices is None:
+            indices = tuple(
+                index
+                for index, first_chars in enumerate(self._first_chars)
+                if first_chars is not None and first_chars.match(char)
+            )
+            self._by_first_char[char] = indices
+        return indices
+
+
+def _anchored_matches(pattern: Pattern[str], text: str, starts: List[int]):
+    """
+    finditer-equivalent matches of a category pattern, tried only at
+    candidate start positions (ascending).
+    """
+    cursor = 0
+    for start in starts:
+        if start < cursor:
+            continue
+        match = pattern.match(text, start)
+        if match is not None:
+            cursor = match.end()
+            yield match
+
+
+# =========================================================
+# SCANNER TRIE
+# =========================================================
+
+_END = ""
+
+
+def _trie_insert(trie: Dict[str, Any], phrase: str) -> None:
+    node = trie
+    for char in phrase:
+        # Characters equal under simple lowercasing share a branch
+        # (re.IGNORECASE compares exactly those); others stay distinct
+        lowered = char.lower()
+        key = lowered if len(lowered) == 1 else char
+        node = node.setdefault(key, {})
+    node[_END] = {}
+
+
+def _trie_regex(node: Dict[str, Any]) -> str:
+    """
+    Regex matching any phrase in the trie as a prefix. A phrase ending
+    at a node already proves a phrase starts here, so deeper branches
+    are pruned.
+    """
+    if _END in node:
+        return ""
+    branches = [re.escape(key) + _trie_regex(child) for key, child in node.items()]
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
@@ -19,10 +19,19 @@ ABSOLUTE PROHIBITIONS
 
 Embedding output is a DESCRIPTIVE REPRESENTATION ONLY.
 
+HASH VERSIONS
+-------------
+- "sha256-v1": token bucket = SHA-256(token) mod dimension (original)
+- "crc32-v2":  token bucket = CRC-32(token) mod dimension
+  (fast, stable, non-cryptographic; used for bulk embedding)
+
+Vectors from different hash versions are NOT comparable; the version
+is recorded with every embedding.
+
 GOVERNANCE GUARANTEES
 --------------------
 - Deterministic
-- Stateless
+- Stateless (the token -> bucket cache is pure memoization)
 - No training
 - No external model calls
 - Fully reproducible
@@ -30,8 +39,27 @@ GOVERNANCE GUARANTEES
 
 from __future__ import annotations
 
+from array import array
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Union
 import hashlib
-from typing import List, Dict
+import zlib
+
+import numpy as np
+from scipy import sparse
+
+
+HASH_SHA256_V1 = "sha256-v1"
+HASH_CRC32_V2 = "crc32-v2"
+
+SUPPORTED_HASH_VERSIONS = (HASH_SHA256_V1, HASH_CRC32_V2)
+
+# Token -> bucket cache size (covers the listing vocabulary)
+DEFAULT_TOKEN_CACHE_SIZE = 1 << 18
+
+# Rows per block in embed_batch (bounds the per-token scratch buffers)
+DEFAULT_BATCH_CHUNK_ROWS = 4096
 
 
 class TextEmbeddingError(Exception):
@@ -50,22 +78,45 @@ class HashingTextEmbedder:
     - Suitable for governance-heavy systems
     """
 
-    def __init__(self, dimension: int = 128):
+    def __init__(
+        self,
+        dimension: int = 128,
+        hash_version: str = HASH_SHA256_V1,
+        token_cache_size: int = DEFAULT_TOKEN_CACHE_SIZE,
+    ):
         """
         Parameters
         ----------
         dimension : int
             Fixed embedding vector size.
+        hash_version : str
+            Token hash ("sha256-v1" or "crc32-v2").
+        token_cache_size : int
+            Bounded LRU size of the token -> bucket cache (0 disables it).
 
         Governance:
         -----------
         - Must be explicitly configured
-        - Changing dimension requires version bump
+        - Changing dimension or hash_version requires version bump
         """
         if dimension <= 0:
             raise TextEmbeddingError("dimension must be > 0")
 
+        if hash_version not in SUPPORTED_HASH_VERSIONS:
+            raise TextEmbeddingError(
+                f"Unsupported hash_version: {hash_version}"
+            )
+
+        if token_cache_size < 0:
+            raise TextEmbeddingError("token_cache_size must be >= 0")
+
         self.dimension = dimension
+        self.hash_version = hash_version
+        self._bucket = (
+            lru_cache(maxsize=token_cache_size)(self._bucket_uncached)
+            if token_cache_size
+            else self._bucket_uncached
+        )
 
     def _tokenize(self, text: str) -> List[str]:
         """
@@ -81,11 +132,16 @@ class HashingTextEmbedder:
 
     def _hash_token(self, token: str) -> int:
         """
-        Hash token deterministically using SHA-256.
+        Hash token deterministically (SHA-256 or CRC-32, per hash_version).
         """
+        if self.hash_version == HASH_CRC32_V2:
+            return zlib.crc32(token.encode("utf-8"))
         digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
         return int(digest, 16)
 
+    def _bucket_uncached(self, token: str) -> int:
+        return self._hash_token(token) % self.dimension
+
     def embed(self, text: str) -> List[int]:
         """
         Generate text embedding vector.
@@ -112,15 +168,110 @@ class HashingTextEmbedder:
         tokens = self._tokenize(text)
 
         for token in tokens:
-            idx = self._hash_token(token) % self.dimension
-            vector[idx] += 1
+            vector[self._bucket(token)] += 1
 
         return vector
 
+    def embed_batch(
+        self,
+        texts: Iterable[str],
+        output: str = "csr",
+        chunk_rows: int = DEFAULT_BATCH_CHUNK_ROWS,
+    ) -> Union[sparse.csr_matrix, np.ndarray]:
+        """
+        Embed many texts into one count matrix.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            Pre-cleaned text inputs.
+        output : str
+            "csr" -> scipy.sparse.csr_matrix (N, dimension), int32
+            "dense" -> np.ndarray (N, dimension), int32
+        chunk_rows : int
+            Texts per block. Token buckets of one block are collected
+            in a compact array and reduced to a count block before the
+            next block starts; blocks are stacked at the end.
+
+        Row i equals embed(texts[i]).
+        """
+        if output not in ("csr", "dense"):
+            raise TextEmbeddingError(f"Unsupported output: {output}")
+
+        if chunk_rows <= 0:
+            raise TextEmbeddingError("chunk_rows must be > 0")
+
+        blocks = [
+            self._count_block(chunk, output)
+            for chunk in _chunks(iter(texts), chunk_rows)
+        ]
+
+        if output == "dense":
+            if not blocks:
+                return np.zeros((0, self.dimension), dtype=np.int32)
+            return np.vstack(blocks)
+
+        if not blocks:
+            return sparse.csr_matrix((0, self.dimension), dtype=np.int32)
+        return sparse.vstack(blocks, format="csr", dtype=np.int32)
+
+    def _count_block(
+        self,
+        texts: List[str],
+        output: str,
+    ) -> Union[sparse.csr_matrix, np.ndarray]:
+        bucket = self._bucket
+        indptr = array("q", [0])
+        indices = array("q")
+
+        for text in texts:
+            if text is None:
+                raise TextEmbeddingError("Input text must not be None")
+
+            if not isinstance(text, str):
+                raise TextEmbeddingError(
+                    f"Input text must be str, got {type(text).__name__}"
+                )
+
+            indices.extend(map(bucket, text.lower().split()))
+            indptr.append(len(indices))
+
+        n_rows = len(texts)
+        cols = np.asarray(indices, dtype=np.int64)
+        row_ptr = np.asarray(indptr, dtype=np.int64)
+
+        if output == "dense":
+            rows = np.repeat(np.arange(n_rows, dtype=np.int64), np.diff(row_ptr))
+            counts = np.bincount(
+                rows * self.dimension + cols,
+                minlength=n_rows * self.dimension,
+            )
+            return counts.astype(np.int32).reshape(n_rows, self.dimension)
+
+        block = sparse.csr_matrix(
+            (np.ones(cols.size, dtype=np.int32), cols, row_ptr),
+            shape=(n_rows, self.dimension),
+        )
+        block.sum_duplicates()
+        return block
+
+    def cache_info(self):
+        """Token -> bucket cache statistics (None when disabled)."""
+        return self._bucket.cache_info() if hasattr(self._bucket, "cache_info") else None
+
+
+def _chunks(items: Iterator[str], size: int) -> Iterator[List[str]]:
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
 
 def generate_text_embedding(
     text: str,
     dimension: int = 128,
+    hash_version: str = HASH_SHA256_V1,
 ) -> Dict[str, object]:
     """
     Functional wrapper for text embedding generation.
@@ -146,13 +297,19 @@ def generate_text_embedding(
             "embedding": List[int],
             "dimension": int,
             "method": "hashing",
+            "hash_version": str,
         }
     """
-    embedder = HashingTextEmbedder(dimension=dimension)
+    embedder = HashingTextEmbedder(
+        dimension=dimension,
+        hash_version=hash_version,
+        token_cache_size=0,
+    )
     embedding = embedder.embed(text)
 
     return {
         "embedding": embedding,
         "dimension": dimension,
         "method": "hashing",
+        "hash_version": hash_version,
     }
@@ -18,6 +18,7 @@ COMPLIANCE:
     IMPLEMENTATION STATUS – LISTING INTELLIGENCE
 """
 
+from itertools import islice
 from typing import Dict, Any, List
 import re
 
@@ -83,30 +84,49 @@ def detect_clickbait(
         }
     """
 
-    findings: Dict[str, Any] = {}
-    evidence_refs: List[str] = []
-
     title_text = (title or "").lower()
     desc_text = (description or "").lower()
 
+    return _build_clickbait_signal(
+        title_text=title_text,
+        desc_text=desc_text,
+        clickbait_hits=_match_phrases(title_text, CLICKBAIT_PHRASES),
+        absolute_hits=_match_phrases(desc_text, ABSOLUTE_CLAIMS),
+        urgency_hits=_match_phrases(title_text, URGENCY_MARKERS),
+    )
+
+
+def _build_clickbait_signal(
+    *,
+    title_text: str,
+    desc_text: str,
+    clickbait_hits: List[str],
+    absolute_hits: List[str],
+    urgency_hits: List[str],
+) -> Dict[str, Any]:
+    """
+    Signal synthesis from lowercased texts and phrase hits
+    (shared with the content-analysis runner).
+    """
+
+    findings: Dict[str, Any] = {}
+    evidence_refs: List[str] = []
+
     # -----------------------------------------------------------------
     # 1. Clickbait phrase detection
     # -----------------------------------------------------------------
-    clickbait_hits = _match_phrases(title_text, CLICKBAIT_PHRASES)
     if clickbait_hits:
         findings["clickbait_phrases_in_title"] = clickbait_hits
 
     # -----------------------------------------------------------------
     # 2. Absolute / unverifiable claims
     # -----------------------------------------------------------------
-    absolute_hits = _match_phrases(desc_text, ABSOLUTE_CLAIMS)
     if absolute_hits:
         findings["absolute_claims_in_description"] = absolute_hits
 
     # -----------------------------------------------------------------
     # 3. Urgency pressure language
     # -----------------------------------------------------------------
-    urgency_hits = _match_phrases(title_text, URGENCY_MARKERS)
     if urgency_hits:
         findings["urgency_language"] = urgency_hits
 
@@ -155,9 +175,12 @@ def _match_phrases(text: str, phrases: List[str]) -> List[str]:
     return hits
 
 
+_KEYWORD_PATTERN = re.compile(r"\b\w{4,}\b")
+
+
 def _extract_keywords(text: str) -> List[str]:
-    tokens = re.findall(r"\b\w{4,}\b", text)
-    return tokens[:10]
+    # First 10 only: stop scanning once they are found
+    return [m.group(0) for m in islice(_KEYWORD_PATTERN.finditer(text), 10)]
 
 
 def _signal(
@@ -0,0 +1,214 @@
+# Module: listing_intelligence/content_analysis/content_analysis_runner.py
+# Part of Advanced AVM System
+
+# listing_intelligence/content_analysis/content_analysis_runner.py
+
+"""
+ROLE:
+    Shared Content-Analysis Runner
+
+    Runs the text content detectors over a listing in one pass:
+    - detect_clickbait
+    - detect_misleading_claims
+    - detect_copy_paste_content
+
+    - Title and description are lowercased / normalized ONCE
+    - All governance vocabularies are merged into one phrase table
+      (each distinct phrase is searched once per text, even when
+      several detectors share it)
+    - Batch execution reuses the compiled table and the fingerprint
+      set across listings
+
+    Output per listing is exactly the per-detector signal dicts.
+
+GOVERNANCE:
+    - Rule-based only
+    - No ML / No NLP inference
+    - Signal-only output
+    - No aggregation or decision across detectors
+
+COMPLIANCE:
+    MASTER_SPEC.md
+    IMPLEMENTATION STATUS – LISTING INTELLIGENCE
+"""
+
+from typing import Dict, Any, Collection, Iterable, List, Mapping, Optional, Sequence, Set
+
+from listing_intelligence.content_analysis.clickbait_detector import (
+    ABSOLUTE_CLAIMS,
+    CLICKBAIT_PHRASES,
+    URGENCY_MARKERS,
+    _build_clickbait_signal,
+)
+from listing_intelligence.content_analysis.copy_paste_detector import (
+    DEFAULT_NEAR_DUPLICATE_MAX_RESULTS,
+    _build_copy_paste_signal,
+    _fingerprint_set,
+    _normalize_lowered,
+    detect_copy_paste_content,
+)
+from listing_intelligence.content_analysis.misleading_claims import (
+    ABSOLUTE_MODIFIERS,
+    DECLARATIVE_PATTERNS,
+    _build_misleading_claims_signal,
+    detect_misleading_claims,
+)
+
+
+class ContentAnalysisRunner:
+    """
+    Single-pass runner for the content-analysis detectors.
+
+    This class MUST NOT:
+    - combine detector outputs into a score
+    - decide listing status
+    """
+
+    def __init__(
+        self,
+        *,
+        near_duplicate_threshold: float = 0.8,
+        near_duplicate_max_results: int = DEFAULT_NEAR_DUPLICATE_MAX_RESULTS,
+    ) -> None:
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.near_duplicate_max_results = near_duplicate_max_results
+
+        # Phrases searched in the title / description, deduplicated
+        self._title_phrases = _distinct(CLICKBAIT_PHRASES, URGENCY_MARKERS)
+        self._description_phrases = _distinct(
+            ABSOLUTE_CLAIMS,
+            *DECLARATIVE_PATTERNS.values(),
+            ABSOLUTE_MODIFIERS,
+        )
+
+    def analyze(
+        self,
+        *,
+        title: str | None,
+        description: str | None,
+        declared_facts: Dict[str, Any] | None = None,
+        listing_id: str | None = None,
+        historical_fingerprints: Collection[str] | None = None,
+        near_duplicate_index: Optional[Any] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run all content detectors on one listing.
+
+        OUTPUT (signal only):
+            {
+                "clickbait": {...},
+                "misleading_claims": {...},
+                "copy_paste": {...}
+            }
+        """
+        title_text = (title or "").lower()
+        desc_text = (description or "").lower()
+
+        title_found = _present(title_text, self._title_phrases)
+        desc_found = _present(desc_text, self._description_phrases)
+
+        clickbait = _build_clickbait_signal(
+            title_text=title_text,
+            desc_text=desc_text,
+            clickbait_hits=_hits(CLICKBAIT_PHRASES, title_found),
+            absolute_hits=_hits(ABSOLUTE_CLAIMS, desc_found),
+            urgency_hits=_hits(URGENCY_MARKERS, title_found),
+        )
+
+        if not description:
+            misleading = detect_misleading_claims(
+                description=description,
+                declared_facts=declared_facts,
+            )
+            copy_paste = detect_copy_paste_content(description=description)
+        else:
+            misleading = _build_misleading_claims_signal(
+                category_hits={
+                    category: _hits(patterns, desc_found)
+                    for category, patterns in DECLARATIVE_PATTERNS.items()
+                },
+                abs_hits=_hits(ABSOLUTE_MODIFIERS, desc_found),
+                declared_facts=declared_facts,
+            )
+            copy_paste = _build_copy_paste_signal(
+                normalized_text=_normalize_lowered(desc_text),
+                historical_fingerprints=_fingerprint_set(historical_fingerprints),
+                near_duplicate_index=near_duplicate_index,
+                listing_id=listing_id,
+                near_duplicate_threshold=self.near_duplicate_threshold,
+                near_duplicate_max_results=self.near_duplicate_max_results,
+            )
+
+        return {
+            "clickbait": clickbait,
+            "misleading_claims": misleading,
+            "copy_paste": copy_paste,
+        }
+
+    def analyze_batch(
+        self,
+        listings: Iterable[Mapping[str, Any]],
+        *,
+        historical_fingerprints: Collection[str] | None = None,
+        near_duplicate_index: Optional[Any] = None,
+    ) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Run all content detectors on many listings.
+
+        Each listing mapping may carry "title", "description",
+        "declared_facts" and "listing_id". Results are in input order.
+        """
+        historical_fingerprints = _fingerprint_set(historical_fingerprints)
+
+        return [
+            self.analyze(
+                title=listing.get("title"),
+                description=listing.get("description"),
+                declared_facts=listing.get("declared_facts"),
+                listing_id=listing.get("listing_id"),
+                historical_fingerprints=historical_fingerprints,
+                near_duplicate_index=near_duplicate_index,
+            )
+            for listing in listings
+        ]
+
+
+def run_content_analysis_batch(
+    listings: Iterable[Mapping[str, Any]],
+    *,
+    historical_fingerprints: Collection[str] | None = None,
+    near_duplicate_index: Optional[Any] = None,
+    near_duplicate_threshold: float = 0.8,
+    near_duplicate_max_results: int = DEFAULT_NEAR_DUPLICATE_MAX_RESULTS,
+) -> List[Dict[str, Dict[str, Any]]]:
+    """
+    Functional wrapper for batch content analysis.
+    """
+    runner = ContentAnalysisRunner(
+        near_duplicate_threshold=near_duplicate_threshold,
+        near_duplicate_max_results=near_duplicate_max_results,
+    )
+    return runner.analyze_batch(
+        listings,
+        historical_fingerprints=historical_fingerprints,
+        near_duplicate_index=near_duplicate_index,
+    )
+
+
+# ---------------------------------------------------------------------
+# Internal helpers (pure, deterministic)
+# ---------------------------------------------------------------------
+
+def _distinct(*phrase_lists: Sequence[str]) -> List[str]:
+    return list(dict.fromkeys(p for phrases in phrase_lists for p in phrases))
+
+
+def _present(text: str, phrases: List[str]) -> Set[str]:
+    return {p for p in phrases if p in text}
+
+
+def _hits(phrases: Sequence[str], found: Set[str]) -> List[str]:
+    """
+    Matched phrases in vocabulary order (same as the detectors).
+    """
+    return [p for p in phrases if p in found]
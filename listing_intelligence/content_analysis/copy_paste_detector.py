@@ -17,11 +17,17 @@ COMPLIANCE:
     IMPLEMENTATION STATUS – LISTING INTELLIGENCE
 """
 
-from typing import Dict, Any, List
+from collections import Counter
+from typing import Dict, Any, List, Collection, Optional
 import hashlib
 import re
 
 
+# Cap on near-duplicate matches reported per listing (a widely reused
+# template must not put thousands of listing ids into the findings)
+DEFAULT_NEAR_DUPLICATE_MAX_RESULTS = 20
+
+
 # ---------------------------------------------------------------------
 # Public detector API
 # ---------------------------------------------------------------------
@@ -29,14 +35,23 @@ import re
 def detect_copy_paste_content(
     *,
     description: str | None,
-    historical_fingerprints: List[str] | None = None,
+    historical_fingerprints: Collection[str] | None = None,
+    near_duplicate_index: Optional[Any] = None,
+    listing_id: str | None = None,
+    near_duplicate_threshold: float = 0.8,
+    near_duplicate_max_results: int = DEFAULT_NEAR_DUPLICATE_MAX_RESULTS,
 ) -> Dict[str, Any]:
     """
     Detect copy–paste or templated content patterns.
 
     INPUT (read-only):
         description
-        historical_fingerprints (optional, pre-approved store)
+        historical_fingerprints (optional, pre-approved store; any
+            collection, converted to a set once per call)
+        near_duplicate_index (optional NearDuplicateIndex over
+            historical descriptions; listing_id excludes the listing
+            itself; at most near_duplicate_max_results near matches
+            are reported)
 
     OUTPUT (signal only):
         {
@@ -47,7 +62,6 @@ def detect_copy_paste_content(
         }
     """
 
-    findings: Dict[str, Any] = {}
     evidence_refs: List[str] = []
 
     if not description:
@@ -58,17 +72,76 @@ def detect_copy_paste_content(
             evidence_refs=evidence_refs,
         )
 
-    normalized_text = _normalize_text(description)
+    return _build_copy_paste_signal(
+        normalized_text=_normalize_text(description),
+        historical_fingerprints=_fingerprint_set(historical_fingerprints),
+        near_duplicate_index=near_duplicate_index,
+        listing_id=listing_id,
+        near_duplicate_threshold=near_duplicate_threshold,
+        near_duplicate_max_results=near_duplicate_max_results,
+    )
+
+
+def _build_copy_paste_signal(
+    *,
+    normalized_text: str,
+    historical_fingerprints: Collection[str] | None,
+    near_duplicate_index: Optional[Any],
+    listing_id: str | None,
+    near_duplicate_threshold: float,
+    near_duplicate_max_results: int = DEFAULT_NEAR_DUPLICATE_MAX_RESULTS,
+) -> Dict[str, Any]:
+    """
+    Signal synthesis from normalized description text
+    (shared with the content-analysis runner).
+
+    historical_fingerprints must already support O(1) membership
+    (see _fingerprint_set).
+    """
+
+    findings: Dict[str, Any] = {}
+    evidence_refs: List[str] = []
+
     fingerprint = _hash_text(normalized_text)
 
     # -----------------------------------------------------------------
-    # 1. Exact fingerprint reuse
+    # 1. Exact fingerprint reuse (the index never matches empty
+    #    normalized text, e.g. a punctuation-only description)
     # -----------------------------------------------------------------
-    if historical_fingerprints and fingerprint in historical_fingerprints:
+    exact_reuse = bool(historical_fingerprints) and fingerprint in historical_fingerprints
+    if not exact_reuse and normalized_text and near_duplicate_index is not None:
+        exact_reuse = near_duplicate_index.has_fingerprint(fingerprint, exclude_id=listing_id)
+
+    near_matches = []
+    if near_duplicate_index is not None:
+        near_matches = near_duplicate_index.query_normalized(
+            normalized_text,
+            min_jaccard=near_duplicate_threshold,
+            exclude_id=listing_id,
+            max_results=near_duplicate_max_results,
+            include_exact=False,
+        )
+
+    if exact_reuse:
         findings["exact_content_reuse_detected"] = {
             "fingerprint": fingerprint
         }
 
+    # -----------------------------------------------------------------
+    # 1b. Near-duplicate reuse (small edits, MinHash estimate)
+    # -----------------------------------------------------------------
+    if near_matches:
+        findings["near_duplicate_content_detected"] = {
+            "threshold": near_duplicate_threshold,
+            "matches": [
+                {
+                    "listing_id": match.listing_id,
+                    "estimated_jaccard": match.estimated_jaccard,
+                }
+                for match in near_matches
+            ],
+        }
+
     # -----------------------------------------------------------------
     # 2. Low lexical diversity (template-like text)
     # -----------------------------------------------------------------
@@ -112,10 +185,30 @@ def detect_copy_paste_content(
 # Internal helpers (pure, deterministic)
 # ---------------------------------------------------------------------
 
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+
+
+def _fingerprint_set(
+    historical_fingerprints: Collection[str] | None,
+) -> Collection[str] | None:
+    """
+    Hashed view of a fingerprint store (sets / dicts pass through).
+    """
+    if historical_fingerprints and not isinstance(
+        historical_fingerprints, (set, frozenset, dict)
+    ):
+        return set(historical_fingerprints)
+    return historical_fingerprints
+
+
 def _normalize_text(text: str) -> str:
-    text = text.lower()
-    text = re.sub(r"\s+", " ", text)
-    text = re.sub(r"[^\w\s]", "", text)
+    return _normalize_lowered(text.lower())
+
+
+def _normalize_lowered(text: str) -> str:
+    text = _WHITESPACE_PATTERN.sub(" ", text)
+    text = _PUNCTUATION_PATTERN.sub("", text)
     return text.strip()
 
 
@@ -125,17 +218,16 @@ def _hash_text(text: str) -> str:
 
 def _detect_repeated_phrases(text: str, window: int = 4) -> List[str]:
     tokens = text.split()
-    seen = {}
-    repeats = []
 
-    for i in range(len(tokens) - window + 1):
-        phrase = " ".join(tokens[i:i + window])
-        seen[phrase] = seen.get(phrase, 0) + 1
+    # Token tuples as keys (tokens contain no spaces, so joining is
+    # one-to-one); counts keep first-occurrence order
+    seen = Counter(zip(*(tokens[offset:] for offset in range(window))))
 
+    repeats = []
     for phrase, count in seen.items():
         if count >= 3:
             repeats.append({
-                "phrase": phrase,
+                "phrase": " ".join(phrase),
                 "count": count,
             })
 
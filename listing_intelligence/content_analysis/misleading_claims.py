@@ -86,7 +86,6 @@ def detect_misleading_claims(
         }
     """
 
-    findings: Dict[str, Any] = {}
     evidence_refs: List[str] = []
 
     if not description:
@@ -99,18 +98,40 @@ def detect_misleading_claims(
 
     text = description.lower()
 
+    return _build_misleading_claims_signal(
+        category_hits={
+            category: _match_patterns(text, patterns)
+            for category, patterns in DECLARATIVE_PATTERNS.items()
+        },
+        abs_hits=_match_patterns(text, ABSOLUTE_MODIFIERS),
+        declared_facts=declared_facts,
+    )
+
+
+def _build_misleading_claims_signal(
+    *,
+    category_hits: Dict[str, List[str]],
+    abs_hits: List[str],
+    declared_facts: Dict[str, Any] | None,
+) -> Dict[str, Any]:
+    """
+    Signal synthesis from per-category pattern hits
+    (shared with the content-analysis runner).
+    """
+
+    findings: Dict[str, Any] = {}
+    evidence_refs: List[str] = []
+
     # -----------------------------------------------------------------
     # 1. Detect declarative claims by category
     # -----------------------------------------------------------------
-    for category, patterns in DECLARATIVE_PATTERNS.items():
-        hits = _match_patterns(text, patterns)
+    for category, hits in category_hits.items():
         if hits:
             findings[f"{category}_claims_detected"] = hits
 
     # -----------------------------------------------------------------
     # 2. Absolute modifier amplification
     # -----------------------------------------------------------------
-    abs_hits = _match_patterns(text, ABSOLUTE_MODIFIERS)
     if abs_hits:
         findings["absolute_modifiers_used"] = abs_hits
 
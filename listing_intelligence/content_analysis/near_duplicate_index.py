@@ -0,0 +1,271 @@
+# Module: listing_intelligence/content_analysis/near_duplicate_index.py
+# Part of Advanced AVM System
+
+# listing_intelligence/content_analysis/near_duplicate_index.py
+
+"""
+ROLE:
+    Near-Duplicate Description Index (copy-paste signal input)
+
+    - Exact reuse: normalized-text fingerprint -> listing ids (hash index)
+    - Near reuse: MinHash signatures over word shingles, bucketed by an
+      LSH band index, so lookups only compare listings that share at
+      least one band (sublinear in corpus size)
+    - Incremental: listings are added / replaced / removed as ingested
+    - Descriptions that normalize to empty text (e.g. punctuation only)
+      are tracked but never fingerprinted, bucketed or matched
+
+    Jaccard similarity of shingle sets is ESTIMATED from signatures
+    (standard error ~ 1 / sqrt(num_perm)).
+
+GOVERNANCE:
+    - Rule-based only (deterministic hashing, fixed seed)
+    - No ML / No embeddings
+    - Descriptive similarity only, no fraud conclusion
+    - Signal-input only
+
+COMPLIANCE:
+    MASTER_SPEC.md
+    IMPLEMENTATION STATUS – LISTING INTELLIGENCE
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import hashlib
+
+import numpy as np
+
+from listing_intelligence.content_analysis.copy_paste_detector import (
+    _hash_text,
+    _normalize_text,
+)
+
+
+# Largest prime below 2^32: (a * x + b) stays exact in uint64
+_HASH_PRIME = np.uint64(4294967291)
+
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 32
+DEFAULT_SHINGLE_SIZE = 3
+DEFAULT_SEED = 20240101
+
+
+@dataclass(frozen=True)
+class NearDuplicateMatch:
+    listing_id: str
+    estimated_jaccard: float
+    exact_match: bool
+
+
+class NearDuplicateIndex:
+    """
+    MinHash + LSH index over historical listing descriptions.
+
+    With `bands` bands of `num_perm / bands` rows, pairs with Jaccard
+    above roughly (1 / bands) ** (bands / num_perm) are likely to
+    become candidates (~0.42 with the defaults).
+    """
+
+    def __init__(
+        self,
+        *,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        seed: int = DEFAULT_SEED,
+    ) -> None:
+        if num_perm < 1 or bands < 1 or num_perm % bands:
+            raise ValueError("num_perm must be a positive multiple of bands")
+        if shingle_size < 1:
+            raise ValueError("shingle_size must be >= 1")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.shingle_size = shingle_size
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_HASH_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_HASH_PRIME), size=num_perm, dtype=np.uint64)
+
+        self._fingerprints: Dict[str, Set[str]] = {}
+        self._entries: Dict[str, Tuple[Optional[str], Optional[np.ndarray]]] = {}
+        self._buckets: List[Dict[bytes, Set[str]]] = [{} for _ in range(bands)]
+
+    # -----------------------------------------------------------------
+    # Ingestion
+    # -----------------------------------------------------------------
+
+    def add(self, listing_id: str, description: str) -> None:
+        """
+        Index a description (replaces any previous entry for listing_id).
+        """
+        if listing_id in self._entries:
+            self.remove(listing_id)
+
+        normalized = _normalize_text(description or "")
+        if not normalized:
+            self._entries[listing_id] = (None, None)
+            return
+
+        fingerprint = _hash_text(normalized)
+        signature = self.signature_normalized(normalized)
+
+        self._entries[listing_id] = (fingerprint, signature)
+        self._fingerprints.setdefault(fingerprint, set()).add(listing_id)
+        if signature is not None:
+            for band, key in enumerate(self._band_keys(signature)):
+                self._buckets[band].setdefault(key, set()).add(listing_id)
+
+    def add_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        for listing_id, description in items:
+            self.add(listing_id, description)
+
+    def remove(self, listing_id: str) -> None:
+        entry = self._entries.pop(listing_id, None)
+        if entry is None:
+            return
+
+        fingerprint, signature = entry
+        if fingerprint is not None:
+            _discard(self._fingerprints, fingerprint, listing_id)
+        if signature is not None:
+            for band, key in enumerate(self._band_keys(signature)):
+                _discard(self._buckets[band], key, listing_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, listing_id: object) -> bool:
+        return listing_id in self._entries
+
+    # -----------------------------------------------------------------
+    # Lookup
+    # -----------------------------------------------------------------
+
+    def has_fingerprint(self, fingerprint: str, exclude_id: Optional[str] = None) -> bool:
+        """
+        True if a listing other than exclude_id has this fingerprint.
+        """
+        members = self._fingerprints.get(fingerprint)
+        if not members:
+            return False
+        return exclude_id not in members or len(members) > 1
+
+    def query(
+        self,
+        description: str,
+        *,
+        min_jaccard: float = 0.8,
+        exclude_id: Optional[str] = None,
+        max_results: Optional[int] = None,
+        include_exact: bool = True,
+    ) -> List[NearDuplicateMatch]:
+        return self.query_normalized(
+            _normalize_text(description or ""),
+            min_jaccard=min_jaccard,
+            exclude_id=exclude_id,
+            max_results=max_results,
+            include_exact=include_exact,
+        )
+
+    def query_normalized(
+        self,
+        normalized_text: str,
+        *,
+        min_jaccard: float = 0.8,
+        exclude_id: Optional[str] = None,
+        max_results: Optional[int] = None,
+        include_exact: bool = True,
+    ) -> List[NearDuplicateMatch]:
+        """
+        Indexed listings whose estimated Jaccard similarity with the
+        (already normalized) text is >= min_jaccard, most similar first
+        (ties by listing id). Exact fingerprint matches are always
+        included, unless include_exact=False (near matches only; pair
+        with has_fingerprint). Empty text matches nothing.
+        """
+        if not normalized_text:
+            return []
+
+        fingerprint = _hash_text(normalized_text)
+        exact = self._fingerprints.get(fingerprint, set())
+        signature = self.signature_normalized(normalized_text)
+
+        candidates: Set[str] = set(exact)
+        if signature is not None:
+            for band, key in enumerate(self._band_keys(signature)):
+                candidates.update(self._buckets[band].get(key, ()))
+        candidates.discard(exclude_id)
+        if not include_exact:
+            candidates -= exact
+
+        matches: List[NearDuplicateMatch] = []
+        for listing_id in candidates:
+            is_exact = listing_id in exact
+            if is_exact:
+                similarity = 1.0
+            else:
+                similarity = float(np.mean(self._entries[listing_id][1] == signature))
+            if is_exact or similarity >= min_jaccard:
+                matches.append(
+                    NearDuplicateMatch(
+                        listing_id=listing_id,
+                        estimated_jaccard=round(similarity, 3),
+                        exact_match=is_exact,
+                    )
+                )
+
+        matches.sort(key=lambda m: (-m.estimated_jaccard, m.listing_id))
+        return matches if max_results is None else matches[:max_results]
+
+    # -----------------------------------------------------------------
+    # MinHash
+    # -----------------------------------------------------------------
+
+    def signature(self, description: str) -> Optional[np.ndarray]:
+        return self.signature_normalized(_normalize_text(description or ""))
+
+    def signature_normalized(self, normalized_text: str) -> Optional[np.ndarray]:
+        """
+        uint32 MinHash signature (num_perm,) of the word shingle set,
+        or None for empty text.
+        """
+        shingles = self._shingle_hashes(normalized_text)
+        if shingles.size == 0:
+            return None
+
+        values = (self._a[:, None] * shingles[None, :] + self._b[:, None]) % _HASH_PRIME
+        return values.min(axis=1).astype(np.uint32)
+
+    def _shingle_hashes(self, normalized_text: str) -> np.ndarray:
+        tokens = normalized_text.split()
+        size = min(self.shingle_size, len(tokens))
+        shingles = {
+            " ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)
+        } if size else set()
+
+        return np.fromiter(
+            (
+                int.from_bytes(
+                    hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "big"
+                )
+                for s in shingles
+            ),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        bands = signature.reshape(self.bands, self.rows_per_band)
+        return [band.tobytes() for band in bands]
+
+
+def _discard(index: Dict, key, listing_id: str) -> None:
+    members = index.get(key)
+    if members is None:
+        return
+    members.discard(listing_id)
+    if not members:
+        del index[key]
@@ -5,6 +5,10 @@ Duplicate / Reused Image Detection Signal
 Role:
 - Detect potential duplicate or reused images across listings
   using image fingerprint / perceptual hash similarity.
+- Generate perceptual hashes (aHash / dHash / pHash, 64 or 256 bits)
+  from grayscale pixels with NumPy.
+- Store reference corpora bit-packed in uint64 arrays and compare a
+  target against the whole corpus with one vectorized popcount.
 
 Governance:
 - Signal-only
@@ -19,10 +23,21 @@ Compliant with:
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Tuple
 import hashlib
 import json
 
+import numpy as np
+
+
+HASH_ALGORITHMS = ("ahash", "dhash", "phash")
+
+# hash_size -> bits: 8 -> 64, 16 -> 256
+SUPPORTED_HASH_SIZES = (8, 16)
+
+# pHash DCT input is hash_size * PHASH_OVERSAMPLE pixels per side
+PHASH_OVERSAMPLE = 4
+
 
 # =========================
 # Data Structures
@@ -34,6 +49,37 @@ class ImageFingerprint:
     fingerprint: str  # perceptual hash or stable fingerprint
 
 
+@dataclass(frozen=True)
+class PerceptualHash:
+    """
+    Perceptual hash as a fixed-width integer.
+
+    Bit i (row-major over the hash grid) is bit (n_bits - 1 - i) of
+    `value`; `words` holds the same bits as big-endian uint64 words.
+    """
+    algorithm: str
+    n_bits: int
+    value: int
+
+    @property
+    def words(self) -> Tuple[int, ...]:
+        n_words = self.n_bits // 64
+        return tuple(
+            (self.value >> (64 * (n_words - 1 - i))) & 0xFFFFFFFFFFFFFFFF
+            for i in range(n_words)
+        )
+
+    def hex(self) -> str:
+        return format(self.value, f"0{self.n_bits // 4}x")
+
+    def hamming_distance(self, other: "PerceptualHash") -> int:
+        _check_compatible(self, other)
+        return bin(self.value ^ other.value).count("1")
+
+    def similarity(self, other: "PerceptualHash") -> float:
+        return 1.0 - self.hamming_distance(other) / self.n_bits
+
+
 @dataclass(frozen=True)
 class DuplicateImageSignal:
     duplicate_probability: float  # descriptive, 0.0 – 1.0
@@ -72,6 +118,142 @@ def compute_signal_hash(payload: Dict[str, Any]) -> str:
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
+# =========================
+# Perceptual Hashing
+# =========================
+
+def compute_perceptual_hash(
+    image: Any,
+    algorithm: str = "phash",
+    hash_size: int = 8,
+) -> PerceptualHash:
+    """
+    Compute a perceptual hash from grayscale pixels.
+
+    image: 2D uint8 array, PIL image, or any object exposing a
+    grayscale `.gray` array (e.g. a shared image-loader result).
+
+    - ahash: area-resize to s x s, bit = pixel > mean
+    - dhash: area-resize to (s + 1) x s, bit = pixel > left neighbour
+    - phash: area-resize to 4s x 4s, 2D DCT-II, low-frequency s x s
+             block, bit = coefficient > median (DC term excluded
+             from the median)
+    """
+    if algorithm not in HASH_ALGORITHMS:
+        raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    if hash_size not in SUPPORTED_HASH_SIZES:
+        raise ValueError(f"hash_size must be one of {SUPPORTED_HASH_SIZES}")
+
+    gray = _as_gray(image)
+
+    if algorithm == "ahash":
+        pixels = _area_resize(gray, hash_size, hash_size)
+        bits = pixels > pixels.mean()
+    elif algorithm == "dhash":
+        pixels = _area_resize(gray, hash_size, hash_size + 1)
+        bits = pixels[:, 1:] > pixels[:, :-1]
+    else:
+        side = hash_size * PHASH_OVERSAMPLE
+        pixels = _area_resize(gray, side, side)
+        basis = _dct_matrix(side)
+        low = (basis @ pixels @ basis.T)[:hash_size, :hash_size]
+        median = np.median(low.ravel()[1:])
+        bits = low > median
+
+    return PerceptualHash(
+        algorithm=algorithm,
+        n_bits=hash_size * hash_size,
+        value=_bits_to_int(bits.ravel()),
+    )
+
+
+class PackedHashCorpus:
+    """
+    Reference corpus of perceptual hashes packed as uint64 words.
+
+    - hashes: (N, n_bits / 64) uint64 array
+    - Hamming distance to every entry in one vectorized XOR + popcount
+    """
+
+    def __init__(self, algorithm: str = "phash", n_bits: int = 64) -> None:
+        if n_bits % 64 or n_bits // 64 < 1:
+            raise ValueError("n_bits must be a positive multiple of 64")
+
+        self.algorithm = algorithm
+        self.n_bits = n_bits
+        self._ids: List[str] = []
+        self._words = np.empty((0, n_bits // 64), dtype=np.uint64)
+        self._pending: List[Tuple[int, ...]] = []
+
+    @classmethod
+    def from_hashes(
+        cls,
+        entries: Iterable[Tuple[str, PerceptualHash]],
+        algorithm: str = "phash",
+        n_bits: int = 64,
+    ) -> "PackedHashCorpus":
+        corpus = cls(algorithm=algorithm, n_bits=n_bits)
+        for image_id, phash in entries:
+            corpus.add(image_id, phash)
+        return corpus
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def image_ids(self) -> List[str]:
+        return list(self._ids)
+
+    @property
+    def hashes(self) -> np.ndarray:
+        self._flush()
+        return self._words
+
+    def add(self, image_id: str, phash: PerceptualHash) -> None:
+        if phash.algorithm != self.algorithm or phash.n_bits != self.n_bits:
+            raise ValueError("Hash algorithm / size does not match corpus")
+        self._ids.append(image_id)
+        self._pending.append(phash.words)
+
+    def hamming_distances(self, target: PerceptualHash) -> np.ndarray:
+        """
+        Hamming distance from target to every corpus entry (int64, N).
+        """
+        if target.algorithm != self.algorithm or target.n_bits != self.n_bits:
+            raise ValueError("Hash algorithm / size does not match corpus")
+
+        words = self.hashes
+        query = np.array(target.words, dtype=np.uint64)
+        return _popcount(np.bitwise_xor(words, query)).sum(axis=1, dtype=np.int64)
+
+    def similarities(self, target: PerceptualHash) -> np.ndarray:
+        return 1.0 - self.hamming_distances(target) / self.n_bits
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as handle:
+            np.savez_compressed(
+                handle,
+                algorithm=np.array(self.algorithm),
+                n_bits=np.array(self.n_bits),
+                image_ids=np.array(self._ids, dtype=str),
+                hashes=self.hashes,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "PackedHashCorpus":
+        with np.load(path, allow_pickle=False) as data:
+            corpus = cls(algorithm=str(data["algorithm"]), n_bits=int(data["n_bits"]))
+            corpus._ids = data["image_ids"].tolist()
+            corpus._words = data["hashes"].astype(np.uint64)
+        return corpus
+
+    def _flush(self) -> None:
+        if self._pending:
+            block = np.array(self._pending, dtype=np.uint64).reshape(-1, self.n_bits // 64)
+            self._words = np.concatenate((self._words, block))
+            self._pending = []
+
+
 # =========================
 # Core Signal Generator
 # =========================
@@ -104,6 +286,50 @@ def generate_duplicate_image_signal(
             matched_images.append(ref.image_id)
             highest_similarity = max(highest_similarity, similarity)
 
+    return _build_duplicate_image_signal(
+        target_image.image_id,
+        matched_images,
+        highest_similarity,
+        similarity_threshold,
+    )
+
+
+def generate_duplicate_image_signal_from_corpus(
+    target_image_id: str,
+    target_hash: PerceptualHash,
+    corpus: PackedHashCorpus,
+    similarity_threshold: float = 0.9,
+) -> DuplicateImageSignal:
+    """
+    Duplicate image signal against a packed hash corpus.
+
+    Same output contract as generate_duplicate_image_signal, with
+    similarity = 1 - Hamming distance / n_bits.
+    """
+    similarities = corpus.similarities(target_hash)
+    matched = np.flatnonzero(similarities >= similarity_threshold)
+
+    ids = corpus.image_ids
+    matched_images = [ids[i] for i in matched]
+    highest_similarity = float(similarities[matched].max()) if matched.size else 0.0
+
+    return _build_duplicate_image_signal(
+        target_image_id,
+        matched_images,
+        highest_similarity,
+        similarity_threshold,
+    )
+
+
+def _build_duplicate_image_signal(
+    target_image_id: str,
+    matched_images: List[str],
+    highest_similarity: float,
+    similarity_threshold: float,
+) -> DuplicateImageSignal:
+    """
+    Signal synthesis shared by the reference-list and corpus paths.
+    """
     if not matched_images:
         duplicate_probability = 0.0
         similarity_score = 0.0
@@ -112,7 +338,7 @@ def generate_duplicate_image_signal(
         similarity_score = round(highest_similarity, 3)
 
     duplicate_group_id_source = {
-        "target_image_id": target_image.image_id,
+        "target_image_id": target_image_id,
         "matched_images": sorted(matched_images),
     }
     duplicate_group_id = hashlib.sha256(
@@ -121,7 +347,7 @@ def generate_duplicate_image_signal(
     ).hexdigest()
 
     payload = {
-        "target_image_id": target_image.image_id,
+        "target_image_id": target_image_id,
         "matched_images": matched_images,
         "similarity_score": similarity_score,
         "threshold": similarity_threshold,
@@ -134,3 +360,69 @@ def generate_duplicate_image_signal(
         compared_images=matched_images,
         signal_hash=compute_signal_hash(payload),
     )
+
+
+# =========================
+# Internal Helpers
+# =========================
+
+_BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """
+    Per-word popcount of a uint64 array.
+    """
+    bitwise_count = getattr(np, "bitwise_count", None)
+    if bitwise_count is not None:
+        return bitwise_count(words)
+    as_bytes = words.view(np.uint8).reshape(words.shape + (8,))
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=-1, dtype=np.uint8)
+
+
+def _as_gray(image: Any) -> np.ndarray:
+    gray = getattr(image, "gray", None)
+    if gray is None and hasattr(image, "convert"):
+        gray = image.convert("L")
+    array = np.asarray(gray if gray is not None else image)
+    if array.ndim != 2 or array.size == 0:
+        raise ValueError("Perceptual hashing requires a non-empty 2D grayscale array")
+    return array.astype(np.float64)
+
+
+def _area_resize(gray: np.ndarray, rows: int, cols: int) -> np.ndarray:
+    """
+    Area-average resize to (rows, cols); small inputs are first
+    replicated up so every output cell covers at least one pixel.
+    """
+    if gray.shape[0] < rows:
+        gray = np.repeat(gray, -(-rows // gray.shape[0]), axis=0)
+    if gray.shape[1] < cols:
+        gray = np.repeat(gray, -(-cols // gray.shape[1]), axis=1)
+
+    row_edges = np.linspace(0, gray.shape[0], rows + 1).astype(np.int64)
+    col_edges = np.linspace(0, gray.shape[1], cols + 1).astype(np.int64)
+
+    sums = np.add.reduceat(np.add.reduceat(gray, row_edges[:-1], axis=0), col_edges[:-1], axis=1)
+    areas = np.outer(np.diff(row_edges), np.diff(col_edges))
+    return sums / areas
+
+
+def _dct_matrix(n: int) -> np.ndarray:
+    """
+    Orthonormal DCT-II basis (n x n).
+    """
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    basis = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2.0 / n)
+    basis[0] /= np.sqrt(2.0)
+    return basis
+
+
+def _bits_to_int(bits: np.ndarray) -> int:
+    return int.from_bytes(np.packbits(bits.astype(np.uint8)).tobytes(), "big")
+
+
+def _check_compatible(a: PerceptualHash, b: PerceptualHash) -> None:
+    if a.algorithm != b.algorithm or a.n_bits != b.n_bits:
+        raise ValueError("Perceptual hashes use different algorithms or sizes")
@@ -0,0 +1,248 @@
+"""
+Image EXIF / GPS Metadata Extraction
+------------------------------------
+
+Role:
+- Shared EXIF extraction layer for geo image checks
+  (geo_image_match, image_location_mismatch).
+- Reads only the image header / EXIF segment; pixel data is never
+  decoded (PIL opens images lazily).
+- Parsed metadata is cached by image content hash (SHA-256), so a
+  photo reused across listings or re-checked in a backfill is parsed
+  once.
+- Sources are read with the image loader's read_image_bytes, so an
+  unreadable path or unsupported source raises ImageLoadError, as in
+  the image feature layer.
+
+Governance:
+- Signal-input only
+- Non-decisive
+- Deterministic
+- No fraud conclusion
+- No valuation or workflow impact
+
+Compliant with:
+- MASTER_SPEC.md
+- IMPLEMENTATION STATUS – LISTING INTELLIGENCE
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Tuple, Union
+import hashlib
+import io
+import threading
+
+try:
+    from PIL import Image
+except ImportError as exc:
+    raise ImportError(
+        "Pillow is required for exif_metadata"
+    ) from exc
+
+from feature_pipeline.image.image_loader import ImageLoadError, read_image_bytes
+from listing_intelligence.image_forensics.geo_image_match import ImageGPSMetadata
+from listing_intelligence.image_forensics.image_location_mismatch import ImageGeoMetadata
+
+
+# EXIF tag identifiers
+_TAG_MAKE = 0x010F
+_TAG_MODEL = 0x0110
+_TAG_EXIF_IFD = 0x8769
+_TAG_GPS_IFD = 0x8825
+_TAG_DATETIME_ORIGINAL = 0x9003
+
+_GPS_LATITUDE_REF = 1
+_GPS_LATITUDE = 2
+_GPS_LONGITUDE_REF = 3
+_GPS_LONGITUDE = 4
+_GPS_ALTITUDE_REF = 5
+_GPS_ALTITUDE = 6
+
+DEFAULT_CACHE_ENTRIES = 10_000
+
+
+# =========================
+# Data Structures
+# =========================
+
+@dataclass(frozen=True)
+class ImageExifMetadata:
+    content_hash: str
+    has_exif: bool
+    latitude: Optional[float]
+    longitude: Optional[float]
+    altitude_meters: Optional[float]
+    captured_at: Optional[str]  # EXIF DateTimeOriginal, as recorded
+    camera_make: Optional[str]
+    camera_model: Optional[str]
+
+    @property
+    def has_gps(self) -> bool:
+        return self.latitude is not None and self.longitude is not None
+
+    def to_gps_metadata(self) -> Optional[ImageGPSMetadata]:
+        """Input for geo_image_match (None when GPS is absent)."""
+        if not self.has_gps:
+            return None
+        return ImageGPSMetadata(latitude=self.latitude, longitude=self.longitude)
+
+    def to_geo_metadata(self) -> ImageGeoMetadata:
+        """Input for image_location_mismatch."""
+        return ImageGeoMetadata(
+            latitude=self.latitude if self.has_gps else None,
+            longitude=self.longitude if self.has_gps else None,
+            source="EXIF" if self.has_gps else "UNKNOWN",
+        )
+
+
+# =========================
+# Extraction Cache
+# =========================
+
+class ExifMetadataCache:
+    """
+    Content-hash keyed LRU cache of parsed EXIF metadata.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES) -> None:
+        if max_entries < 0:
+            raise ValueError("max_entries must be >= 0")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, ImageExifMetadata]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def extract(self, source: Union[str, bytes]) -> ImageExifMetadata:
+        """
+        Metadata for an image file path or raw bytes.
+
+        Raises ImageLoadError when the source cannot be read.
+        """
+        data = read_image_bytes(source)
+        content_hash = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            cached = self._entries.get(content_hash)
+            if cached is not None:
+                self._entries.move_to_end(content_hash)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        metadata = parse_exif_metadata(data, content_hash)
+
+        if self.max_entries:
+            with self._lock:
+                self._entries[content_hash] = metadata
+                self._entries.move_to_end(content_hash)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return metadata
+
+    def extract_many(self, sources: Iterable[Union[str, bytes]]) -> List[ImageExifMetadata]:
+        return [self.extract(source) for source in sources]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def parse_exif_metadata(data: bytes, content_hash: Optional[str] = None) -> ImageExifMetadata:
+    """
+    Parse EXIF / GPS tags from image bytes without decoding pixels.
+
+    Unreadable images (including ones PIL rejects as decompression
+    bombs) or malformed GPS values yield empty fields (metadata
+    absence is reported, never guessed).
+    """
+    if content_hash is None:
+        content_hash = hashlib.sha256(data).hexdigest()
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            exif = image.getexif()
+            gps = exif.get_ifd(_TAG_GPS_IFD) if exif else {}
+            exif_ifd = exif.get_ifd(_TAG_EXIF_IFD) if exif else {}
+    except (OSError, ValueError, SyntaxError, Image.DecompressionBombError):
+        exif, gps, exif_ifd = {}, {}, {}
+
+    latitude = _dms_to_degrees(gps.get(_GPS_LATITUDE), gps.get(_GPS_LATITUDE_REF), "S")
+    longitude = _dms_to_degrees(gps.get(_GPS_LONGITUDE), gps.get(_GPS_LONGITUDE_REF), "W")
+    if latitude is not None and not -90.0 <= latitude <= 90.0:
+        latitude = None
+    if longitude is not None and not -180.0 <= longitude <= 180.0:
+        longitude = None
+
+    return ImageExifMetadata(
+        content_hash=content_hash,
+        has_exif=bool(exif),
+        latitude=latitude,
+        longitude=longitude,
+        altitude_meters=_altitude(gps.get(_GPS_ALTITUDE), gps.get(_GPS_ALTITUDE_REF)),
+        captured_at=_text(exif_ifd.get(_TAG_DATETIME_ORIGINAL)),
+        camera_make=_text(exif.get(_TAG_MAKE)) if exif else None,
+        camera_model=_text(exif.get(_TAG_MODEL)) if exif else None,
+    )
+
+
+# =========================
+# Internal Helpers
+# =========================
+
+def _rational(value: Any) -> float:
+    if isinstance(value, tuple) and len(value) == 2:
+        return float(value[0]) / float(value[1])
+    return float(value)
+
+
+def _dms_to_degrees(dms: Any, ref: Any, negative_ref: str) -> Optional[float]:
+    if dms is None:
+        return None
+    try:
+        parts: Tuple[Any, ...] = tuple(dms)
+        degrees = _rational(parts[0])
+        minutes = _rational(parts[1]) if len(parts) > 1 else 0.0
+        seconds = _rational(parts[2]) if len(parts) > 2 else 0.0
+    except (TypeError, ValueError, ZeroDivisionError, IndexError):
+        return None
+
+    value = degrees + minutes / 60.0 + seconds / 3600.0
+    if _text(ref) == negative_ref:
+        value = -value
+    return value
+
+
+def _altitude(value: Any, ref: Any) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        altitude = _rational(value)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+    if ref in (1, b"\x01"):
+        altitude = -altitude
+    return altitude
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        value = value.decode("ascii", errors="ignore")
+    text = str(value).strip("\x00 ").strip()
+    return text or None
+
+
+# Process-wide shared cache
+exif_metadata_cache = ExifMetadataCache()
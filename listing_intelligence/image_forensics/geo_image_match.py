@@ -19,11 +19,13 @@ Compliant with:
 """
 
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence, Union
 import hashlib
 import json
 import math
 
+import numpy as np
+
 
 # =========================
 # Data Structures
@@ -70,6 +72,35 @@ def haversine_distance_meters(
     return r * c
 
 
+def haversine_distance_meters_batch(
+    lat1: Any, lon1: Any, lat2: Any, lon2: Any
+) -> np.ndarray:
+    """
+    Vectorized haversine distance in meters (broadcasting inputs).
+    """
+    r = 6371000  # Earth radius in meters
+
+    lat1 = np.asarray(lat1, dtype=np.float64)
+    lat2 = np.asarray(lat2, dtype=np.float64)
+
+    # Same operation order as the scalar version; vectorized sin / atan2
+    # may still differ from math.* in the last ulp on some inputs
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    delta_phi = np.radians(lat2 - lat1)
+    delta_lambda = np.radians(
+        np.asarray(lon2, dtype=np.float64) - np.asarray(lon1, dtype=np.float64)
+    )
+
+    a = (
+        np.sin(delta_phi / 2) ** 2
+        + np.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2) ** 2
+    )
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    return r * c
+
+
 def compute_signal_hash(payload: Dict[str, Any]) -> str:
     """
     Deterministic signal hash for audit & lineage.
@@ -101,6 +132,68 @@ def generate_geo_image_match_signal(
     - GeoImageMatchSignal (signal-only)
     """
 
+    distance = None
+    if image_gps is not None:
+        distance = haversine_distance_meters(
+            image_gps.latitude,
+            image_gps.longitude,
+            listing_latitude,
+            listing_longitude,
+        )
+
+    return _build_geo_image_match_signal(
+        image_gps,
+        listing_latitude,
+        listing_longitude,
+        max_expected_distance_meters,
+        distance,
+    )
+
+
+def generate_geo_image_match_signals_batch(
+    image_gps: Sequence[Optional[ImageGPSMetadata]],
+    listing_latitude: Union[float, Sequence[float]],
+    listing_longitude: Union[float, Sequence[float]],
+    max_expected_distance_meters: float = 300.0,
+) -> List[GeoImageMatchSignal]:
+    """
+    Batch variant: one signal per image, distances computed in one
+    vectorized pass.
+
+    listing_latitude / longitude are scalars (all photos of one listing)
+    or per-image sequences (photos across listings in a backfill).
+    """
+    n = len(image_gps)
+    listing_lat = np.broadcast_to(np.asarray(listing_latitude, dtype=np.float64), (n,))
+    listing_lon = np.broadcast_to(np.asarray(listing_longitude, dtype=np.float64), (n,))
+
+    image_lat = np.array(
+        [np.nan if gps is None else gps.latitude for gps in image_gps], dtype=np.float64
+    )
+    image_lon = np.array(
+        [np.nan if gps is None else gps.longitude for gps in image_gps], dtype=np.float64
+    )
+    distances = haversine_distance_meters_batch(image_lat, image_lon, listing_lat, listing_lon)
+
+    return [
+        _build_geo_image_match_signal(
+            gps,
+            float(listing_lat[i]),
+            float(listing_lon[i]),
+            max_expected_distance_meters,
+            None if gps is None else float(distances[i]),
+        )
+        for i, gps in enumerate(image_gps)
+    ]
+
+
+def _build_geo_image_match_signal(
+    image_gps: Optional[ImageGPSMetadata],
+    listing_latitude: float,
+    listing_longitude: float,
+    max_expected_distance_meters: float,
+    distance: Optional[float],
+) -> GeoImageMatchSignal:
     if image_gps is None:
         payload = {
             "image_gps_present": False,
@@ -115,13 +208,6 @@ def generate_geo_image_match_signal(
             signal_hash=compute_signal_hash(payload),
         )
 
-    distance = haversine_distance_meters(
-        image_gps.latitude,
-        image_gps.longitude,
-        listing_latitude,
-        listing_longitude,
-    )
-
     # Descriptive consistency score (not probabilistic)
     if distance <= max_expected_distance_meters:
         geo_consistency_score = round(
@@ -19,11 +19,13 @@ Compliant with:
 """
 
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence, Union
 import hashlib
 import json
 import math
 
+import numpy as np
+
 
 # =========================
 # Data Structures
@@ -79,6 +81,36 @@ def haversine_distance_km(
     return R * c
 
 
+def haversine_distance_km_batch(
+    lat1: Any, lon1: Any, lat2: Any, lon2: Any
+) -> np.ndarray:
+    """
+    Vectorized great-circle distance in km (broadcasting inputs).
+    """
+    R = 6371.0  # Earth radius in km
+
+    lat1 = np.asarray(lat1, dtype=np.float64)
+    lat2 = np.asarray(lat2, dtype=np.float64)
+
+    # Same operation order as the scalar version; vectorized sin / atan2
+    # may still differ from math.* in the last ulp on some inputs, so
+    # signal generation (hashed full-precision distance) uses the
+    # scalar version
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    d_phi = np.radians(lat2 - lat1)
+    d_lambda = np.radians(
+        np.asarray(lon2, dtype=np.float64) - np.asarray(lon1, dtype=np.float64)
+    )
+
+    a = (
+        np.sin(d_phi / 2) ** 2
+        + np.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    )
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return R * c
+
+
 def compute_signal_hash(payload: Dict[str, Any]) -> str:
     """
     Deterministic signal hash for lineage & audit.
@@ -108,13 +140,74 @@ def generate_image_location_mismatch_signal(
     - ImageLocationMismatchSignal (signal-only)
     """
 
+    distance_km = None
+    if image_geo.latitude is not None and image_geo.longitude is not None:
+        distance_km = haversine_distance_km(
+            image_geo.latitude,
+            image_geo.longitude,
+            reference_location.latitude,
+            reference_location.longitude,
+        )
+
+    return _build_mismatch_signal(
+        image_geo,
+        reference_location,
+        mismatch_threshold_km,
+        distance_km,
+    )
+
+
+def generate_image_location_mismatch_signals_batch(
+    image_geos: Sequence[ImageGeoMetadata],
+    reference_locations: Union[ReferenceLocation, Sequence[ReferenceLocation]],
+    mismatch_threshold_km: float = 5.0,
+) -> List[ImageLocationMismatchSignal]:
+    """
+    Batch variant: one signal per image.
+
+    Distances use the scalar haversine_distance_km, so every signal
+    (including signal_hash, which covers the full-precision distance)
+    is identical to generate_image_location_mismatch_signal.
+
+    reference_locations is a single location (all photos of one
+    listing) or one location per image (backfill across listings).
+    """
+    n = len(image_geos)
+    if isinstance(reference_locations, ReferenceLocation):
+        references = [reference_locations] * n
+    else:
+        references = list(reference_locations)
+        if len(references) != n:
+            raise ValueError("reference_locations must align with image_geos")
+
+    return [
+        _build_mismatch_signal(
+            geo,
+            reference,
+            mismatch_threshold_km,
+            None
+            if geo.latitude is None or geo.longitude is None
+            else haversine_distance_km(
+                geo.latitude, geo.longitude, reference.latitude, reference.longitude
+            ),
+        )
+        for geo, reference in zip(image_geos, references)
+    ]
+
+
+def _build_mismatch_signal(
+    image_geo: ImageGeoMetadata,
+    reference_location: ReferenceLocation,
+    mismatch_threshold_km: float,
+    distance_km: Optional[float],
+) -> ImageLocationMismatchSignal:
     findings: Dict[str, Any] = {
         "reference_type": reference_location.reference_type,
         "image_geo_available": image_geo.latitude is not None
         and image_geo.longitude is not None,
     }
 
-    if image_geo.latitude is None or image_geo.longitude is None:
+    if distance_km is None:
         payload = {
             "status": "NO_GEO_DATA",
             "findings": findings,
@@ -128,13 +221,6 @@ def generate_image_location_mismatch_signal(
             signal_hash=compute_signal_hash(payload),
         )
 
-    distance_km = haversine_distance_km(
-        image_geo.latitude,
-        image_geo.longitude,
-        reference_location.latitude,
-        reference_location.longitude,
-    )
-
     if distance_km <= mismatch_threshold_km:
         status = "PASS"
     elif distance_km <= mismatch_threshold_km * 3:
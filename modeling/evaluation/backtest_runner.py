@@ -24,7 +24,7 @@ from __future__ import annotations
 from typing import Dict, Any, Callable
 import numpy as np
 
-from model.evaluation.metrics_regression import RegressionMetrics
+from modeling.evaluation.metrics_regression import RegressionMetrics
 
 
 class BacktestRunner:
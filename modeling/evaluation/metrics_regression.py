@@ -21,10 +21,20 @@ COMPLIANCE
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Any, Callable, Dict
 import numpy as np
 
 
+# Rows per leaf of the fused, chunked evaluation pass
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Metric bundle keys (evaluate / evaluate_grouped)
+METRIC_NAMES = ("mae", "mse", "rmse", "mape", "r2")
+
+# Leaf sums: |e|, e^2, |e / y|, y  (e = y_true - y_pred)
+_ABS_ERR, _SQ_ERR, _ABS_PCT_ERR, _Y_SUM = range(4)
+
+
 class RegressionMetrics:
     """
     Pure numeric regression metrics.
@@ -113,20 +123,159 @@ class RegressionMetrics:
     def evaluate(
         y_true: np.ndarray,
         y_pred: np.ndarray,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ) -> Dict[str, float]:
         """
         Compute a bundle of regression metrics.
 
+        float64 inputs use one fused, chunked pass (plus a pass over
+        y_true for R2) with bounded temporaries. Chunks follow numpy's
+        pairwise-summation split points, so results are bit-identical
+        to the individual metric functions.
+
         GOVERNANCE:
         - Output is descriptive
         - Caller MUST NOT interpret or threshold internally
         """
         RegressionMetrics._validate_inputs(y_true, y_pred)
 
+        if y_true.dtype != np.float64 or y_pred.dtype != np.float64:
+            # Mixed / integer dtypes: numpy's casting reductions sum in
+            # buffered blocks, so only the per-metric path is identical.
+            return {
+                "mae": RegressionMetrics.mae(y_true, y_pred),
+                "mse": RegressionMetrics.mse(y_true, y_pred),
+                "rmse": RegressionMetrics.rmse(y_true, y_pred),
+                "mape": RegressionMetrics.mape(y_true, y_pred),
+                "r2": RegressionMetrics.r2(y_true, y_pred),
+            }
+
+        return RegressionMetrics._evaluate_fused(y_true, y_pred, chunk_size)
+
+    @staticmethod
+    def evaluate_grouped(
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        segment_keys: np.ndarray,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Dict[Any, Dict[str, Any]]:
+        """
+        Compute the metric bundle per segment key (district, tier,
+        asset type, ...) in one call.
+
+        Each segment's metrics equal evaluate() on that segment's rows
+        (original row order preserved), plus "error": None. A segment
+        whose metrics are undefined (single row, zero y_true, zero
+        variance) gets None for every metric and evaluate()'s
+        ValueError message in "error"; other segments are unaffected.
+        """
+        RegressionMetrics._validate_inputs(y_true, y_pred)
+
+        segment_keys = np.asarray(segment_keys)
+        if segment_keys.shape != y_true.shape:
+            raise ValueError("segment_keys must have the same shape as y_true")
+
+        order = np.argsort(segment_keys, kind="stable")
+        sorted_keys = segment_keys[order]
+        boundaries = np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1
+        starts = np.concatenate(([0], boundaries))
+        stops = np.concatenate((boundaries, [sorted_keys.shape[0]]))
+
+        grouped_true = y_true[order]
+        grouped_pred = y_pred[order]
+
+        results: Dict[Any, Dict[str, Any]] = {}
+        for start, stop in zip(starts, stops):
+            key = sorted_keys[start].item()
+            try:
+                segment: Dict[str, Any] = dict(
+                    RegressionMetrics.evaluate(
+                        grouped_true[start:stop],
+                        grouped_pred[start:stop],
+                        chunk_size=chunk_size,
+                    )
+                )
+                segment["error"] = None
+            except ValueError as exc:
+                segment = {name: None for name in METRIC_NAMES}
+                segment["error"] = str(exc)
+            results[key] = segment
+        return results
+
+    # ------------------------------------------------------------------
+    # Fused evaluation
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _evaluate_fused(
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        chunk_size: int,
+    ) -> Dict[str, float]:
+        n = y_true.shape[0]
+        has_zero = False
+
+        def error_sums(lo: int, hi: int) -> np.ndarray:
+            nonlocal has_zero
+            true_chunk = y_true[lo:hi]
+            error = true_chunk - y_pred[lo:hi]
+            abs_error = np.abs(error)
+            if not has_zero and np.any(true_chunk == 0):
+                has_zero = True
+            with np.errstate(divide="ignore", invalid="ignore"):
+                abs_pct_error = np.abs(error / true_chunk)
+            return np.array(
+                [
+                    np.sum(abs_error),
+                    np.sum(error ** 2),
+                    np.sum(abs_pct_error),
+                    np.sum(true_chunk),
+                ]
+            )
+
+        sums = _pairwise_chunked_sum(n, error_sums, chunk_size)
+
+        if has_zero:
+            raise ValueError("MAPE is undefined when y_true contains zero")
+
+        mse = sums[_SQ_ERR] / n
+        y_mean = sums[_Y_SUM] / n
+
+        ss_tot = _pairwise_chunked_sum(
+            n,
+            lambda lo, hi: np.array([np.sum((y_true[lo:hi] - y_mean) ** 2)]),
+            chunk_size,
+        )[0]
+        if ss_tot == 0:
+            raise ValueError("R2 is undefined when variance of y_true is zero")
+
         return {
-            "mae": RegressionMetrics.mae(y_true, y_pred),
-            "mse": RegressionMetrics.mse(y_true, y_pred),
-            "rmse": RegressionMetrics.rmse(y_true, y_pred),
-            "mape": RegressionMetrics.mape(y_true, y_pred),
-            "r2": RegressionMetrics.r2(y_true, y_pred),
+            "mae": float(sums[_ABS_ERR] / n),
+            "mse": float(mse),
+            "rmse": float(np.sqrt(mse)),
+            "mape": float(sums[_ABS_PCT_ERR] / n),
+            "r2": float(1 - sums[_SQ_ERR] / ss_tot),
         }
+
+
+def _pairwise_chunked_sum(
+    n: int,
+    leaf_sums: Callable[[int, int], np.ndarray],
+    chunk_size: int,
+    lo: int = 0,
+) -> np.ndarray:
+    """
+    Sum leaf results over [lo, lo + n) using numpy's pairwise split
+    points (halve, round down to a multiple of 8) until a block fits
+    in chunk_size. Each leaf is reduced with np.sum, so the total is
+    bit-identical to np.sum over the whole contiguous range.
+    """
+    if n <= max(chunk_size, 128):
+        return leaf_sums(lo, lo + n)
+
+    half = n // 2
+    half -= half % 8
+    return (
+        _pairwise_chunked_sum(half, leaf_sums, chunk_size, lo)
+        + _pairwise_chunked_sum(n - half, leaf_sums, chunk_size, lo + half)
+    )
@@ -0,0 +1,459 @@
+"""
+model/evaluation/rolling_backtest.py
+
+GOVERNANCE ROLE
+---------------
+Offline rolling-origin backtest orchestration across model versions,
+time windows and segments.
+
+STRICT BOUNDARIES
+-----------------
+- Offline execution ONLY
+- Deterministic orchestration
+- No interpretation
+- No thresholds
+- No model comparison / ranking
+- No approval / activation logic
+
+DESIGN
+------
+- Rows are ordered by period once; every window is a pair of
+  contiguous ranges in that order (slices of the data when the input
+  is already time-sorted, index-array views otherwise)
+- Inference + RegressionMetrics run per (model version, window),
+  optionally in a process pool (dataset shipped once per worker)
+- Predictions are cached per (dataset fingerprint, model version,
+  window), so a cache shared across datasets never serves stale rows
+- Metrics are computed one at a time only when the fused evaluation
+  hits an undefined metric, so one undefined metric (e.g. R2 on a
+  constant target) does not blank the others
+- Output is one consolidated, descriptive metrics table
+
+COMPLIANCE
+----------
+- MASTER_SPEC.md
+- IMPLEMENTATION STATUS – PART 1 & 2
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import hashlib
+import threading
+
+import numpy as np
+
+from modeling.evaluation.backtest_runner import BacktestRunner
+from modeling.evaluation.metrics_regression import RegressionMetrics
+
+
+ALL_SEGMENTS = "__all__"
+
+METRIC_COLUMNS = ("mae", "mse", "rmse", "mape", "r2")
+
+
+@dataclass(frozen=True)
+class BacktestWindow:
+    """
+    One rolling-origin window.
+
+    Row bounds refer to positions in the period-sorted row order.
+    """
+    window_id: str
+    train_period_start: str
+    train_period_end: str
+    test_period_start: str
+    test_period_end: str
+    train_start: int
+    train_stop: int
+    test_start: int
+    test_stop: int
+
+    @property
+    def n_train(self) -> int:
+        return self.train_stop - self.train_start
+
+    @property
+    def n_test(self) -> int:
+        return self.test_stop - self.test_start
+
+
+@dataclass(frozen=True)
+class BacktestTable:
+    """
+    Consolidated backtest metrics (one row per model version ×
+    window × segment). Descriptive only.
+    """
+    rows: List[Dict[str, Any]]
+
+    def to_dataframe(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.rows)
+
+
+class PredictionCache:
+    """
+    In-memory prediction cache keyed by (dataset fingerprint,
+    model_version, window bounds).
+
+    The dataset fingerprint (see dataset_fingerprint) makes a cache
+    safe to share between backtests over different data.
+    """
+
+    def __init__(self) -> None:
+        self._store: Dict[Tuple[str, str, str, int, int], np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(
+        dataset_id: str,
+        model_version: str,
+        window: BacktestWindow,
+    ) -> Tuple[str, str, str, int, int]:
+        return (
+            dataset_id,
+            model_version,
+            window.window_id,
+            window.test_start,
+            window.test_stop,
+        )
+
+    def get(
+        self,
+        dataset_id: str,
+        model_version: str,
+        window: BacktestWindow,
+    ) -> Optional[np.ndarray]:
+        with self._lock:
+            return self._store.get(self.key(dataset_id, model_version, window))
+
+    def put(
+        self,
+        dataset_id: str,
+        model_version: str,
+        window: BacktestWindow,
+        y_pred: np.ndarray,
+    ) -> None:
+        with self._lock:
+            self._store[self.key(dataset_id, model_version, window)] = y_pred
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+class RollingOriginBacktest:
+    """
+    Rolling-origin backtest over a time-indexed dataset.
+
+    This class MUST NOT:
+    - judge model quality
+    - select a model
+    - decide deployment
+    - modify models
+    """
+
+    def __init__(
+        self,
+        X: np.ndarray,
+        y_true: np.ndarray,
+        periods: np.ndarray,
+        *,
+        segments: Optional[np.ndarray] = None,
+        cache: Optional[PredictionCache] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        X : np.ndarray (n_rows, n_features)
+        y_true : np.ndarray (n_rows,)
+        periods : np.ndarray (n_rows,)
+            Sortable period label per row (e.g. 'YYYY-MM', datetime64[M])
+        segments : np.ndarray (n_rows,), optional
+            Segment key per row (district, tier, asset type, ...)
+        """
+        BacktestRunner._validate_inputs(X, y_true)
+        periods = np.asarray(periods)
+        if periods.shape != (X.shape[0],):
+            raise ValueError("periods must have one entry per row")
+        if segments is not None:
+            segments = np.asarray(segments)
+            if segments.shape != (X.shape[0],):
+                raise ValueError("segments must have one entry per row")
+
+        order = np.argsort(periods, kind="stable")
+        sorted_periods = periods[order]
+
+        self._X = X
+        self._y_true = y_true
+        self._segments = segments
+        self._order = None if np.array_equal(order, np.arange(order.size)) else order
+        self._sorted_periods = sorted_periods
+        self._unique_periods = np.unique(sorted_periods)
+        self.cache = cache if cache is not None else PredictionCache()
+        self.dataset_id = dataset_fingerprint(X, periods)
+
+    # ------------------------------------------------------------------
+    # Windows
+    # ------------------------------------------------------------------
+
+    def windows(
+        self,
+        *,
+        horizon: int = 1,
+        min_train_periods: int = 1,
+        train_periods: Optional[int] = None,
+        step: int = 1,
+        n_windows: Optional[int] = None,
+    ) -> List[BacktestWindow]:
+        """
+        Generate rolling-origin windows.
+
+        - test: `horizon` consecutive periods starting at the origin
+        - train: all earlier periods (expanding), or the last
+          `train_periods` periods (sliding)
+        - n_windows keeps the most recent windows only
+        """
+        if horizon < 1 or min_train_periods < 1 or step < 1:
+            raise ValueError("horizon, min_train_periods and step must be >= 1")
+
+        periods = self._unique_periods
+        origins = list(range(min_train_periods, len(periods) - horizon + 1, step))
+        if n_windows is not None:
+            origins = origins[-n_windows:]
+
+        windows: List[BacktestWindow] = []
+        for origin in origins:
+            first_train = 0 if train_periods is None else max(0, origin - train_periods)
+            last_test = origin + horizon - 1
+
+            windows.append(
+                BacktestWindow(
+                    window_id=f"{periods[origin]}+{horizon}",
+                    train_period_start=str(periods[first_train]),
+                    train_period_end=str(periods[origin - 1]),
+                    test_period_start=str(periods[origin]),
+                    test_period_end=str(periods[last_test]),
+                    train_start=self._lower(periods[first_train]),
+                    train_stop=self._lower(periods[origin]),
+                    test_start=self._lower(periods[origin]),
+                    test_stop=self._upper(periods[last_test]),
+                )
+            )
+        return windows
+
+    def rows(self, start: int, stop: int):
+        """
+        Row selector for a sorted-order range: a slice when the input
+        is already time-sorted, otherwise a view of the order array.
+        """
+        if self._order is None:
+            return slice(start, stop)
+        return self._order[start:stop]
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def run(
+        self,
+        runners: Sequence[BacktestRunner],
+        windows: Sequence[BacktestWindow],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> BacktestTable:
+        """
+        Run every runner on every window and collect metrics.
+
+        With max_workers > 1, inference and metrics run in a process
+        pool; runner inference functions must then be picklable
+        (module-level). Cached predictions are reused without re-running
+        inference.
+        """
+        tasks: List[Tuple[BacktestRunner, BacktestWindow, Optional[np.ndarray]]] = [
+            (runner, window, self.cache.get(self.dataset_id, runner.model_version, window))
+            for runner in runners
+            for window in windows
+        ]
+        state = self._worker_state()
+
+        if tasks and max_workers is not None and max_workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(state,),
+            ) as pool:
+                futures = [
+                    pool.submit(_evaluate_in_worker, runner, window, cached)
+                    for runner, window, cached in tasks
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [
+                _evaluate(state, runner, window, cached)
+                for runner, window, cached in tasks
+            ]
+
+        table_rows: List[Dict[str, Any]] = []
+        for (runner, window, cached), (y_pred, rows) in zip(tasks, results):
+            if cached is None:
+                self.cache.put(self.dataset_id, runner.model_version, window, y_pred)
+            table_rows.extend(rows)
+        return BacktestTable(rows=table_rows)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _lower(self, period: Any) -> int:
+        return int(np.searchsorted(self._sorted_periods, period, side="left"))
+
+    def _upper(self, period: Any) -> int:
+        return int(np.searchsorted(self._sorted_periods, period, side="right"))
+
+    def _worker_state(self) -> Dict[str, Any]:
+        return {
+            "X": self._X,
+            "y_true": self._y_true,
+            "segments": self._segments,
+            "order": self._order,
+        }
+
+
+def dataset_fingerprint(X: np.ndarray, periods: np.ndarray) -> str:
+    """
+    SHA-256 over the feature matrix and period labels (shape, dtype
+    and raw bytes), used to scope cached predictions to one dataset.
+    """
+    digest = hashlib.sha256()
+    for array in (np.asarray(X), np.asarray(periods)):
+        array = np.ascontiguousarray(array)
+        digest.update(repr((array.shape, array.dtype.str)).encode("utf-8"))
+        if array.dtype.hasobject:
+            digest.update(repr(array.tolist()).encode("utf-8"))
+        else:
+            digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+# =========================================================
+# WORKER ENTRY POINTS (module-level for pickling)
+# =========================================================
+
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_worker(state: Dict[str, Any]) -> None:
+    _WORKER_STATE.clear()
+    _WORKER_STATE.update(state)
+
+
+def _evaluate_in_worker(
+    runner: BacktestRunner,
+    window: BacktestWindow,
+    y_pred: Optional[np.ndarray],
+) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+    return _evaluate(_WORKER_STATE, runner, window, y_pred)
+
+
+def _evaluate(
+    state: Dict[str, Any],
+    runner: BacktestRunner,
+    window: BacktestWindow,
+    y_pred: Optional[np.ndarray],
+) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+    """
+    Predictions (inference unless cached) and metric rows for one
+    (model version, window).
+    """
+    if y_pred is None:
+        y_pred = _predict(state, runner, window)
+    return y_pred, _metric_rows(state, runner, window, y_pred)
+
+
+def _predict(
+    state: Dict[str, Any],
+    runner: BacktestRunner,
+    window: BacktestWindow,
+) -> np.ndarray:
+    order = state["order"]
+    if order is None:
+        X_test = state["X"][window.test_start:window.test_stop]
+    else:
+        X_test = state["X"][order[window.test_start:window.test_stop]]
+
+    y_pred = runner.inference_fn(X_test)
+    if not isinstance(y_pred, np.ndarray):
+        raise TypeError("Inference output must be a numpy array")
+    if y_pred.shape != (window.n_test,):
+        raise ValueError("y_pred shape must match the window test rows")
+    return y_pred
+
+
+def _metric_rows(
+    state: Dict[str, Any],
+    runner: BacktestRunner,
+    window: BacktestWindow,
+    y_pred: np.ndarray,
+) -> List[Dict[str, Any]]:
+    order = state["order"]
+    if order is None:
+        selector = slice(window.test_start, window.test_stop)
+    else:
+        selector = order[window.test_start:window.test_stop]
+    y_true = state["y_true"][selector]
+
+    groups: List[Tuple[str, np.ndarray, np.ndarray]] = [(ALL_SEGMENTS, y_true, y_pred)]
+    if state["segments"] is not None:
+        segment_keys = state["segments"][selector]
+        for key in np.unique(segment_keys):
+            mask = segment_keys == key
+            groups.append((str(key), y_true[mask], y_pred[mask]))
+
+    rows: List[Dict[str, Any]] = []
+    for segment, seg_true, seg_pred in groups:
+        row: Dict[str, Any] = {
+            "model_id": runner.model_id,
+            "model_version": runner.model_version,
+            "window_id": window.window_id,
+            "train_period_start": window.train_period_start,
+            "train_period_end": window.train_period_end,
+            "test_period_start": window.test_period_start,
+            "test_period_end": window.test_period_end,
+            "segment": segment,
+            "n_samples": int(seg_true.shape[0]),
+            "error": None,
+        }
+        metrics, error = _segment_metrics(seg_true, seg_pred)
+        row.update(metrics)
+        row["error"] = error
+        rows.append(row)
+    return rows
+
+
+def _segment_metrics(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+) -> Tuple[Dict[str, Optional[float]], Optional[str]]:
+    """
+    Fused evaluation; on an undefined metric (empty slice, zero target,
+    zero variance) each metric is computed on its own so only the
+    undefined ones are None. Returns (metrics, joined error messages).
+    """
+    try:
+        return RegressionMetrics.evaluate(y_true=y_true, y_pred=y_pred), None
+    except ValueError:
+        pass
+
+    metrics: Dict[str, Optional[float]] = {}
+    errors: List[str] = []
+    for name in METRIC_COLUMNS:
+        try:
+            metrics[name] = getattr(RegressionMetrics, name)(y_true, y_pred)
+        except ValueError as exc:
+            metrics[name] = None
+            if str(exc) not in errors:
+                errors.append(str(exc))
+    return metrics, "; ".join(errors)
@@ -0,0 +1,444 @@
+"""
+model/evaluation/stability_bootstrap.py
+
+GOVERNANCE ROLE
+---------------
+Offline resampling / perturbation engine for model stability analysis
+(descriptive, numeric only). Extends StabilityCheck from a single
+pairwise comparison to distributions over thousands of replicates.
+
+MODES
+-----
+- Perturbation: each property's inputs are perturbed n_resamples times
+  (relative Gaussian noise per feature) and re-scored in batches;
+  prediction spread is summarized per property and per segment
+- Bootstrap: reference / candidate prediction pairs are resampled with
+  vectorized index matrices; StabilityCheck shift metrics get bootstrap
+  distributions per segment
+
+REPRODUCIBILITY
+---------------
+- Work is split into fixed blocks; each block draws from its own child
+  of SeedSequence(seed), so results do not depend on max_workers
+
+STRICT BOUNDARIES
+-----------------
+- Offline execution ONLY
+- No thresholds
+- No PASS / FAIL
+- No governance decision
+- No registry interaction
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from modeling.evaluation.stability_check import StabilityCheck
+
+
+SHIFT_STATISTICS = ("mean_shift", "mean_absolute_shift", "relative_mean_change")
+
+
+@dataclass(frozen=True)
+class PerturbationStabilityResult:
+    """
+    Per-property prediction spread under input perturbation.
+
+    Arrays are aligned with the input rows. Random streams are spawned
+    per block of block_rows properties, so (seed, block_rows) together
+    identify the run for replay.
+    """
+    n_resamples: int
+    seed: int
+    block_rows: int
+    base_prediction: np.ndarray
+    mean_prediction: np.ndarray
+    std_prediction: np.ndarray
+    coefficient_of_variation: np.ndarray   # NaN where mean is 0
+    p05_prediction: np.ndarray
+    p95_prediction: np.ndarray
+    max_absolute_shift: np.ndarray         # vs. base prediction
+    per_segment: Dict[str, Dict[str, Any]]
+
+    def to_records(self, property_ids: Optional[Sequence[Any]] = None) -> List[Dict[str, Any]]:
+        ids = property_ids if property_ids is not None else range(self.base_prediction.size)
+        return [
+            {
+                "property_id": pid,
+                "base_prediction": float(self.base_prediction[i]),
+                "mean_prediction": float(self.mean_prediction[i]),
+                "std_prediction": float(self.std_prediction[i]),
+                "coefficient_of_variation": _optional_float(self.coefficient_of_variation[i]),
+                "p05_prediction": float(self.p05_prediction[i]),
+                "p95_prediction": float(self.p95_prediction[i]),
+                "max_absolute_shift": float(self.max_absolute_shift[i]),
+            }
+            for i, pid in enumerate(ids)
+        ]
+
+
+class StabilityBootstrapEngine:
+    """
+    Vectorized, parallel stability resampling engine.
+
+    This class MUST NOT:
+    - decide model acceptability
+    - emit alerts
+    - apply thresholds
+    - influence runtime valuation
+    """
+
+    def __init__(
+        self,
+        inference_fn: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+        *,
+        n_resamples: int = 1000,
+        seed: int = 0,
+        block_rows: int = 256,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        inference_fn : Callable, optional
+            Deterministic batch inference (required for perturbation).
+            Must be picklable (module-level) when max_workers > 1.
+        n_resamples : replicates per property / per segment
+        seed : root seed recorded for audit reproduction
+        block_rows : properties per perturbation block
+            (block_rows * n_resamples rows per model call)
+        """
+        if inference_fn is not None and not callable(inference_fn):
+            raise TypeError("inference_fn must be callable")
+        if n_resamples < 2:
+            raise ValueError("n_resamples must be >= 2")
+        if block_rows < 1:
+            raise ValueError("block_rows must be >= 1")
+
+        self.inference_fn = inference_fn
+        self.n_resamples = n_resamples
+        self.seed = seed
+        self.block_rows = block_rows
+        self.max_workers = max_workers
+
+    # ------------------------------------------------------------------
+    # Perturbation mode
+    # ------------------------------------------------------------------
+
+    def perturbation_stability(
+        self,
+        X: np.ndarray,
+        *,
+        relative_noise: Union[float, Sequence[float]] = 0.01,
+        segments: Optional[np.ndarray] = None,
+    ) -> PerturbationStabilityResult:
+        """
+        Perturb each row n_resamples times: x' = x * (1 + noise * z),
+        z ~ N(0, 1) per feature. A zero noise entry keeps that feature
+        fixed (e.g. encoded categoricals).
+        """
+        if self.inference_fn is None:
+            raise ValueError("Perturbation mode requires inference_fn")
+        if not isinstance(X, np.ndarray) or X.ndim != 2 or X.shape[0] == 0:
+            raise TypeError("X must be a non-empty 2D numpy array")
+
+        noise = np.broadcast_to(
+            np.asarray(relative_noise, dtype=np.float64), (X.shape[1],)
+        ).copy()
+        if np.any(noise < 0):
+            raise ValueError("relative_noise must be non-negative")
+
+        segment_keys = _segment_keys(segments, X.shape[0])
+
+        bounds = [
+            (lo, min(lo + self.block_rows, X.shape[0]))
+            for lo in range(0, X.shape[0], self.block_rows)
+        ]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(bounds))
+        tasks = [
+            (self.inference_fn, X[lo:hi], noise, self.n_resamples, child)
+            for (lo, hi), child in zip(bounds, seeds)
+        ]
+        blocks = self._map(_perturb_block, tasks)
+
+        columns = {
+            name: np.concatenate([block[name] for block in blocks])
+            for name in blocks[0]
+        }
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cv = np.where(
+                columns["mean"] != 0,
+                columns["std"] / np.abs(columns["mean"]),
+                np.nan,
+            )
+
+        return PerturbationStabilityResult(
+            n_resamples=self.n_resamples,
+            seed=self.seed,
+            block_rows=self.block_rows,
+            base_prediction=columns["base"],
+            mean_prediction=columns["mean"],
+            std_prediction=columns["std"],
+            coefficient_of_variation=cv,
+            p05_prediction=columns["p05"],
+            p95_prediction=columns["p95"],
+            max_absolute_shift=columns["max_abs_shift"],
+            per_segment=_perturbation_segments(segment_keys, columns, cv),
+        )
+
+    # ------------------------------------------------------------------
+    # Bootstrap mode
+    # ------------------------------------------------------------------
+
+    def bootstrap_shift(
+        self,
+        y_pred_reference: np.ndarray,
+        y_pred_candidate: np.ndarray,
+        *,
+        segments: Optional[np.ndarray] = None,
+        confidence_level: float = 0.95,
+        max_cells: int = 4_000_000,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Bootstrap distributions of StabilityCheck shift metrics, overall
+        and per segment.
+
+        Returns per segment:
+        - point_estimate: StabilityCheck.check on the full segment
+        - bootstrap: {statistic: {mean, std, ci_lower, ci_upper}}
+        """
+        StabilityCheck._validate_inputs(y_pred_reference, y_pred_candidate)
+        if not 0 < confidence_level < 1:
+            raise ValueError("confidence_level must be in (0, 1)")
+
+        reference = y_pred_reference.ravel()
+        candidate = y_pred_candidate.ravel()
+        segment_keys = _segment_keys(segments, reference.size)
+
+        groups: List[Tuple[str, np.ndarray]] = [("__all__", np.arange(reference.size))]
+        if segment_keys is not None:
+            for key in np.unique(segment_keys):
+                groups.append((str(key), np.flatnonzero(segment_keys == key)))
+
+        seeds = np.random.SeedSequence(self.seed).spawn(len(groups))
+        tasks = [
+            (
+                reference[rows],
+                candidate[rows],
+                self.n_resamples,
+                child,
+                confidence_level,
+                max_cells,
+            )
+            for (_, rows), child in zip(groups, seeds)
+        ]
+        summaries = self._map(_bootstrap_group, tasks)
+
+        return {
+            name: {
+                "n_samples": int(rows.size),
+                "n_resamples": self.n_resamples,
+                "seed": self.seed,
+                "confidence_level": confidence_level,
+                "point_estimate": StabilityCheck.check(
+                    reference[rows], candidate[rows]
+                )["shift_metrics"],
+                "bootstrap": summary,
+            }
+            for (name, rows), summary in zip(groups, summaries)
+        }
+
+    # ------------------------------------------------------------------
+
+    def _map(self, fn: Callable[..., Any], tasks: List[Tuple[Any, ...]]) -> List[Any]:
+        if self.max_workers is None or self.max_workers <= 1 or len(tasks) <= 1:
+            return [fn(*task) for task in tasks]
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(fn, *task) for task in tasks]
+            return [future.result() for future in futures]
+
+
+# =========================================================
+# WORKER KERNELS (module-level for pickling)
+# =========================================================
+
+def _perturb_block(
+    inference_fn: Callable[[np.ndarray], np.ndarray],
+    X_block: np.ndarray,
+    noise: np.ndarray,
+    n_resamples: int,
+    seed: np.random.SeedSequence,
+) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    n_rows, n_features = X_block.shape
+
+    base = _predict(inference_fn, X_block, n_rows)
+
+    # (n_rows * n_resamples, n_features), grouped by property
+    repeated = np.repeat(X_block.astype(np.float64), n_resamples, axis=0)
+    z = rng.standard_normal(repeated.shape)
+    perturbed = repeated * (1.0 + z * noise)
+
+    predictions = _predict(inference_fn, perturbed, n_rows * n_resamples)
+    predictions = predictions.reshape(n_rows, n_resamples)
+
+    p05, p95 = np.quantile(predictions, [0.05, 0.95], axis=1)
+    return {
+        "base": base,
+        "mean": predictions.mean(axis=1),
+        "std": predictions.std(axis=1),
+        "p05": p05,
+        "p95": p95,
+        "max_abs_shift": np.abs(predictions - base[:, None]).max(axis=1),
+    }
+
+
+def _bootstrap_group(
+    reference: np.ndarray,
+    candidate: np.ndarray,
+    n_resamples: int,
+    seed: np.random.SeedSequence,
+    confidence_level: float,
+    max_cells: int,
+) -> Dict[str, Dict[str, Optional[float]]]:
+    rng = np.random.default_rng(seed)
+    n = reference.size
+    diff = candidate - reference
+
+    stats = {name: np.empty(n_resamples, dtype=np.float64) for name in SHIFT_STATISTICS}
+    batch = max(1, min(n_resamples, max_cells // max(n, 1)))
+
+    for start in range(0, n_resamples, batch):
+        stop = min(start + batch, n_resamples)
+        idx = rng.integers(0, n, size=(stop - start, n))
+
+        sampled_diff = diff[idx]
+        mean_shift = sampled_diff.mean(axis=1)
+        mean_reference = reference[idx].mean(axis=1)
+
+        stats["mean_shift"][start:stop] = mean_shift
+        stats["mean_absolute_shift"][start:stop] = np.abs(sampled_diff).mean(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stats["relative_mean_change"][start:stop] = np.where(
+                mean_reference != 0, mean_shift / mean_reference, np.nan
+            )
+
+    alpha = (1.0 - confidence_level) / 2.0
+    summary: Dict[str, Dict[str, Optional[float]]] = {}
+    for name, values in stats.items():
+        finite = values[np.isfinite(values)]
+        if finite.size == 0:
+            summary[name] = {"mean": None, "std": None, "ci_lower": None, "ci_upper": None}
+            continue
+        lower, upper = np.quantile(finite, [alpha, 1.0 - alpha])
+        summary[name] = {
+            "mean": float(finite.mean()),
+            "std": float(finite.std()),
+            "ci_lower": float(lower),
+            "ci_upper": float(upper),
+        }
+    return summary
+
+
+# =========================================================
+# HELPERS
+# =========================================================
+
+def _predict(
+    inference_fn: Callable[[np.ndarray], np.ndarray],
+    X: np.ndarray,
+    n_rows: int,
+) -> np.ndarray:
+    y_pred = inference_fn(X)
+    if not isinstance(y_pred, np.ndarray):
+        raise TypeError("Inference output must be a numpy array")
+    y_pred = y_pred.astype(np.float64, copy=False).ravel()
+    if y_pred.size != n_rows:
+        raise ValueError("Inference output must have one value per row")
+    return y_pred
+
+
+def _segment_keys(segments: Optional[np.ndarray], n_rows: int) -> Optional[np.ndarray]:
+    if segments is None:
+        return None
+    keys = np.asarray(segments)
+    if keys.shape != (n_rows,):
+        raise ValueError("segments must have one entry per row")
+    return keys
+
+
+def _perturbation_segments(
+    segment_keys: Optional[np.ndarray],
+    columns: Dict[str, np.ndarray],
+    cv: np.ndarray,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Segment summaries of per-property spread (overall under '__all__').
+    """
+    n_rows = columns["base"].size
+    if segment_keys is None:
+        labels = np.array(["__all__"])
+        inverse = np.zeros(n_rows, dtype=np.int64)
+    else:
+        labels, inverse = np.unique(segment_keys, return_inverse=True)
+
+    counts = np.bincount(inverse, minlength=labels.size)
+
+    def group_mean(values: np.ndarray) -> np.ndarray:
+        finite = np.isfinite(values)
+        sums = np.bincount(inverse[finite], weights=values[finite], minlength=labels.size)
+        n = np.bincount(inverse[finite], minlength=labels.size)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(n > 0, sums / n, np.nan)
+
+    mean_std = group_mean(columns["std"])
+    mean_cv = group_mean(cv)
+    mean_max_shift = group_mean(columns["max_abs_shift"])
+    max_shift = np.full(labels.size, -np.inf)
+    np.maximum.at(max_shift, inverse, columns["max_abs_shift"])
+
+    per_segment: Dict[str, Dict[str, Any]] = {}
+    if segment_keys is not None:
+        per_segment["__all__"] = _segment_row(
+            n_rows,
+            float(np.nanmean(columns["std"])),
+            _optional_float(np.nanmean(cv) if np.isfinite(cv).any() else np.nan),
+            float(np.mean(columns["max_abs_shift"])),
+            float(np.max(columns["max_abs_shift"])),
+        )
+    for i, label in enumerate(labels):
+        per_segment[str(label)] = _segment_row(
+            int(counts[i]),
+            _optional_float(mean_std[i]),
+            _optional_float(mean_cv[i]),
+            _optional_float(mean_max_shift[i]),
+            float(max_shift[i]),
+        )
+    return per_segment
+
+
+def _segment_row(
+    n_properties: int,
+    mean_std: Optional[float],
+    mean_cv: Optional[float],
+    mean_max_shift: Optional[float],
+    max_shift: float,
+) -> Dict[str, Any]:
+    return {
+        "n_properties": n_properties,
+        "mean_prediction_std": mean_std,
+        "mean_coefficient_of_variation": mean_cv,
+        "mean_max_absolute_shift": mean_max_shift,
+        "max_absolute_shift": max_shift,
+    }
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    value = float(value)
+    return value if np.isfinite(value) else None
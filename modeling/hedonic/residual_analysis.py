@@ -10,13 +10,15 @@ Purpose:
 - Provide descriptive diagnostics ONLY
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 import math
 import statistics
 import hashlib
 import json
 
+import numpy as np
+
 
 # ---------------------------------------------------------------------
 # Data Contracts
@@ -63,6 +65,42 @@ class ResidualReport:
     audit_hash: str
 
 
+@dataclass(frozen=True)
+class SegmentResidualSummary:
+    """
+    Residual metrics and buckets for one segment value.
+    """
+    residual_metrics: ResidualMetrics
+    residual_distribution: Dict[str, int]
+
+
+@dataclass(frozen=True)
+class SegmentedResidualReport:
+    """
+    Batch residual analysis artifact with segment breakdown.
+
+    segments: dimension (e.g. "district") -> segment value -> summary
+    """
+    model_id: str
+    model_version: str
+    feature_snapshot_hash: str
+    residual_metrics: ResidualMetrics
+    residual_distribution: Dict[str, int]
+    segments: Dict[str, Dict[str, SegmentResidualSummary]]
+    limitations: List[str]
+    audit_hash: str
+
+
+# Bucket labels in report order (same ranges as _residual_buckets)
+RESIDUAL_BUCKET_LABELS = (
+    "< -30%",
+    "-30% to -10%",
+    "-10% to +10%",
+    "+10% to +30%",
+    "> +30%",
+)
+
+
 # ---------------------------------------------------------------------
 # Residual Analyzer
 # ---------------------------------------------------------------------
@@ -104,6 +142,32 @@ class HedonicResidualAnalyzer:
             audit_hash=audit_hash
         )
 
+    def analyze_batch(
+        self,
+        *,
+        model_id: str,
+        model_version: str,
+        feature_snapshot_hash: str,
+        predictions: Any,
+        actuals: Any,
+        segments: Optional[Mapping[str, Any]] = None,
+    ) -> SegmentedResidualReport:
+        """
+        Columnar analysis of aligned prediction / actual arrays.
+
+        segments: dimension name -> array of segment values per row
+        (e.g. {"district": ..., "tier": ..., "price_band": ...}).
+        Rows with NaN prediction or actual (missing ground truth) are
+        skipped.
+        """
+        accumulator = ResidualAccumulator(
+            model_id=model_id,
+            model_version=model_version,
+            feature_snapshot_hash=feature_snapshot_hash,
+        )
+        accumulator.update(predictions, actuals, segments)
+        return accumulator.report()
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -205,3 +269,300 @@ class HedonicResidualAnalyzer:
             "Residuals must not be used directly in valuation decisions.",
             "Analysis does not account for unobserved property attributes."
         ]
+
+
+# ---------------------------------------------------------------------
+# Incremental Columnar Accumulator
+# ---------------------------------------------------------------------
+
+# Per-segment absolute errors kept for an exact median; above this
+# count the segment switches to a bounded log-binned sketch
+DEFAULT_EXACT_MEDIAN_LIMIT = 100_000
+
+# Relative accuracy of the sketched median absolute error
+DEFAULT_MEDIAN_RELATIVE_ACCURACY = 1e-3
+
+
+class _LogBinnedQuantiles:
+    """
+    Bounded quantile summary of non-negative values.
+
+    Values are counted in log-spaced bins of ratio gamma =
+    (1 + a) / (1 - a), so any quantile is returned within relative
+    error a. Memory depends on the value range, not on the count
+    (a few thousand bins for a 1e-6 .. 1e12 range at a = 1e-3).
+    Values below min_value share one zero bin.
+    """
+
+    def __init__(self, relative_accuracy: float, min_value: float = 1e-12) -> None:
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+
+    def update(self, values: np.ndarray) -> None:
+        small = values < self.min_value
+        self._zero_count += int(np.count_nonzero(small))
+        positive = values[~small]
+        if positive.size:
+            index = np.ceil(np.log(positive) / self._log_gamma).astype(np.int64)
+            keys, counts = np.unique(index, return_counts=True)
+            for key, count in zip(keys.tolist(), counts.tolist()):
+                self._bins[key] = self._bins.get(key, 0) + count
+        self.count += int(values.size)
+
+    def quantile(self, q: float) -> float:
+        rank = q * (self.count - 1)
+        if rank < self._zero_count:
+            return 0.0
+        seen = self._zero_count
+        for key in sorted(self._bins):
+            seen += self._bins[key]
+            if rank < seen:
+                return 2.0 * self._gamma ** key / (self._gamma + 1.0)
+        return 2.0 * self._gamma ** max(self._bins) / (self._gamma + 1.0)
+
+
+@dataclass
+class _SegmentState:
+    """
+    Mergeable residual state for one segment value.
+
+    Absolute errors are retained (exact median) until the segment
+    exceeds the accumulator's exact-median limit; they are then folded
+    into a bounded _LogBinnedQuantiles sketch, so memory stays bounded
+    across incremental updates.
+    """
+    count: int = 0
+    sum_error: float = 0.0
+    sum_abs_error: float = 0.0
+    sum_sq_error: float = 0.0
+    max_error: float = -math.inf
+    min_error: float = math.inf
+    buckets: np.ndarray = field(
+        default_factory=lambda: np.zeros(len(RESIDUAL_BUCKET_LABELS), dtype=np.int64)
+    )
+    abs_error_chunks: List[np.ndarray] = field(default_factory=list)
+    abs_error_sketch: Optional[_LogBinnedQuantiles] = None
+
+
+class ResidualAccumulator:
+    """
+    Incremental, columnar residual analysis.
+
+    - update() ingests newly closed transactions as aligned arrays
+    - every segment dimension is grouped in the same pass over the batch
+    - report() can be produced at any time (e.g. daily)
+    - memory is bounded: a segment's median absolute error is exact up
+      to exact_median_limit rows, then sketched within
+      median_relative_accuracy (all other metrics stay exact)
+    """
+
+    OVERALL_KEY = ("__all__", "__all__")
+
+    def __init__(
+        self,
+        *,
+        model_id: str,
+        model_version: str,
+        feature_snapshot_hash: str,
+        exact_median_limit: int = DEFAULT_EXACT_MEDIAN_LIMIT,
+        median_relative_accuracy: float = DEFAULT_MEDIAN_RELATIVE_ACCURACY,
+    ) -> None:
+        if exact_median_limit < 1:
+            raise ValueError("exact_median_limit must be >= 1")
+        if not 0.0 < median_relative_accuracy < 1.0:
+            raise ValueError("median_relative_accuracy must be in (0, 1)")
+
+        self.model_id = model_id
+        self.model_version = model_version
+        self.feature_snapshot_hash = feature_snapshot_hash
+        self.exact_median_limit = exact_median_limit
+        self.median_relative_accuracy = median_relative_accuracy
+        self._states: Dict[Tuple[str, str], _SegmentState] = {}
+
+    @property
+    def count(self) -> int:
+        state = self._states.get(self.OVERALL_KEY)
+        return 0 if state is None else state.count
+
+    def update(
+        self,
+        predictions: Any,
+        actuals: Any,
+        segments: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        pred = np.asarray(predictions, dtype=np.float64).ravel()
+        actual = np.asarray(actuals, dtype=np.float64).ravel()
+        if pred.shape != actual.shape:
+            raise ValueError("predictions and actuals must have the same length")
+
+        segment_columns = {
+            name: np.asarray(values).ravel() for name, values in (segments or {}).items()
+        }
+        for name, values in segment_columns.items():
+            if values.shape != pred.shape:
+                raise ValueError(f"Segment column '{name}' must align with predictions")
+
+        observed = ~(np.isnan(pred) | np.isnan(actual))
+        errors = pred[observed] - actual[observed]
+        if errors.size == 0:
+            return
+
+        bucket_index = _bucket_index(errors)
+        abs_errors = np.abs(errors)
+
+        self._update_groups(
+            self.OVERALL_KEY[0],
+            np.zeros(errors.size, dtype=np.int64),
+            np.array([self.OVERALL_KEY[1]]),
+            errors,
+            abs_errors,
+            bucket_index,
+        )
+        for name, values in segment_columns.items():
+            labels, inverse = np.unique(values[observed].astype(str), return_inverse=True)
+            self._update_groups(name, inverse, labels, errors, abs_errors, bucket_index)
+
+    def report(self) -> SegmentedResidualReport:
+        overall = self._states.get(self.OVERALL_KEY)
+        if overall is None:
+            raise ValueError("No overlapping prediction/actual pairs")
+
+        overall_summary = _summarize(overall)
+        segments: Dict[str, Dict[str, SegmentResidualSummary]] = {}
+        for (dimension, value), state in sorted(self._states.items()):
+            if (dimension, value) == self.OVERALL_KEY:
+                continue
+            segments.setdefault(dimension, {})[value] = _summarize(state)
+
+        payload = {
+            "model_id": self.model_id,
+            "model_version": self.model_version,
+            "feature_snapshot_hash": self.feature_snapshot_hash,
+            "metrics": overall_summary.residual_metrics.__dict__,
+            "distribution": overall_summary.residual_distribution,
+            "segments": {
+                dimension: {
+                    value: {
+                        "metrics": summary.residual_metrics.__dict__,
+                        "distribution": summary.residual_distribution,
+                    }
+                    for value, summary in values.items()
+                }
+                for dimension, values in segments.items()
+            },
+        }
+        raw = json.dumps(payload, sort_keys=True).encode("utf-8")
+
+        return SegmentedResidualReport(
+            model_id=self.model_id,
+            model_version=self.model_version,
+            feature_snapshot_hash=self.feature_snapshot_hash,
+            residual_metrics=overall_summary.residual_metrics,
+            residual_distribution=overall_summary.residual_distribution,
+            segments=segments,
+            limitations=HedonicResidualAnalyzer._limitations(),
+            audit_hash=hashlib.sha256(raw).hexdigest(),
+        )
+
+    def _update_groups(
+        self,
+        dimension: str,
+        inverse: np.ndarray,
+        labels: np.ndarray,
+        errors: np.ndarray,
+        abs_errors: np.ndarray,
+        bucket_index: np.ndarray,
+    ) -> None:
+        n_groups = labels.size
+        counts = np.bincount(inverse, minlength=n_groups)
+        sum_error = np.bincount(inverse, weights=errors, minlength=n_groups)
+        sum_abs = np.bincount(inverse, weights=abs_errors, minlength=n_groups)
+        sum_sq = np.bincount(inverse, weights=errors * errors, minlength=n_groups)
+        buckets = np.bincount(
+            inverse * len(RESIDUAL_BUCKET_LABELS) + bucket_index,
+            minlength=n_groups * len(RESIDUAL_BUCKET_LABELS),
+        ).reshape(n_groups, len(RESIDUAL_BUCKET_LABELS))
+
+        order = np.argsort(inverse, kind="stable")
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        sorted_errors = errors[order]
+        sorted_abs = abs_errors[order]
+
+        for g in range(n_groups):
+            if counts[g] == 0:
+                continue
+            lo, hi = starts[g], starts[g] + counts[g]
+            key = (dimension, str(labels[g]))
+            state = self._states.get(key)
+            if state is None:
+                state = _SegmentState()
+                self._states[key] = state
+
+            state.count += int(counts[g])
+            state.sum_error += float(sum_error[g])
+            state.sum_abs_error += float(sum_abs[g])
+            state.sum_sq_error += float(sum_sq[g])
+            state.max_error = max(state.max_error, float(sorted_errors[lo:hi].max()))
+            state.min_error = min(state.min_error, float(sorted_errors[lo:hi].min()))
+            state.buckets += buckets[g]
+            self._retain_abs_errors(state, sorted_abs[lo:hi])
+
+    def _retain_abs_errors(self, state: _SegmentState, abs_errors: np.ndarray) -> None:
+        if state.abs_error_sketch is not None:
+            state.abs_error_sketch.update(abs_errors)
+            return
+
+        # Copy so the batch arrays are not kept alive by a slice view
+        state.abs_error_chunks.append(abs_errors.copy())
+        if state.count > self.exact_median_limit:
+            sketch = _LogBinnedQuantiles(self.median_relative_accuracy)
+            for chunk in state.abs_error_chunks:
+                sketch.update(chunk)
+            state.abs_error_sketch = sketch
+            state.abs_error_chunks = []
+
+
+def _bucket_index(errors: np.ndarray) -> np.ndarray:
+    """
+    Vectorized _residual_buckets ranges (NaN falls in the last bucket,
+    as in the scalar version).
+    """
+    index = np.full(errors.shape, 4, dtype=np.int64)
+    index[errors <= 0.30] = 3
+    index[errors <= 0.10] = 2
+    index[errors < -0.10] = 1
+    index[errors < -0.30] = 0
+    return index
+
+
+def _summarize(state: _SegmentState) -> SegmentResidualSummary:
+    if state.abs_error_sketch is not None:
+        median_abs_error = state.abs_error_sketch.quantile(0.5)
+    else:
+        if len(state.abs_error_chunks) > 1:
+            state.abs_error_chunks = [np.concatenate(state.abs_error_chunks)]
+        median_abs_error = float(np.median(state.abs_error_chunks[0]))
+
+    metrics = ResidualMetrics(
+        count=state.count,
+        mean_error=state.sum_error / state.count,
+        mean_absolute_error=state.sum_abs_error / state.count,
+        root_mean_squared_error=math.sqrt(state.sum_sq_error / state.count),
+        median_absolute_error=median_abs_error,
+        max_positive_error=state.max_error,
+        max_negative_error=state.min_error,
+    )
+    distribution = {
+        label: int(count) for label, count in zip(RESIDUAL_BUCKET_LABELS, state.buckets)
+    }
+    return SegmentResidualSummary(
+        residual_metrics=metrics,
+        residual_distribution=distribution,
+    )
@@ -0,0 +1,120 @@
+"""
+Parity: columnar tabular feature extraction vs the per-record extractors.
+"""
+
+import pandas as pd
+
+from feature_pipeline.tabular.batch_features import (
+    check_record_parity,
+    extract_tabular_features_batch,
+)
+from feature_pipeline.tabular.structural_features import extract_structural_features
+from feature_pipeline.tabular.time_features import extract_time_features
+
+
+REFERENCE_TIME = "2024-06-30T00:00:00"
+EXTRACTED_AT = "2024-07-01T00:00:00"
+
+RECORDS = [
+    {
+        "land_area_sqm": 120.5,
+        "num_floors": 3,
+        "corner_lot_flag": True,
+        "construction_year": 2010,
+        "last_renovation_year": 2030,
+        "ownership_type": "private",
+        "nearby_listing_count": 14,
+    },
+    {
+        # Present with value None: must stay None, not the default
+        "corner_lot_flag": None,
+        "construction_year": None,
+        "new_supply_flag": None,
+    },
+    {
+        # Absent keys: per-record defaults apply
+        "land_area_sqm": 80,
+        "construction_year": 1995,
+    },
+    {
+        "construction_year": 2001.0,
+        "zoning_label": "R1",
+        "declared_mortgage_flag": False,
+    },
+]
+
+
+def _batch(records):
+    return extract_tabular_features_batch(
+        records,
+        reference_time_utc=REFERENCE_TIME,
+        extracted_at_utc=EXTRACTED_AT,
+    )
+
+
+def test_list_of_dicts_parity_with_per_record_extractors():
+    batch = _batch(RECORDS)
+    assert check_record_parity(RECORDS, batch) == []
+
+
+def test_int_years_stay_int_next_to_none():
+    batch = _batch(RECORDS)
+    features = batch.record_payload(0, "time")["features"]
+
+    assert features["construction_year"] == 2010
+    assert isinstance(features["construction_year"], int)
+    assert features["asset_age_years"] == 14
+    assert isinstance(features["asset_age_years"], int)
+    assert features["years_since_renovation"] == 0
+
+
+def test_present_none_distinct_from_absent():
+    batch = _batch(RECORDS)
+
+    assert batch.record_payload(1, "structural")["features"]["corner_lot_flag"] is None
+    assert batch.record_payload(2, "structural")["features"]["corner_lot_flag"] is False
+    assert batch.record_payload(1, "market")["features"]["new_supply_flag"] is None
+
+
+def test_hashes_match_per_record_payloads():
+    batch = _batch(RECORDS)
+
+    for row, record in enumerate(RECORDS):
+        for group, extractor in (
+            ("structural", extract_structural_features),
+            ("time", lambda r: extract_time_features(r, reference_time_utc=REFERENCE_TIME)),
+        ):
+            expected = extractor(record)
+            expected["extracted_at_utc"] = EXTRACTED_AT
+            expected.pop("feature_hash")
+
+            actual = batch.record_payload(row, group)
+            actual.pop("feature_hash")
+            assert actual == expected
+            assert (
+                batch.feature_hashes[f"{group}_feature_hash"].iloc[row]
+                == batch.record_payload(row, group)["feature_hash"]
+            )
+
+
+def test_parity_detects_mismatch_against_original_records():
+    batch = _batch(RECORDS)
+    altered = [dict(record) for record in RECORDS]
+    altered[1]["corner_lot_flag"] = True
+
+    mismatches = check_record_parity(altered, batch)
+    assert [m["row"] for m in mismatches] == [1]
+    assert mismatches[0]["feature_group"] == "STRUCTURAL_TABULAR"
+
+
+def test_dataframe_missing_cells_behave_like_absent_keys():
+    frame = pd.DataFrame(
+        {
+            "construction_year": [2010, 2015],
+            "corner_lot_flag": [True, None],
+        }
+    )
+    batch = _batch(frame)
+
+    assert check_record_parity(frame, batch) == []
+    assert batch.record_payload(1, "structural")["features"]["corner_lot_flag"] is False
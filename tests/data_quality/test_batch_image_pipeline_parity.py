@@ -0,0 +1,125 @@
+"""
+Parity: batch image pipeline (in-process and pooled) vs the scalar
+image extractors on decoded PIL images.
+"""
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from feature_pipeline.image.batch_image_pipeline import (
+    ImageTask,
+    iter_image_features,
+    iter_listing_image_summaries,
+)
+from feature_pipeline.image.condition_score import compute_image_condition_score
+from feature_pipeline.image.facade_width_estimator import estimate_facade_width
+from feature_pipeline.image.floor_count_estimator import estimate_floor_count
+from feature_pipeline.image.image_quality_metrics import extract_image_quality_metrics
+
+
+BBOX = {"x_min": 40, "x_max": 900, "y_min": 10, "y_max": 700}
+
+
+def _photo(seed, size=(1400, 900), fmt="PNG"):
+    rng = np.random.default_rng(seed)
+    pixels = rng.integers(0, 256, (size[1] // 10, size[0] // 10, 3), dtype=np.uint8)
+    image = Image.fromarray(pixels).resize(size, Image.Resampling.BILINEAR)
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def _tasks():
+    photos = [_photo(0), _photo(1, fmt="JPEG"), _photo(2, size=(300, 200)), b"not an image"]
+    return [
+        ImageTask(
+            listing_id=f"L{i % 2}",
+            image_index=i,
+            source=data,
+            facade_bbox=BBOX if i % 2 == 0 else None,
+        )
+        for i, data in enumerate(photos)
+    ]
+
+
+def test_full_resolution_results_match_scalar_extractors():
+    tasks = _tasks()
+    results = list(iter_image_features(tasks, max_workers=1))
+
+    assert [r.image_index for r in results] == [t.image_index for t in tasks]
+    for task, result in zip(tasks[:-1], results[:-1]):
+        image = Image.open(io.BytesIO(task.source))
+        quality = extract_image_quality_metrics(image)
+
+        assert result.error is None
+        for name, value in quality.items():
+            assert result.quality_metrics[name] == value
+        assert (
+            result.quality_metrics["analysis_width_px"],
+            result.quality_metrics["analysis_height_px"],
+        ) == image.size
+        assert result.condition == compute_image_condition_score(quality)
+        assert result.facade_width == estimate_facade_width(image, _axis(task.facade_bbox, "x"))
+        assert result.floor_count == estimate_floor_count(image, _axis(task.facade_bbox, "y"))
+
+    assert results[-1].error.startswith("ImageLoadError")
+
+
+def test_default_pool_matches_in_process_run():
+    tasks = _tasks()
+    serial = list(iter_image_features(tasks, max_workers=1))
+
+    assert list(iter_image_features(iter(tasks))) == serial
+    assert list(iter_image_features(tasks, max_workers=2, max_in_flight=1)) == serial
+
+
+def test_capped_resolution_is_recorded():
+    tasks = _tasks()[:1]
+    capped = list(iter_image_features(tasks, max_workers=1, analysis_max_side=256))[0]
+
+    assert (capped.quality_metrics["width"], capped.quality_metrics["height"]) == (1400, 900)
+    assert capped.quality_metrics["analysis_width_px"] == 256
+
+    summaries = list(
+        iter_listing_image_summaries(
+            {"L0": [tasks[0].source], "L1": []},
+            max_workers=1,
+            analysis_max_side=256,
+        )
+    )
+    assert {s.listing_id: s.analysis_max_side for s in summaries} == {"L0": 256, "L1": 256}
+
+
+def test_listing_summaries_aggregate_per_image_results():
+    tasks = _tasks()
+    listings = {
+        "L0": [{"source": tasks[0].source, "facade_bbox": BBOX}, tasks[2].source],
+        "L1": [tasks[1].source, tasks[3].source, tasks[1].source],
+    }
+    seen = []
+    summaries = {
+        s.listing_id: s
+        for s in iter_listing_image_summaries(listings, on_image=seen.append, max_workers=1)
+    }
+
+    assert len(seen) == 5
+    assert summaries["L0"].analysis_max_side is None
+    assert (summaries["L1"].n_images, summaries["L1"].n_failed) == (3, 1)
+    assert summaries["L1"].n_distinct_images == 1
+
+    sharpness = [
+        r.quality_metrics["sharpness_proxy"] for r in seen if r.listing_id == "L0"
+    ]
+    metric = summaries["L0"].metrics["sharpness_proxy"]
+    assert metric["count"] == 2
+    assert metric["mean"] == pytest.approx(sum(sharpness) / 2)
+    assert summaries["L0"].metrics["facade_width_ratio"]["count"] == 1
+
+
+def _axis(bbox, axis):
+    if bbox is None:
+        return None
+    return {key: bbox[key] for key in (f"{axis}_min", f"{axis}_max")}
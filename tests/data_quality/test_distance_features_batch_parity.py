@@ -0,0 +1,138 @@
+"""
+Parity: vectorized Haversine distance tables / nearest-k features vs
+the scalar _haversine_km, including missing coordinates and empty inputs.
+"""
+
+import numpy as np
+import pytest
+
+from feature_pipeline.geo.distance_features import (
+    _haversine_km,
+    compute_distance_features,
+    compute_distance_matrix,
+    compute_nearest_distance_features,
+    haversine_matrix_km,
+)
+
+
+def _points(n, seed):
+    rng = np.random.default_rng(seed)
+    lat = rng.uniform(10.6, 10.9, n)
+    lon = rng.uniform(106.5, 106.9, n)
+    return lat, lon
+
+
+# Identical points, poles, the antimeridian and near-antipodal pairs
+EDGE_SUBJECTS = (
+    np.array([10.8, 90.0, -89.9, 0.0, 45.0]),
+    np.array([106.7, 0.0, 12.0, 179.999, -120.0]),
+)
+EDGE_REFERENCES = (
+    np.array([10.8, -90.0, 89.9, 0.0, -45.0, 0.0]),
+    np.array([106.7, 33.0, -168.0, -179.999, 60.0, 0.0]),
+)
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_matrix_matches_scalar_haversine(seed):
+    subject_lat, subject_lon = _points(25, seed)
+    ref_lat, ref_lon = _points(40, seed + 10)
+    subject_lat = np.concatenate((subject_lat, EDGE_SUBJECTS[0]))
+    subject_lon = np.concatenate((subject_lon, EDGE_SUBJECTS[1]))
+    ref_lat = np.concatenate((ref_lat, EDGE_REFERENCES[0]))
+    ref_lon = np.concatenate((ref_lon, EDGE_REFERENCES[1]))
+
+    matrix = haversine_matrix_km(subject_lat, subject_lon, ref_lat, ref_lon)
+
+    expected = np.array(
+        [
+            [_haversine_km(a, o, b, p) for b, p in zip(ref_lat, ref_lon)]
+            for a, o in zip(subject_lat, subject_lon)
+        ]
+    )
+    np.testing.assert_allclose(matrix, expected, rtol=1e-12, atol=1e-9)
+
+    # Chunked, rounded table matches compute_distance_features per row
+    table = compute_distance_matrix(
+        subject_lat, subject_lon, ref_lat, ref_lon, max_chunk_cells=7
+    )
+    references = {
+        f"r{j}": {"latitude": b, "longitude": p}
+        for j, (b, p) in enumerate(zip(ref_lat, ref_lon))
+    }
+    for i in range(0, subject_lat.size, 6):
+        scalar = compute_distance_features(
+            {"latitude": subject_lat[i], "longitude": subject_lon[i]}, references
+        )["distance_km"]
+        np.testing.assert_allclose(
+            table[i], [scalar[f"r{j}"] for j in range(ref_lat.size)], rtol=0, atol=1e-4
+        )
+
+
+def test_nearest_features_match_brute_force():
+    subject_lat, subject_lon = _points(30, 2)
+    ref_lat, ref_lon = _points(50, 3)
+    categories = np.array(["metro", "school", "park"] * 16 + ["hospital", "metro"])
+    ref_lat[::9] = np.nan  # unlocated references are ignored
+    subject_lat[4] = np.nan
+
+    summaries = compute_nearest_distance_features(
+        subject_lat,
+        subject_lon,
+        ref_lat,
+        ref_lon,
+        categories,
+        k=3,
+        radii_km=(1.0, 5.0),
+        round_decimals=None,
+        max_chunk_cells=11,
+    )
+
+    assert sorted(summaries) == ["hospital", "metro", "park", "school"]
+    for category, summary in summaries.items():
+        refs = [
+            j for j in range(ref_lat.size)
+            if categories[j] == category and not np.isnan(ref_lat[j])
+        ]
+        for i in range(subject_lat.size):
+            if np.isnan(subject_lat[i]):
+                assert np.isnan(summary.nearest_km[i]).all()
+                assert (summary.nearest_index[i] == -1).all()
+                assert all(summary.counts_within_km[r][i] == 0 for r in (1.0, 5.0))
+                continue
+
+            brute = sorted(
+                (_haversine_km(subject_lat[i], subject_lon[i], ref_lat[j], ref_lon[j]), j)
+                for j in refs
+            )
+            found = min(3, len(brute))
+            np.testing.assert_allclose(
+                summary.nearest_km[i, :found], [d for d, _ in brute[:found]], rtol=1e-12
+            )
+            assert summary.nearest_index[i, :found].tolist() == [j for _, j in brute[:found]]
+            assert np.isnan(summary.nearest_km[i, found:]).all()
+            assert (summary.nearest_index[i, found:] == -1).all()
+            for r in (1.0, 5.0):
+                assert summary.counts_within_km[r][i] == sum(d <= r for d, _ in brute)
+
+
+def test_missing_and_empty_inputs():
+    matrix = haversine_matrix_km([np.nan, 10.8], [106.7, 106.7], [10.7, np.nan], [106.6, 106.6])
+    assert np.isnan(matrix[0]).all() and np.isnan(matrix[:, 1]).all()
+    assert np.isfinite(matrix[1, 0])
+
+    assert haversine_matrix_km([], [], [10.7], [106.6]).shape == (0, 1)
+    assert compute_distance_matrix([10.8], [106.7], [], []).shape == (1, 0)
+    assert compute_distance_matrix([], [], [10.7], [106.6]).shape == (0, 1)
+    assert compute_nearest_distance_features([10.8], [106.7], [], [], []) == {}
+
+    summary = compute_nearest_distance_features(
+        [], [], [10.7], [106.6], ["metro"], k=2, radii_km=(1.0,)
+    )["metro"]
+    assert summary.nearest_km.shape == (0, 2)
+    assert summary.counts_within_km[1.0].shape == (0,)
+
+    with pytest.raises(ValueError):
+        compute_nearest_distance_features([10.8], [106.7], [10.7], [106.6], ["metro"], k=0)
+    with pytest.raises(ValueError):
+        compute_nearest_distance_features([10.8], [106.7], [10.7], [106.6], ["a", "b"])
@@ -0,0 +1,120 @@
+"""
+Parity: CompiledFeatureSchema.validate_batch vs FeatureValidator.validate
+applied row by row.
+"""
+
+import math
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from feature_pipeline.pipelines.feature_validation import (
+    FeatureValidationError,
+    FeatureValidator,
+)
+
+
+REQUIRED = ["area", "price"]
+RANGES = {"area": {"min": 10, "max": 500}, "price": {"min": 0}}
+
+AREA_VALUES = [50, 5, 600, 10.0, None, float("nan"), float("inf"), "120", True]
+PRICE_VALUES = [1.5, -1, None, 0, float("-inf")]
+METHOD_VALUES = ["hedonic", None, 3]
+
+
+def _rows(n=300, seed=11):
+    rng = random.Random(seed)
+    return [
+        {
+            "area": rng.choice(AREA_VALUES),
+            "price": rng.choice(PRICE_VALUES),
+            "method": rng.choice(METHOD_VALUES),
+            "disclaimer": "descriptive only",
+        }
+        for _ in range(n)
+    ]
+
+
+def _columns(rows):
+    return {
+        name: np.array([row[name] for row in rows], dtype=object)
+        for name in rows[0]
+    }
+
+
+def _first_errors(result):
+    first = {}
+    for record in result.errors:
+        first.setdefault(record["row_index"], record)
+    return first
+
+
+def _scalar_error(validator, row):
+    try:
+        validator.validate(row)
+    except FeatureValidationError as exc:
+        return str(exc)
+    return None
+
+
+def test_batch_matches_row_by_row_validate():
+    validator = FeatureValidator(required_fields=REQUIRED, numeric_ranges=RANGES)
+    rows = _rows()
+    result = validator.validate_batch(_columns(rows))
+    first = _first_errors(result)
+
+    for index, row in enumerate(rows):
+        expected = _scalar_error(validator, row)
+        assert result.valid_mask[index] == (expected is None), (index, row)
+        if expected is not None:
+            assert expected in first[index]["message"], (index, row)
+
+
+@pytest.mark.parametrize("absent", ["price", "method"])
+def test_absent_column_is_missing_field(absent):
+    validator = FeatureValidator(required_fields=REQUIRED, numeric_ranges=RANGES)
+    rows = [{k: v for k, v in row.items() if k != absent} for row in _rows(20)]
+    result = validator.validate_batch(_columns(rows))
+    first = _first_errors(result)
+
+    for index, row in enumerate(rows):
+        expected = _scalar_error(validator, row)
+        assert result.valid_mask[index] == (expected is None)
+        if expected is not None:
+            assert expected in first[index]["message"]
+
+
+def test_present_none_semantics():
+    validator = FeatureValidator(required_fields=["area"], numeric_ranges={"price": {"min": 0}})
+    batch = {
+        "area": np.array([None], dtype=object),
+        "price": np.array([None], dtype=object),
+        "method": np.array([None], dtype=object),
+        "disclaimer": np.array(["x"], dtype=object),
+    }
+    messages = [record["message"] for record in validator.validate_batch(batch).errors]
+
+    assert not any("Missing required field" in m for m in messages)
+    assert any("'price' must be numeric, got NoneType" in m for m in messages)
+    assert any("Metadata field 'method' must be string" in m for m in messages)
+
+
+def test_numeric_dataframe_columns():
+    validator = FeatureValidator(numeric_ranges=RANGES)
+    frame = pd.DataFrame(
+        {
+            "area": [50.0, math.nan, 700.0],
+            "price": [1, 2, -3],
+            "method": ["m", "m", "m"],
+            "disclaimer": ["d", "d", "d"],
+        }
+    )
+    result = validator.validate_batch(frame)
+
+    for index, row in enumerate(frame.to_dict("records")):
+        expected = _scalar_error(validator, row)
+        assert result.valid_mask[index] == (expected is None)
+        if expected is not None:
+            assert expected in _first_errors(result)[index]["message"]
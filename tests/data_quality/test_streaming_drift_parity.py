@@ -0,0 +1,118 @@
+"""
+Parity: streaming drift (QuantileSketch, PSI / approximate KS) vs the
+exact PSICalculator and KSTest.
+"""
+
+import bisect
+
+import numpy as np
+import pytest
+
+from feature_pipeline.drift.ks_test import KSTest, approximate_p_value
+from feature_pipeline.drift.psi_calculator import PSICalculator
+from feature_pipeline.drift.streaming_drift_monitor import (
+    QuantileSketch,
+    StreamingDriftError,
+    StreamingDriftMonitor,
+)
+
+
+# Rank error bound asserted for k=200 (observed error is about 1%)
+RANK_TOLERANCE = 0.02
+
+
+def _values(n, seed, shift=0.0):
+    rng = np.random.default_rng(seed)
+    return np.concatenate(
+        [rng.normal(shift, 1.0, n // 2), rng.lognormal(1.0 + shift, 0.4, n - n // 2)]
+    )
+
+
+def _rank_error(sketch, values):
+    points = np.quantile(values, np.linspace(0.0, 1.0, 201))
+    exact = np.searchsorted(np.sort(values), points, side="right") / values.size
+    return float(np.abs(sketch.cdf(points) - exact).max())
+
+
+def test_sketch_rank_error_and_size_stay_bounded():
+    values = _values(60_000, seed=0)
+    sketch = QuantileSketch(k=200)
+    for chunk in np.array_split(values, 97):
+        sketch.update(chunk)
+
+    assert sketch.n == values.size
+    assert sketch.retained < 2_000
+    assert _rank_error(sketch, values) <= RANK_TOLERANCE
+
+    probabilities = np.array([0.01, 0.25, 0.5, 0.75, 0.99])
+    estimated = sketch.quantiles(probabilities)
+    ranks = np.searchsorted(np.sort(values), estimated, side="right") / values.size
+    assert np.abs(ranks - probabilities).max() <= RANK_TOLERANCE
+
+
+def test_merged_sketches_match_the_union():
+    parts = [_values(n, seed=s, shift=0.1 * s) for s, n in enumerate((5_000, 20_000, 333))]
+
+    merged = QuantileSketch(k=200)
+    for part in parts:
+        sketch = QuantileSketch(k=200)
+        sketch.update(part)
+        merged.merge(sketch)
+
+    union = np.concatenate(parts)
+    assert merged.n == union.size
+    assert _rank_error(merged, union) <= RANK_TOLERANCE
+
+    with pytest.raises(StreamingDriftError):
+        merged.merge(QuantileSketch(k=64))
+
+
+def test_streaming_psi_matches_psi_calculator():
+    baseline = _values(8_000, seed=1)
+    current = _values(5_000, seed=2, shift=0.3)
+    current[::50] = np.nan
+
+    monitor = StreamingDriftMonitor.from_baseline({"x": baseline}, n_bins=10)
+    for chunk in np.array_split(current, 13):
+        monitor.update({"x": chunk})
+
+    edges = np.quantile(baseline, np.linspace(0, 1, 11)[1:-1]).tolist()
+    finite = current[np.isfinite(current)]
+    expected = PSICalculator.calculate_with_breakdown(
+        expected_distribution=_bin_counts(baseline, edges),
+        actual_distribution=_bin_counts(finite, edges),
+    )
+
+    result = monitor.psi("x")
+    assert result["psi_value"] == pytest.approx(expected["psi_value"], rel=1e-12)
+    assert monitor.snapshot()["x"]["n_current_non_finite"] == current.size - finite.size
+
+
+def test_streaming_ks_matches_exact_ks_within_sketch_error():
+    baseline = _values(20_000, seed=3)
+    for shift in (0.0, 0.05, 0.4):
+        current = _values(15_000, seed=4, shift=shift)
+
+        left = StreamingDriftMonitor.from_baseline({"x": baseline})
+        right = StreamingDriftMonitor.from_baseline({"x": baseline})
+        left.update({"x": current[:7_000]})
+        right.update({"x": current[7_000:]})
+        left.merge(right)
+
+        expected = KSTest.calculate(baseline=baseline.tolist(), current=current.tolist())
+        result = left.ks("x")
+
+        assert result["approximate"] is True
+        assert result["ks_statistic"] == pytest.approx(
+            expected["ks_statistic"], abs=2 * RANK_TOLERANCE
+        )
+        assert result["p_value"] == approximate_p_value(
+            result["ks_statistic"], baseline.size, current.size
+        )
+
+
+def _bin_counts(values, edges):
+    counts = [0.0] * (len(edges) + 1)
+    for value in values.tolist():
+        counts[bisect.bisect_left(edges, value)] += 1.0
+    return counts
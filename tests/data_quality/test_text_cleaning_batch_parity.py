@@ -0,0 +1,93 @@
+"""
+Parity: TextCleaner fast paths / clean_batch vs the original
+per-character cleaning.
+"""
+
+import itertools
+import random
+import re
+import unicodedata
+
+import pytest
+
+from feature_pipeline.text.text_cleaning import TextCleaner
+
+
+SAMPLES = [
+    "",
+    "   ",
+    "Căn hộ 2PN, view sông",
+    unicodedata.normalize("NFD", "Căn hộ 2PN, view sông"),
+    "ＦＵＬＬ　ＷＩＤＴＨ　１２３",
+    "ﬁne ﬂat ①②③ ㎡",
+    "tab\tnew\nline\r\x0bvt\x0cff",
+    "\x00nul\x07bel\x1bESC\x7fdel",
+    "zero​width‍j﻿bom",
+    "nbsp ideo　line para ",
+    "fs\x1cgs\x1drs\x1eus\x1f",
+    "privateuse \U000f0000",
+    "DIỆN TÍCH 80M²",
+]
+
+ALPHABET = (
+    "abc XYZ 019 .,!?\t\n\r\x0b\x0c\x00\x1f\x7f\x85 ​﻿"
+    "àáảãạăằắẳẵặâầấẩẫậđêềếểễệôồốổỗộơờớởỡợưừứửữự"
+    "ＡＢ１²①ﬁ㎡　 ̣́"
+)
+
+
+class _LegacyTextCleaner(TextCleaner):
+    """The original, unoptimized implementations."""
+
+    @staticmethod
+    def _normalize_unicode(text):
+        return unicodedata.normalize("NFKC", text)
+
+    @staticmethod
+    def _remove_control_characters(text):
+        return "".join(ch for ch in text if unicodedata.category(ch)[0] != "C")
+
+    @staticmethod
+    def _normalize_whitespace(text):
+        return re.sub(r"\s+", " ", text).strip()
+
+
+def _texts(n=2000, seed=11):
+    rng = random.Random(seed)
+    generated = [
+        "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 40)))
+        for _ in range(n)
+    ]
+    return SAMPLES + generated
+
+
+OPTION_NAMES = (
+    "lowercase",
+    "normalize_unicode",
+    "remove_extra_whitespace",
+    "strip_control_chars",
+)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        dict(zip(OPTION_NAMES, flags))
+        for flags in itertools.product([True, False], repeat=len(OPTION_NAMES))
+    ],
+)
+def test_clean_matches_legacy_for_every_option_combination(options):
+    cleaner = TextCleaner(**options)
+    legacy = _LegacyTextCleaner(**options)
+
+    for text in _texts():
+        assert cleaner.clean(text) == legacy.clean(text), repr(text)
+
+
+def test_clean_batch_matches_clean_in_process_and_pooled():
+    cleaner = TextCleaner(max_length=25)
+    texts = _texts(n=500, seed=3)
+    expected = [cleaner.clean(text) for text in texts]
+
+    assert cleaner.clean_batch(texts) == expected
+    assert cleaner.clean_batch(iter(texts), max_workers=2, chunk_size=64) == expected
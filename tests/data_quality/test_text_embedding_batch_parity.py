@@ -0,0 +1,88 @@
+"""
+Parity: HashingTextEmbedder.embed_batch (chunked CSR / dense) vs
+per-text embed, and pinned crc32-v2 token buckets.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from feature_pipeline.text.text_embedding import (
+    HASH_CRC32_V2,
+    HASH_SHA256_V1,
+    HashingTextEmbedder,
+    TextEmbeddingError,
+    generate_text_embedding,
+)
+
+
+# CRC-32 (zlib / IEEE) of the UTF-8 token; changing these breaks every
+# stored crc32-v2 embedding
+CRC32_V2_HASHES = {
+    "nhà": 2323178193,
+    "mặt": 4251358240,
+    "tiền": 2584291761,
+    "quận": 1462223640,
+    "1": 2212294583,
+    "hẻm": 4250467484,
+}
+
+VOCABULARY = list(CRC32_V2_HASHES) + ["căn", "hộ", "view", "sông", "2pn", "Q7", "ĐẸP"]
+
+
+def _texts(n=500, seed=0):
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        words = rng.choices(VOCABULARY, k=rng.randint(0, 12))
+        texts.append(rng.choice([" ", "  ", "\t", "\n"]).join(words))
+    return texts
+
+
+@pytest.mark.parametrize("hash_version", [HASH_SHA256_V1, HASH_CRC32_V2])
+@pytest.mark.parametrize("chunk_rows", [1, 7, 4096])
+def test_batch_rows_equal_embed(hash_version, chunk_rows):
+    texts = _texts()
+    embedder = HashingTextEmbedder(dimension=32, hash_version=hash_version)
+    expected = np.array([embedder.embed(text) for text in texts], dtype=np.int32)
+
+    matrix = embedder.embed_batch(iter(texts), chunk_rows=chunk_rows)
+    dense = embedder.embed_batch(texts, output="dense", chunk_rows=chunk_rows)
+
+    assert matrix.shape == dense.shape == expected.shape
+    assert matrix.dtype == dense.dtype == np.int32
+    assert matrix.has_canonical_format
+    np.testing.assert_array_equal(matrix.toarray(), expected)
+    np.testing.assert_array_equal(dense, expected)
+
+
+def test_empty_batches_and_invalid_input():
+    embedder = HashingTextEmbedder(dimension=16)
+
+    assert embedder.embed_batch([]).shape == (0, 16)
+    assert embedder.embed_batch([], output="dense").shape == (0, 16)
+    assert embedder.embed_batch(["", "   "]).nnz == 0
+
+    with pytest.raises(TextEmbeddingError):
+        embedder.embed_batch(["ok", None], chunk_rows=1)
+    with pytest.raises(TextEmbeddingError):
+        embedder.embed_batch(["ok"], chunk_rows=0)
+    with pytest.raises(TextEmbeddingError):
+        embedder.embed_batch(["ok"], output="coo")
+
+
+def test_crc32_v2_buckets_are_pinned():
+    for dimension in (64, 128, 1000):
+        embedder = HashingTextEmbedder(dimension=dimension, hash_version=HASH_CRC32_V2)
+        uncached = HashingTextEmbedder(
+            dimension=dimension, hash_version=HASH_CRC32_V2, token_cache_size=0
+        )
+        for token, value in CRC32_V2_HASHES.items():
+            vector = embedder.embed(token)
+            assert vector.index(1) == value % dimension
+            assert uncached.embed(token) == vector
+
+    result = generate_text_embedding("Nhà mặt tiền nhà", dimension=64, hash_version=HASH_CRC32_V2)
+    assert result["hash_version"] == HASH_CRC32_V2
+    assert {i: c for i, c in enumerate(result["embedding"]) if c} == {17: 2, 32: 1, 49: 1}
@@ -0,0 +1,68 @@
+"""
+Parity: fused / grouped regression metrics vs the individual metric
+functions.
+"""
+
+import numpy as np
+import pytest
+
+from modeling.evaluation.metrics_regression import METRIC_NAMES, RegressionMetrics
+
+
+def _individual(y_true, y_pred):
+    return {
+        "mae": RegressionMetrics.mae(y_true, y_pred),
+        "mse": RegressionMetrics.mse(y_true, y_pred),
+        "rmse": RegressionMetrics.rmse(y_true, y_pred),
+        "mape": RegressionMetrics.mape(y_true, y_pred),
+        "r2": RegressionMetrics.r2(y_true, y_pred),
+    }
+
+
+@pytest.mark.parametrize("n, chunk_size", [(1, 8), (1000, 64), (200_003, 4096)])
+def test_evaluate_is_bit_identical_to_individual_metrics(n, chunk_size):
+    rng = np.random.default_rng(n)
+    y_true = rng.lognormal(8.0, 1.0, n) + 1.0
+    y_pred = y_true * rng.normal(1.0, 0.1, n)
+
+    if n == 1:
+        with pytest.raises(ValueError):
+            RegressionMetrics.evaluate(y_true, y_pred, chunk_size=chunk_size)
+        return
+
+    assert RegressionMetrics.evaluate(y_true, y_pred, chunk_size=chunk_size) == _individual(
+        y_true, y_pred
+    )
+
+
+def test_evaluate_grouped_matches_per_segment_evaluate():
+    rng = np.random.default_rng(1)
+    n = 20_000
+    y_true = rng.lognormal(8.0, 1.0, n) + 1.0
+    y_pred = y_true * rng.normal(1.0, 0.1, n)
+    segments = rng.choice(np.array(["d1", "d2", "d3", "d7"]), n)
+
+    grouped = RegressionMetrics.evaluate_grouped(y_true, y_pred, segments, chunk_size=512)
+
+    assert sorted(grouped) == ["d1", "d2", "d3", "d7"]
+    for key, metrics in grouped.items():
+        mask = segments == key
+        expected = RegressionMetrics.evaluate(y_true[mask], y_pred[mask])
+        assert metrics.pop("error") is None
+        assert metrics == expected
+
+
+def test_undefined_segment_does_not_fail_the_call():
+    y_true = np.array([100.0, 120.0, 90.0, 0.0, 5.0, 80.0])
+    y_pred = np.array([110.0, 115.0, 95.0, 1.0, 4.0, 70.0])
+    segments = np.array([1, 1, 1, 2, 2, 3])
+
+    grouped = RegressionMetrics.evaluate_grouped(y_true, y_pred, segments)
+
+    assert grouped[1]["error"] is None
+    assert grouped[1]["mae"] == RegressionMetrics.mae(y_true[:3], y_pred[:3])
+
+    assert grouped[2]["error"] == "MAPE is undefined when y_true contains zero"
+    assert grouped[3]["error"] == "R2 is undefined when variance of y_true is zero"
+    for key in (2, 3):
+        assert all(grouped[key][name] is None for name in METRIC_NAMES)
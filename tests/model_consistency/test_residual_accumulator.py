@@ -0,0 +1,137 @@
+"""
+Residual accumulator: incremental updates vs one-shot batch vs the
+scalar analyzer, and bounded median memory past the exact limit.
+"""
+
+import numpy as np
+import pytest
+
+from modeling.hedonic.residual_analysis import (
+    HedonicResidualAnalyzer,
+    ResidualAccumulator,
+    ResidualInput,
+)
+
+
+IDENTITY = {"model_id": "hedonic", "model_version": "v1", "feature_snapshot_hash": "abc"}
+
+
+def _data(n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    actuals = rng.lognormal(8.0, 0.5, n)
+    predictions = actuals * rng.normal(1.0, 0.2, n)
+    predictions[rng.random(n) < 0.05] = np.nan
+    districts = rng.choice(np.array(["d1", "d2", "d3"]), n)
+    return predictions, actuals, districts
+
+
+def test_incremental_updates_match_one_shot_and_scalar_analyzer():
+    predictions, actuals, districts = _data()
+
+    one_shot = HedonicResidualAnalyzer().analyze_batch(
+        predictions=predictions,
+        actuals=actuals,
+        segments={"district": districts},
+        **IDENTITY,
+    )
+
+    accumulator = ResidualAccumulator(**IDENTITY)
+    for lo, hi in [(0, 1), (1, 700), (700, 701), (701, 2100), (2100, 3000)]:
+        accumulator.update(predictions[lo:hi], actuals[lo:hi], {"district": districts[lo:hi]})
+    incremental = accumulator.report()
+
+    _assert_reports_close(incremental, one_shot)
+
+    observed = ~np.isnan(predictions)
+    scalar = _scalar_report(predictions[observed], actuals[observed])
+    _assert_metrics_close(incremental.residual_metrics, scalar.residual_metrics)
+    assert incremental.residual_distribution == scalar.residual_distribution
+
+    for district in ("d1", "d2", "d3"):
+        mask = observed & (districts == district)
+        expected = _scalar_report(predictions[mask], actuals[mask])
+        summary = incremental.segments["district"][district]
+        _assert_metrics_close(summary.residual_metrics, expected.residual_metrics)
+        assert summary.residual_distribution == expected.residual_distribution
+
+
+def test_median_switches_to_bounded_sketch_past_the_exact_limit():
+    predictions, actuals, districts = _data(n=20_000, seed=1)
+    accuracy = 1e-3
+
+    accumulator = ResidualAccumulator(
+        exact_median_limit=1000, median_relative_accuracy=accuracy, **IDENTITY
+    )
+    for lo in range(0, predictions.size, 500):
+        hi = lo + 500
+        accumulator.update(predictions[lo:hi], actuals[lo:hi], {"district": districts[lo:hi]})
+
+    for state in accumulator._states.values():
+        assert state.abs_error_sketch is not None
+        assert state.abs_error_chunks == []
+        assert len(state.abs_error_sketch._bins) < 20_000
+
+    report = accumulator.report()
+    exact = HedonicResidualAnalyzer().analyze_batch(
+        predictions=predictions,
+        actuals=actuals,
+        segments={"district": districts},
+        **IDENTITY,
+    )
+
+    # Everything but the median stays exact
+    sketched, expected = report.residual_metrics, exact.residual_metrics
+    assert sketched.median_absolute_error == pytest.approx(
+        expected.median_absolute_error, rel=2 * accuracy
+    )
+    assert sketched.count == expected.count
+    assert sketched.root_mean_squared_error == pytest.approx(expected.root_mean_squared_error)
+    assert report.residual_distribution == exact.residual_distribution
+
+    for district, summary in report.segments["district"].items():
+        assert summary.residual_metrics.median_absolute_error == pytest.approx(
+            exact.segments["district"][district].residual_metrics.median_absolute_error,
+            rel=2 * accuracy,
+        )
+
+
+def test_invalid_limits_are_rejected():
+    with pytest.raises(ValueError):
+        ResidualAccumulator(exact_median_limit=0, **IDENTITY)
+    with pytest.raises(ValueError):
+        ResidualAccumulator(median_relative_accuracy=1.0, **IDENTITY)
+
+
+def _scalar_report(predictions, actuals):
+    ids = [f"p{i}" for i in range(predictions.size)]
+    return HedonicResidualAnalyzer().analyze(
+        ResidualInput(
+            predictions=dict(zip(ids, predictions.tolist())),
+            actuals=dict(zip(ids, actuals.tolist())),
+            evaluation_context=None,
+            **IDENTITY,
+        )
+    )
+
+
+def _assert_metrics_close(actual, expected):
+    assert actual.count == expected.count
+    for name in (
+        "mean_error",
+        "mean_absolute_error",
+        "root_mean_squared_error",
+        "median_absolute_error",
+        "max_positive_error",
+        "max_negative_error",
+    ):
+        assert getattr(actual, name) == pytest.approx(getattr(expected, name), rel=1e-9)
+
+
+def _assert_reports_close(left, right):
+    _assert_metrics_close(left.residual_metrics, right.residual_metrics)
+    assert left.residual_distribution == right.residual_distribution
+    for dimension, values in right.segments.items():
+        for value, summary in values.items():
+            other = left.segments[dimension][value]
+            _assert_metrics_close(other.residual_metrics, summary.residual_metrics)
+            assert other.residual_distribution == summary.residual_distribution
@@ -0,0 +1,121 @@
+"""
+Rolling-origin backtest: per-window metrics vs RegressionMetrics,
+prediction cache scoping and per-metric undefined handling.
+"""
+
+import numpy as np
+
+from modeling.evaluation.backtest_runner import BacktestRunner
+from modeling.evaluation.metrics_regression import RegressionMetrics
+from modeling.evaluation.rolling_backtest import (
+    ALL_SEGMENTS,
+    PredictionCache,
+    RollingOriginBacktest,
+)
+
+
+def _linear(X):
+    return X @ np.array([2.0, 0.5]) + 1.0
+
+
+def _scaled(X):
+    return 1.05 * _linear(X)
+
+
+def _dataset(seed=0, n=600):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(10.0, 2.0, (n, 2))
+    y = _linear(X) * rng.normal(1.0, 0.05, n)
+    periods = rng.choice(np.array(["2024-01", "2024-02", "2024-03", "2024-04"]), n)
+    segments = rng.choice(np.array(["d1", "d2"]), n)
+    return X, y, periods, segments
+
+
+def _runners():
+    return [
+        BacktestRunner("avm", "v1", _linear),
+        BacktestRunner("avm", "v2", _scaled),
+    ]
+
+
+def test_rows_match_regression_metrics_per_window_and_segment():
+    X, y, periods, segments = _dataset()
+    backtest = RollingOriginBacktest(X, y, periods, segments=segments)
+    windows = backtest.windows(horizon=1, min_train_periods=1)
+
+    table = backtest.run(_runners(), windows)
+
+    assert len(table.rows) == 2 * len(windows) * 3
+    fns = {"v1": _linear, "v2": _scaled}
+    for row in table.rows:
+        mask = periods == row["test_period_start"]
+        if row["segment"] != ALL_SEGMENTS:
+            mask &= segments == row["segment"]
+        expected = RegressionMetrics.evaluate(y[mask], fns[row["model_version"]](X[mask]))
+
+        assert row["error"] is None
+        assert row["n_samples"] == int(mask.sum())
+        for name, value in expected.items():
+            assert np.isclose(row[name], value, rtol=1e-12)
+
+
+def test_pooled_run_matches_in_process_run():
+    X, y, periods, segments = _dataset(seed=1)
+    windows = RollingOriginBacktest(X, y, periods).windows()
+
+    serial = RollingOriginBacktest(X, y, periods, segments=segments).run(_runners(), windows)
+    pooled = RollingOriginBacktest(X, y, periods, segments=segments).run(
+        _runners(), windows, max_workers=2
+    )
+
+    assert pooled.rows == serial.rows
+
+
+def test_shared_cache_is_scoped_to_the_dataset():
+    cache = PredictionCache()
+    X_a, y_a, periods, _ = _dataset(seed=2)
+    X_b = X_a * 3.0
+
+    first = RollingOriginBacktest(X_a, y_a, periods, cache=cache)
+    windows = first.windows()
+    first.run(_runners()[:1], windows)
+    assert len(cache) == len(windows)
+
+    second = RollingOriginBacktest(X_b, y_a, periods, cache=cache)
+    assert second.dataset_id != first.dataset_id
+    rows = second.run(_runners()[:1], second.windows()).rows
+
+    assert len(cache) == 2 * len(windows)
+    for row in rows:
+        mask = periods == row["test_period_start"]
+        assert np.isclose(row["mae"], RegressionMetrics.mae(y_a[mask], _linear(X_b[mask])))
+
+    # Same data again: predictions come from the cache
+    calls = []
+
+    def _counting(X):
+        calls.append(len(X))
+        return _linear(X)
+
+    again = RollingOriginBacktest(X_a.copy(), y_a, periods, cache=cache)
+    again.run([BacktestRunner("avm", "v1", _counting)], windows)
+    assert calls == []
+
+
+def test_one_undefined_metric_keeps_the_others():
+    X = np.array([[1.0, 0.0], [2.0, 0.0], [3.0, 0.0], [4.0, 0.0]])
+    y = np.array([5.0, 6.0, 6.0, 8.0])
+    periods = np.array(["p1", "p2", "p2", "p3"])
+
+    backtest = RollingOriginBacktest(X, y, periods)
+    rows = backtest.run([BacktestRunner("avm", "v1", _linear)], backtest.windows()).rows
+
+    constant = rows[0]  # p2: y_true has zero variance
+    assert constant["error"] == "R2 is undefined when variance of y_true is zero"
+    assert constant["r2"] is None
+    assert constant["mae"] == RegressionMetrics.mae(y[1:3], _linear(X[1:3]))
+    assert constant["mape"] == RegressionMetrics.mape(y[1:3], _linear(X[1:3]))
+
+    single = rows[1]  # p3: one row, R2 undefined
+    assert single["r2"] is None
+    assert single["mse"] == RegressionMetrics.mse(y[3:], _linear(X[3:]))
@@ -0,0 +1,146 @@
+"""
+Parity: shared single-pass ContentAnalysisRunner vs the individual
+content-analysis detectors.
+"""
+
+import random
+
+from listing_intelligence.content_analysis.clickbait_detector import (
+    ABSOLUTE_CLAIMS,
+    CLICKBAIT_PHRASES,
+    URGENCY_MARKERS,
+    detect_clickbait,
+)
+from listing_intelligence.content_analysis.content_analysis_runner import (
+    ContentAnalysisRunner,
+    run_content_analysis_batch,
+)
+from listing_intelligence.content_analysis.copy_paste_detector import (
+    _hash_text,
+    _normalize_text,
+    detect_copy_paste_content,
+)
+from listing_intelligence.content_analysis.misleading_claims import (
+    ABSOLUTE_MODIFIERS,
+    DECLARATIVE_PATTERNS,
+    detect_misleading_claims,
+)
+from listing_intelligence.content_analysis.near_duplicate_index import (
+    NearDuplicateIndex,
+)
+
+
+PHRASES = (
+    CLICKBAIT_PHRASES
+    + ABSOLUTE_CLAIMS
+    + URGENCY_MARKERS
+    + ABSOLUTE_MODIFIERS
+    + [p for patterns in DECLARATIVE_PATTERNS.values() for p in patterns]
+)
+
+FILLER = ["căn hộ", "quận 7", "view sông", "2PN", "giá", "tỷ", "!!!", "-", "ngayhôm"]
+
+DECLARED_FACTS = [
+    None,
+    {},
+    {"legal_status": "partial"},
+    {"legal_status": "full", "ownership_type": "co_owned"},
+    {"ownership_type": "single_owner"},
+]
+
+
+def _text(rng, max_words):
+    words = []
+    for _ in range(rng.randint(0, max_words)):
+        word = rng.choice(PHRASES) if rng.random() < 0.4 else rng.choice(FILLER)
+        words.append(word.upper() if rng.random() < 0.2 else word)
+    return " ".join(words)
+
+
+def _listings(n=300, seed=5):
+    rng = random.Random(seed)
+    template = _text(random.Random(0), 30)
+    listings = [
+        {"listing_id": "none", "title": None, "description": None},
+        {"listing_id": "empty", "title": "", "description": ""},
+        {"listing_id": "punct", "title": "GIÁ SỐC", "description": "!!! ???"},
+        {"listing_id": "template", "title": "x", "description": template},
+        {"listing_id": "template-copy", "title": "y", "description": template.upper()},
+        {"listing_id": "template-edit", "title": "z", "description": template + " căn góc"},
+    ]
+    for i in range(n):
+        listings.append(
+            {
+                "listing_id": f"l-{i}",
+                "title": _text(rng, 8) if rng.random() < 0.9 else None,
+                "description": _text(rng, 40) if rng.random() < 0.9 else None,
+                "declared_facts": rng.choice(DECLARED_FACTS),
+            }
+        )
+    return listings
+
+
+def _individual(listing, **copy_paste_kwargs):
+    return {
+        "clickbait": detect_clickbait(
+            title=listing.get("title"),
+            description=listing.get("description"),
+        ),
+        "misleading_claims": detect_misleading_claims(
+            description=listing.get("description"),
+            declared_facts=listing.get("declared_facts"),
+        ),
+        "copy_paste": detect_copy_paste_content(
+            description=listing.get("description"),
+            listing_id=listing.get("listing_id"),
+            **copy_paste_kwargs,
+        ),
+    }
+
+
+def test_analyze_matches_individual_detectors():
+    runner = ContentAnalysisRunner()
+
+    for listing in _listings():
+        result = runner.analyze(
+            title=listing.get("title"),
+            description=listing.get("description"),
+            declared_facts=listing.get("declared_facts"),
+            listing_id=listing.get("listing_id"),
+        )
+        assert result == _individual(listing), listing["listing_id"]
+
+
+def test_batch_matches_individual_detectors_with_fingerprints_and_index():
+    listings = _listings(seed=8)
+    fingerprints = [
+        _hash_text(_normalize_text(listing["description"]))
+        for listing in listings[3:60:3]
+        if listing["description"]
+    ]
+    index = NearDuplicateIndex()
+    for listing in listings:
+        if listing["description"] is not None:
+            index.add(listing["listing_id"], listing["description"])
+
+    expected = [
+        _individual(
+            listing,
+            historical_fingerprints=fingerprints,
+            near_duplicate_index=index,
+            near_duplicate_threshold=0.6,
+            near_duplicate_max_results=3,
+        )
+        for listing in listings
+    ]
+
+    assert run_content_analysis_batch(
+        listings,
+        historical_fingerprints=fingerprints,
+        near_duplicate_index=index,
+        near_duplicate_threshold=0.6,
+        near_duplicate_max_results=3,
+    ) == expected
+    findings = [result["copy_paste"]["findings"] for result in expected]
+    assert any("exact_content_reuse_detected" in f for f in findings)
+    assert any("near_duplicate_content_detected" in f for f in findings)
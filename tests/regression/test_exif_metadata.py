@@ -0,0 +1,72 @@
+"""
+EXIF metadata: GPS parsing, content-hash cache and error handling
+shared with the image loader.
+"""
+
+import io
+
+import pytest
+from PIL import Image
+
+from feature_pipeline.image.image_loader import ImageLoadError, ImageLoader
+from listing_intelligence.image_forensics.exif_metadata import (
+    ExifMetadataCache,
+    parse_exif_metadata,
+)
+
+
+def _jpeg(with_gps=True, size=(64, 48)):
+    image = Image.new("RGB", size, (120, 130, 140))
+    exif = Image.Exif()
+    exif[0x010F] = "Maker"
+    if with_gps:
+        exif.get_ifd(0x8825).update(
+            {1: "N", 2: (10.0, 46.0, 30.0), 3: "E", 4: (106.0, 42.0, 0.0)}
+        )
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+def test_gps_parsing_and_cache_hits(tmp_path):
+    data = _jpeg()
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(data)
+
+    cache = ExifMetadataCache(max_entries=4)
+    from_bytes = cache.extract(data)
+    from_path = cache.extract(str(path))
+
+    assert from_path is from_bytes
+    assert from_bytes.camera_make == "Maker"
+    assert from_bytes.latitude == pytest.approx(10.775)
+    assert from_bytes.longitude == pytest.approx(106.7)
+    assert from_bytes.to_geo_metadata().source == "EXIF"
+    assert cache.stats()["hits"] == 1
+
+    assert parse_exif_metadata(_jpeg(with_gps=False)).has_gps is False
+
+
+def test_unreadable_sources_raise_the_image_loader_error(tmp_path):
+    cache = ExifMetadataCache()
+    loader = ImageLoader()
+    missing = str(tmp_path / "missing.jpg")
+
+    for source in (missing, 12345):
+        with pytest.raises(ImageLoadError):
+            cache.extract(source)
+        with pytest.raises(ImageLoadError):
+            loader.load(source)
+
+
+def test_undecodable_and_oversized_images_report_no_metadata(monkeypatch):
+    assert parse_exif_metadata(b"not an image").has_exif is False
+
+    data = _jpeg(size=(400, 400))
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 100)
+    metadata = parse_exif_metadata(data)
+
+    assert metadata.has_exif is False
+    assert metadata.latitude is None
+    with pytest.raises(ImageLoadError):
+        ImageLoader().load(data)
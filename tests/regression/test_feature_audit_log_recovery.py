@@ -0,0 +1,72 @@
+"""
+Durable feature audit log: recovery from a crash mid-append.
+"""
+
+import logging
+
+import pytest
+
+from feature_pipeline.registry.feature_audit_log import (
+    FeatureAuditEvent,
+    FeatureAuditLog,
+    FeatureAuditViolation,
+)
+
+
+def _event(i):
+    return FeatureAuditEvent(
+        event_type="CREATE",
+        feature_id=f"feature_{i % 3}",
+        feature_version="v1",
+        actor_id="actor",
+        actor_role="engineer",
+        event_timestamp_utc=f"2024-01-01T00:00:{i:02d}+00:00",
+    )
+
+
+def _open(path):
+    return FeatureAuditLog(str(path), max_segment_events=4, checkpoint_interval=2, fsync=False)
+
+
+def _segments(path):
+    return sorted(p for p in path.glob("segment_*.jsonl") if not p.name.endswith(".idx.jsonl"))
+
+
+def test_partial_trailing_record_in_active_segment_is_discarded(tmp_path, caplog):
+    log = _open(tmp_path)
+    for i in range(6):
+        log.append_event(_event(i))
+    head = log.chain_head
+    log.close()
+
+    with open(_segments(tmp_path)[-1], "ab") as handle:
+        handle.write(b'{"seq":6,"ev')
+
+    with caplog.at_level(logging.WARNING):
+        log = _open(tmp_path)
+    assert "partial trailing audit record" in caplog.text
+    assert len(log) == 6
+    assert log.chain_head == head
+
+    log.append_event(_event(6))
+    log.close()
+
+    reopened = _open(tmp_path)
+    assert len(reopened) == 7
+    assert reopened.verify_chain() == reopened.chain_head
+    reopened.close()
+
+
+def test_partial_record_in_sealed_segment_is_a_violation(tmp_path):
+    log = _open(tmp_path)
+    for i in range(6):
+        log.append_event(_event(i))
+    log.close()
+
+    # Sealed segment without its sidecar index is re-indexed on open
+    first = _segments(tmp_path)[0]
+    first.write_bytes(first.read_bytes()[:-5])
+    first.with_name(first.name.replace(".jsonl", ".idx.jsonl")).unlink()
+
+    with pytest.raises(FeatureAuditViolation):
+        _open(tmp_path)
@@ -0,0 +1,114 @@
+"""
+Hierarchical grid: finest-level parity with the scalar assigner and
+exact nesting across levels.
+"""
+
+import numpy as np
+import pytest
+
+from feature_pipeline.geo.geo_cluster_assigner import (
+    MISSING_CELL_KEY,
+    HierarchicalGridScheme,
+    grid_cluster_id,
+    assign_geo_clusters_batch,
+    decode_cell_key,
+)
+
+
+def _rounded_points(n=5000, seed=3):
+    # Listing coordinates are often rounded, which puts many of them
+    # exactly on coarse cell boundaries
+    lat, lon = _points(n, seed)
+    return np.round(lat, 2), np.round(lon, 2)
+
+
+def _points(n=5000, seed=7):
+    rng = np.random.default_rng(seed)
+    lat = rng.uniform(8.0, 23.0, n)
+    lon = rng.uniform(102.0, 110.0, n)
+    # Values on (or a float ulp away from) cell boundaries
+    edges = np.array([10.6, 10.65, 10.7, -0.1, 0.3, 21.05])
+    return np.concatenate([lat, edges]), np.concatenate([lon, edges[::-1] + 95.0])
+
+
+def test_finest_level_matches_scalar_grid_cluster_id():
+    scheme = HierarchicalGridScheme()
+    lat, lon = _points()
+    batch = assign_geo_clusters_batch(lat, lon, scheme=scheme)
+
+    finest = scheme.resolutions_deg[0]
+    expected = [grid_cluster_id(a, o, finest) for a, o in zip(lat, lon)]
+    assert batch.cluster_ids(0) == expected
+
+
+def test_every_level_against_scalar_grid_cluster_id():
+    scheme = HierarchicalGridScheme()
+    lat, lon = _rounded_points()
+    batch = assign_geo_clusters_batch(lat, lon, scheme=scheme)
+
+    assert batch.cluster_ids(0) == [
+        grid_cluster_id(a, o, scheme.resolutions_deg[0]) for a, o in zip(lat, lon)
+    ]
+
+    differs = 0
+    for level in range(1, scheme.levels):
+        size = scheme.resolutions_deg[level]
+        ids = batch.cluster_ids(level)
+        for cell_id, key, a, o in zip(ids, batch.cell_keys[:, level].tolist(), lat, lon):
+            legacy = grid_cluster_id(a, o, size)
+            # Coarse IDs are scheme-specific and never pose as legacy IDs
+            assert cell_id.startswith(f"HGRID_V1_L{level}_")
+            assert cell_id == scheme.cell_id(key)
+
+            _, lat_bucket, lon_bucket = decode_cell_key(key)
+            if legacy != f"GRID_{lat_bucket}_{lon_bucket}":
+                differs += 1
+                # Disagreement is at most one bucket, next to a boundary
+                assert abs(lat_bucket - _bucket(a, size)) <= 1
+                assert abs(lon_bucket - _bucket(o, size)) <= 1
+                assert _near_boundary(a, size) or _near_boundary(o, size)
+    # Rounded coordinates do hit the nested-vs-legacy difference
+    assert differs > 0
+
+
+def test_cells_nest_across_levels_and_match_parent():
+    scheme = HierarchicalGridScheme()
+    lat, lon = _points()
+    keys = scheme.assign_batch(lat, lon)
+
+    for row in keys.tolist():
+        for level in range(scheme.levels - 1):
+            assert scheme.parent(row[level]) == row[level + 1]
+            assert scheme.parent(row[0], level=level + 1) == row[level + 1]
+
+
+def test_boundary_latitude_nests():
+    scheme = HierarchicalGridScheme()
+    keys = scheme.assign(10.6, 106.7)
+
+    lat_buckets = [decode_cell_key(key)[1] for key in keys]
+    assert lat_buckets[0] == _bucket(10.6, scheme.resolutions_deg[0])
+    assert lat_buckets[-1] == lat_buckets[0] // 20
+
+
+def test_missing_coordinates():
+    keys = HierarchicalGridScheme().assign_batch([np.nan, 10.0], [106.0, np.nan])
+    assert (keys == MISSING_CELL_KEY).all()
+
+
+@pytest.mark.parametrize(
+    "resolutions",
+    [(0.01, 0.015), (0.005, 0.01, 0.025), (0.01, 0.005)],
+)
+def test_rejects_non_nesting_resolutions(resolutions):
+    with pytest.raises(ValueError):
+        HierarchicalGridScheme(resolutions_deg=resolutions)
+
+
+def _bucket(value, size):
+    return int(np.floor(value / size))
+
+
+def _near_boundary(value, size):
+    ratio = value / size
+    return abs(ratio - round(ratio)) < 1e-6
@@ -0,0 +1,63 @@
+"""
+Parity: batch image location mismatch signals vs the scalar generator.
+"""
+
+import random
+
+from listing_intelligence.image_forensics.image_location_mismatch import (
+    ImageGeoMetadata,
+    ReferenceLocation,
+    generate_image_location_mismatch_signal,
+    generate_image_location_mismatch_signals_batch,
+)
+
+
+def _images(n=3000, seed=3):
+    rng = random.Random(seed)
+    images = []
+    for _ in range(n):
+        if rng.random() < 0.05:
+            images.append(ImageGeoMetadata(latitude=None, longitude=None, source="UNKNOWN"))
+        else:
+            images.append(
+                ImageGeoMetadata(
+                    latitude=rng.uniform(8.0, 23.0),
+                    longitude=rng.uniform(102.0, 110.0),
+                    source="EXIF",
+                )
+            )
+    return images
+
+
+def test_batch_with_per_image_references_matches_scalar():
+    rng = random.Random(5)
+    images = _images()
+    references = [
+        ReferenceLocation(
+            latitude=rng.uniform(8.0, 23.0),
+            longitude=rng.uniform(102.0, 110.0),
+            reference_type="GEOCODED_ADDRESS",
+        )
+        for _ in images
+    ]
+
+    batch = generate_image_location_mismatch_signals_batch(images, references)
+    expected = [
+        generate_image_location_mismatch_signal(image, reference)
+        for image, reference in zip(images, references)
+    ]
+    assert batch == expected
+
+
+def test_batch_with_shared_reference_matches_scalar():
+    reference = ReferenceLocation(
+        latitude=10.7769, longitude=106.7009, reference_type="DECLARED_ADDRESS"
+    )
+    images = _images(500)
+
+    batch = generate_image_location_mismatch_signals_batch(images, reference, 2.5)
+    expected = [
+        generate_image_location_mismatch_signal(image, reference, 2.5)
+        for image in images
+    ]
+    assert batch == expected
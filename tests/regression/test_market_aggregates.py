@@ -0,0 +1,143 @@
+"""
+Market aggregates: rolling-window arithmetic, rebuild vs incremental
+parity and tolerance of inconsistent rows in rebuild.
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from feature_pipeline.tabular.market_aggregates import (
+    MarketAggregateEngine,
+    MarketAggregateError,
+)
+
+
+START = date(2025, 1, 1)
+
+
+def _ts(day_offset, hour=12):
+    return f"{START + timedelta(days=day_offset)}T{hour:02d}:00:00"
+
+
+def test_window_includes_exactly_window_days_ending_at_watermark():
+    engine = MarketAggregateEngine(window_days=30)
+    for offset in (0, 1, 29, 30):
+        engine.record_transaction(f"t{offset}", _ts(offset), locality_code="Q1")
+
+    # Watermark = day 30: window is days 1..30
+    aggregates = engine.get_aggregates(locality_code="Q1")
+    assert aggregates["recent_transaction_count"] == 3
+    assert aggregates["window_end_day"] == str(START + timedelta(days=30))
+
+    engine.advance_to(_ts(31))
+    assert engine.get_aggregates(locality_code="Q1")["recent_transaction_count"] == 2
+
+    # Events older than the window are ignored, duplicates counted once
+    engine.record_transaction("old", _ts(0), locality_code="Q1")
+    engine.record_transaction("t30", _ts(30), locality_code="Q1")
+    assert engine.get_aggregates(locality_code="Q1")["recent_transaction_count"] == 2
+
+    engine.advance_to(_ts(59))
+    assert engine.get_aggregates(locality_code="Q1")["recent_transaction_count"] == 1
+    engine.advance_to(_ts(60))
+    assert engine.get_aggregates(locality_code="Q1")["recent_transaction_count"] == 0
+
+
+def test_days_on_market_and_turnover():
+    engine = MarketAggregateEngine(window_days=90)
+    engine.record_listing("a", _ts(0), cluster_id="C1")
+    engine.record_listing("b", _ts(5), cluster_id="C1")
+    engine.record_listing("c", _ts(10), cluster_id="C1")
+    engine.record_delisting("a", _ts(20))
+    engine.record_delisting("b", _ts(45))
+
+    aggregates = engine.get_aggregates(cluster_id="C1")
+    assert aggregates["nearby_listing_count"] == 1
+    assert aggregates["avg_days_on_market"] == (20 + 40) / 2
+    assert aggregates["listing_turnover_rate"] == round(2 / 3, 4)
+
+    with pytest.raises(MarketAggregateError):
+        engine.record_delisting("a", _ts(50))
+    with pytest.raises(MarketAggregateError):
+        engine.record_listing("c", _ts(50), cluster_id="C1")
+
+
+def _tables(seed=0, n_listings=300, n_transactions=400):
+    rng = random.Random(seed)
+    areas = [{"cluster_id": f"C{i}", "locality_code": f"Q{i % 3}"} for i in range(6)]
+    listings = []
+    for i in range(n_listings):
+        listed = rng.randint(0, 400)
+        row = {"listing_id": f"L{i}", "listed_at_utc": _ts(listed), **rng.choice(areas)}
+        if rng.random() < 0.6:
+            row["closed_at_utc"] = _ts(listed + rng.randint(0, 120), hour=18)
+        listings.append(row)
+    transactions = [
+        {"transaction_id": f"T{i % 350}", "transacted_at_utc": _ts(rng.randint(0, 500)),
+         **rng.choice(areas)}
+        for i in range(n_transactions)
+    ]
+    return listings, transactions, areas
+
+
+def _snapshots(engine, areas):
+    return [
+        engine.get_aggregates(cluster_id=a["cluster_id"]) for a in areas
+    ] + [
+        engine.get_aggregates(locality_code=code) for code in ("Q0", "Q1", "Q2")
+    ]
+
+
+def test_rebuild_equals_incremental_replay():
+    listings, transactions, areas = _tables()
+    rebuilt = MarketAggregateEngine.rebuild(
+        listings, transactions, as_of_utc=_ts(520), window_days=120
+    )
+
+    events = []
+    for row in listings:
+        events.append((row["listed_at_utc"][:10], 0, "open", row))
+        if "closed_at_utc" in row:
+            events.append((row["closed_at_utc"][:10], 2, "close", row))
+    for row in transactions:
+        events.append((row["transacted_at_utc"][:10], 1, "txn", row))
+    events.sort(key=lambda e: (e[0], e[1]))
+
+    incremental = MarketAggregateEngine(window_days=120)
+    for _, _, kind, row in events:
+        location = {"cluster_id": row["cluster_id"], "locality_code": row["locality_code"]}
+        if kind == "open":
+            incremental.record_listing(row["listing_id"], row["listed_at_utc"], **location)
+        elif kind == "close":
+            incremental.record_delisting(row["listing_id"], row["closed_at_utc"])
+        else:
+            incremental.record_transaction(
+                row["transaction_id"], row["transacted_at_utc"], **location
+            )
+    incremental.advance_to(_ts(520))
+
+    assert _snapshots(rebuilt, areas) == _snapshots(incremental, areas)
+    assert rebuilt.rebuild_issues == {"closed_before_listed": 0, "relisted_while_active": 0}
+
+
+def test_rebuild_repairs_or_skips_inconsistent_rows():
+    listings = [
+        {"listing_id": "a", "listed_at_utc": _ts(10), "closed_at_utc": _ts(4),
+         "cluster_id": "C1"},
+        {"listing_id": "b", "listed_at_utc": _ts(0), "closed_at_utc": _ts(20),
+         "cluster_id": "C1"},
+        # re-listed while the first "b" row is still active
+        {"listing_id": "b", "listed_at_utc": _ts(5), "closed_at_utc": _ts(8),
+         "cluster_id": "C1"},
+        # re-listed after the first "b" row closed: a valid second spell
+        {"listing_id": "b", "listed_at_utc": _ts(25), "cluster_id": "C1"},
+    ]
+
+    engine = MarketAggregateEngine.rebuild(listings, [], window_days=60)
+
+    assert engine.rebuild_issues == {"closed_before_listed": 1, "relisted_while_active": 1}
+    aggregates = engine.get_aggregates(cluster_id="C1")
+    assert aggregates["nearby_listing_count"] == 1
+    assert aggregates["avg_days_on_market"] == (0 + 20) / 2
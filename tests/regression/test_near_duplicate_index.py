@@ -0,0 +1,102 @@
+"""
+Near-duplicate description index and its copy-paste signal findings.
+"""
+
+from listing_intelligence.content_analysis.copy_paste_detector import (
+    _hash_text,
+    _normalize_text,
+    detect_copy_paste_content,
+)
+from listing_intelligence.content_analysis.near_duplicate_index import (
+    NearDuplicateIndex,
+)
+
+
+TEMPLATE = (
+    "Spacious three bedroom apartment in district seven with river view, "
+    "modern kitchen, two bathrooms, covered parking and a private balcony "
+    "close to international schools and shopping malls"
+)
+
+
+def test_empty_normalized_descriptions_never_match():
+    index = NearDuplicateIndex()
+    index.add("a", "!!! ???")
+    index.add("b", "...")
+
+    assert len(index) == 2
+    assert index.query("---") == []
+    assert index.query("!!!", exclude_id="a") == []
+
+    signal = detect_copy_paste_content(
+        description="!!!", near_duplicate_index=index, listing_id="a"
+    )
+    assert "exact_content_reuse_detected" not in signal["findings"]
+
+    index.remove("a")
+    assert "a" not in index
+
+
+def test_empty_normalized_text_keeps_baseline_fingerprint_lookup():
+    # Without an index, the fingerprint store is checked as before
+    store = [_fingerprint("!!!")]
+    signal = detect_copy_paste_content(description="???", historical_fingerprints=store)
+    assert "exact_content_reuse_detected" in signal["findings"]
+
+    index = NearDuplicateIndex()
+    index.add("a", "...")
+    signal = detect_copy_paste_content(
+        description="???", near_duplicate_index=index, listing_id="b"
+    )
+    assert "exact_content_reuse_detected" not in signal["findings"]
+
+
+def test_exact_reuse_excludes_the_listing_itself():
+    index = NearDuplicateIndex()
+    index.add("a", TEMPLATE)
+
+    assert index.has_fingerprint(_fingerprint(TEMPLATE)) is True
+    own = detect_copy_paste_content(
+        description=TEMPLATE, near_duplicate_index=index, listing_id="a"
+    )
+    assert "exact_content_reuse_detected" not in own["findings"]
+
+    index.add("b", TEMPLATE.upper())
+    reused = detect_copy_paste_content(
+        description=TEMPLATE, near_duplicate_index=index, listing_id="a"
+    )
+    assert "exact_content_reuse_detected" in reused["findings"]
+
+
+def test_near_duplicate_findings_are_capped():
+    index = NearDuplicateIndex()
+    for i in range(60):
+        index.add(f"copy-{i:03d}", TEMPLATE)
+        index.add(f"edit-{i:03d}", TEMPLATE + f" unit {i}")
+
+    signal = detect_copy_paste_content(
+        description=TEMPLATE,
+        near_duplicate_index=index,
+        near_duplicate_threshold=0.5,
+        near_duplicate_max_results=5,
+    )
+    findings = signal["findings"]
+
+    assert "exact_content_reuse_detected" in findings
+    matches = findings["near_duplicate_content_detected"]["matches"]
+    assert len(matches) == 5
+    assert all(match["listing_id"].startswith("edit-") for match in matches)
+
+
+def test_historical_fingerprints_lookup_accepts_any_collection():
+    fingerprint = _fingerprint(TEMPLATE)
+
+    for store in ({fingerprint}, frozenset([fingerprint]), [fingerprint]):
+        signal = detect_copy_paste_content(
+            description=TEMPLATE, historical_fingerprints=store
+        )
+        assert "exact_content_reuse_detected" in signal["findings"]
+
+
+def _fingerprint(description):
+    return _hash_text(_normalize_text(description))
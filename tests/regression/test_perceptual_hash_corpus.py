@@ -0,0 +1,125 @@
+"""
+Perceptual hashes and the packed hash corpus: corpus Hamming distances
+vs per-pair PerceptualHash.hamming_distance, save / load round-trip
+and the byte-table popcount fallback.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from listing_intelligence.image_forensics import duplicate_detection
+from listing_intelligence.image_forensics.duplicate_detection import (
+    HASH_ALGORITHMS,
+    SUPPORTED_HASH_SIZES,
+    PackedHashCorpus,
+    compute_perceptual_hash,
+    generate_duplicate_image_signal_from_corpus,
+)
+
+
+CONFIGS = [(a, s) for a in HASH_ALGORITHMS for s in SUPPORTED_HASH_SIZES]
+
+
+def _images(n=40, seed=0):
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, 256, (12, 16)).astype(np.uint8)
+    images = []
+    for i in range(n):
+        if i % 4 == 0:
+            image = rng.integers(0, 256, (rng.integers(5, 90), rng.integers(5, 90)))
+        else:
+            # Noisy, rescaled copies of one scene: near duplicates
+            noise = rng.integers(-20, 21, base.shape)
+            image = np.kron(np.clip(base + noise, 0, 255), np.ones((i % 3 + 1, i % 5 + 1)))
+        images.append(image.astype(np.uint8))
+    return images
+
+
+def _corpus(algorithm, hash_size, images):
+    hashes = [compute_perceptual_hash(image, algorithm, hash_size) for image in images]
+    corpus = PackedHashCorpus.from_hashes(
+        ((f"img{i}", h) for i, h in enumerate(hashes)),
+        algorithm=algorithm,
+        n_bits=hash_size * hash_size,
+    )
+    return hashes, corpus
+
+
+@pytest.mark.parametrize("algorithm, hash_size", CONFIGS)
+def test_corpus_distances_match_per_pair_distances(algorithm, hash_size):
+    images = _images()
+    hashes, corpus = _corpus(algorithm, hash_size, images)
+
+    assert corpus.hashes.shape == (len(images), hash_size * hash_size // 64)
+    for target in hashes[:10]:
+        expected = [target.hamming_distance(h) for h in hashes]
+        assert corpus.hamming_distances(target).tolist() == expected
+        np.testing.assert_array_equal(
+            corpus.similarities(target), [target.similarity(h) for h in hashes]
+        )
+
+    # Entries added after a query are flushed into the packed array
+    extra = compute_perceptual_hash(images[3][::-1], algorithm, hash_size)
+    corpus.add("extra", extra)
+    assert corpus.hamming_distances(extra)[-1] == 0
+    assert len(corpus) == len(images) + 1
+
+
+@pytest.mark.parametrize("algorithm, hash_size", CONFIGS)
+def test_popcount_fallback_matches(monkeypatch, algorithm, hash_size):
+    hashes, corpus = _corpus(algorithm, hash_size, _images(seed=1))
+    expected = [corpus.hamming_distances(target).tolist() for target in hashes[:8]]
+
+    # NumPy < 2.0 has no bitwise_count: the byte-table path is used
+    monkeypatch.delattr(np, "bitwise_count", raising=False)
+    assert [corpus.hamming_distances(t).tolist() for t in hashes[:8]] == expected
+
+    words = np.array([0, 1, 0xFFFFFFFFFFFFFFFF, 0x8000000000000001], dtype=np.uint64)
+    assert duplicate_detection._popcount(words).tolist() == [0, 1, 64, 2]
+
+
+def test_save_load_round_trip(tmp_path):
+    hashes, corpus = _corpus("dhash", 16, _images(seed=2))
+    path = str(tmp_path / "corpus.npz")
+    corpus.save(path)
+
+    loaded = PackedHashCorpus.load(path)
+
+    assert (loaded.algorithm, loaded.n_bits) == ("dhash", 256)
+    assert loaded.image_ids == corpus.image_ids
+    np.testing.assert_array_equal(loaded.hashes, corpus.hashes)
+    for target in hashes[:5]:
+        assert loaded.hamming_distances(target).tolist() == corpus.hamming_distances(
+            target
+        ).tolist()
+        assert generate_duplicate_image_signal_from_corpus(
+            "t", target, loaded, similarity_threshold=0.8
+        ) == generate_duplicate_image_signal_from_corpus(
+            "t", target, corpus, similarity_threshold=0.8
+        )
+
+    loaded.add("new", hashes[0])
+    assert loaded.hamming_distances(hashes[0])[-1] == 0
+
+
+def test_hash_inputs_and_compatibility_checks():
+    gray = _images(n=2, seed=3)[1]
+    pil = Image.fromarray(gray)
+    loaded = SimpleNamespace(gray=gray)
+
+    for algorithm, hash_size in CONFIGS:
+        expected = compute_perceptual_hash(gray, algorithm, hash_size)
+        assert compute_perceptual_hash(pil, algorithm, hash_size) == expected
+        assert compute_perceptual_hash(loaded, algorithm, hash_size) == expected
+        assert len(expected.hex()) == hash_size * hash_size // 4
+
+    phash = compute_perceptual_hash(gray, "phash", 8)
+    with pytest.raises(ValueError):
+        phash.hamming_distance(compute_perceptual_hash(gray, "ahash", 8))
+    with pytest.raises(ValueError):
+        PackedHashCorpus("phash", 256).add("x", phash)
+    with pytest.raises(ValueError):
+        compute_perceptual_hash(gray, "whash")
@@ -0,0 +1,86 @@
+"""
+Parity: single-pass PhraseMatcher vs per-category regex scanning
+(the original amenity / legal phrase extraction).
+"""
+
+import random
+import re
+
+from feature_pipeline.text.amenity_extractor import AmenityExtractor
+from feature_pipeline.text.legal_phrase_extractor import LegalPhraseExtractor
+from feature_pipeline.text.phrase_matcher import PhraseMatcher
+
+
+AMENITY_CATALOG = {
+    "parking": ["bãi đỗ xe", "chỗ để xe", "hầm xe", "parking"],
+    "security": ["bảo vệ 24/7", "camera an ninh", "bảo vệ"],
+    "utilities": ["thang máy", "máy phát điện", "thang"],
+    "leisure": ["hồ bơi", "Hồ Bơi Vô Cực", "gym", "gym & spa"],
+    "empty": [],
+}
+
+LEGAL_CATALOG = {
+    "ownership": ["sổ hồng", "sổ đỏ", "sổ hồng riêng"],
+    "dispute": ["tranh chấp", "không tranh chấp"],
+    "mortgage": ["thế chấp", "đang thế chấp ngân hàng"],
+}
+
+FILLER = ["căn hộ", "gần", "chợ", "có", "và", "ĐẸP", "ngay", "x", "-", ",", "(", ")"]
+
+
+def _texts(catalog, n=400, seed=9):
+    rng = random.Random(seed)
+    phrases = [p for ps in catalog.values() for p in ps]
+    texts = ["", " ", "thang", "THANG MÁY", "gym&spa"]
+    for _ in range(n):
+        words = [
+            rng.choice(phrases).upper() if rng.random() < 0.2 else rng.choice(phrases)
+            if rng.random() < 0.4
+            else rng.choice(FILLER)
+            for _ in range(rng.randint(1, 25))
+        ]
+        texts.append(rng.choice([" ", "", "  "]).join(words))
+    return texts
+
+
+def _reference(catalog, result_key, text):
+    results = {}
+    for category, phrases in catalog.items():
+        if not phrases:
+            continue
+        pattern = re.compile(
+            r"\b(" + "|".join(re.escape(p) for p in phrases) + r")\b",
+            flags=re.IGNORECASE | re.UNICODE,
+        )
+        matches = [
+            {result_key: m.group(0), "start": m.start(), "end": m.end()}
+            for m in pattern.finditer(text)
+        ]
+        if matches:
+            results[category] = matches
+    return results
+
+
+def test_amenity_extractor_matches_per_category_scan():
+    extractor = AmenityExtractor(AMENITY_CATALOG)
+    texts = _texts(AMENITY_CATALOG)
+
+    expected = [_reference(AMENITY_CATALOG, "amenity", text) for text in texts]
+    assert [extractor.extract(text) for text in texts] == expected
+    assert extractor.extract_batch(texts) == expected
+
+
+def test_legal_phrase_extractor_matches_per_category_scan():
+    extractor = LegalPhraseExtractor(LEGAL_CATALOG)
+    texts = _texts(LEGAL_CATALOG, seed=4)
+
+    expected = [_reference(LEGAL_CATALOG, "phrase", text) for text in texts]
+    assert extractor.extract_batch(texts) == expected
+
+
+def test_empty_phrase_category_keeps_finditer_semantics():
+    catalog = {"odd": ["", "ab"], "plain": ["ab"]}
+    matcher = PhraseMatcher(catalog, result_key="phrase")
+
+    for text in ["", "ab", "x ab y", "ab ab", "a"]:
+        assert matcher.find(text) == _reference(catalog, "phrase", text)
@@ -0,0 +1,146 @@
+"""
+POI index: nearest / within / count_within vs brute-force Haversine,
+radius-edge agreement and save / load round-trip.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from feature_pipeline.geo.distance_features import _haversine_km
+from feature_pipeline.geo.poi_index import (
+    POIIndex,
+    POIIndexError,
+    PointOfInterest,
+    _haversine_to_many,
+)
+
+
+def _points(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    lat = rng.uniform(10.70, 10.85, n)
+    lon = rng.uniform(106.60, 106.80, n)
+    return [
+        PointOfInterest(
+            poi_id=f"p{i}",
+            category="metro" if i % 3 else "school",
+            latitude=float(a),
+            longitude=float(o),
+            name=None if i % 5 == 0 else f"POI {i}",
+        )
+        for i, (a, o) in enumerate(zip(lat, lon))
+    ]
+
+
+def _subjects(n=60, seed=1):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(10.70, 10.85, n), rng.uniform(106.60, 106.80, n)
+
+
+def _brute(points, category, latitude, longitude):
+    return sorted(
+        (_haversine_km(latitude, longitude, p.latitude, p.longitude), p.poi_id)
+        for p in points
+        if p.category == category
+    )
+
+
+def test_nearest_matches_brute_force():
+    points = _points()
+    index = POIIndex(points)
+    lat, lon = _subjects()
+
+    for a, o in zip(lat, lon):
+        expected = _brute(points, "metro", a, o)[:3]
+        matches = index.nearest(a, o, "metro", k=3)
+        assert [m.poi_id for m in matches] == [poi_id for _, poi_id in expected]
+        for match, (distance, _) in zip(matches, expected):
+            assert match.distance_km == pytest.approx(distance, rel=1e-9, abs=1e-9)
+
+
+def test_within_and_count_within_agree_at_the_radius_edge():
+    points = _points()
+    index = POIIndex(points)
+    lat, lon = _subjects()
+    metro = [p for p in points if p.category == "metro"]
+
+    radii = []
+    for a, o in zip(lat, lon):
+        # Radii equal to an exact POI distance put that POI on the edge
+        edge = _haversine_to_many(
+            a, o, np.array([metro[0].latitude]), np.array([metro[0].longitude])
+        )[0]
+        radii.append((a, o, float(edge)))
+        radii.append((a, o, 2.5))
+
+    for a, o, radius in radii:
+        within = index.within(a, o, "metro", radius)
+        expected = [
+            poi_id for distance, poi_id in _brute(points, "metro", a, o)
+            if distance <= radius
+        ]
+        assert sorted(m.poi_id for m in within) == sorted(expected)
+        assert index.count_within(a, o, "metro", radius) == len(within)
+
+    batch = index.count_within_batch(lat, lon, "metro", 2.5)
+    assert batch.tolist() == [len(index.within(a, o, "metro", 2.5)) for a, o in zip(lat, lon)]
+
+
+def test_missing_subjects_and_unknown_categories():
+    index = POIIndex(_points())
+
+    distances, indices = index.nearest_batch([np.nan, 10.8], [106.7, np.nan], "metro", k=2)
+    assert np.isnan(distances).all() and (indices == -1).all()
+    assert index.count_within_batch([np.nan], [106.7], "metro", 5.0).tolist() == [0]
+    assert index.nearest(10.8, 106.7, "hospital") == []
+    assert index.within(10.8, 106.7, "hospital", 5.0) == []
+
+    with pytest.raises(POIIndexError):
+        index.nearest_batch([10.8], [106.7], "metro", k=0)
+
+
+def test_save_load_round_trip(tmp_path):
+    points = _points()
+    index = POIIndex(points)
+    path = str(tmp_path / "poi.npz")
+    index.save(path)
+
+    loaded = POIIndex.from_file(path)
+    lat, lon = _subjects()
+
+    assert loaded.categories == index.categories
+    for category in index.categories:
+        assert loaded.category_size(category) == index.category_size(category)
+        original = index._categories[category]
+        restored = loaded._categories[category]
+        assert restored.poi_ids.tolist() == original.poi_ids.tolist()
+        assert restored.names.tolist() == original.names.tolist()
+        for a, o in zip(lat, lon):
+            assert loaded.nearest(a, o, category, k=2) == index.nearest(a, o, category, k=2)
+            assert loaded.within(a, o, category, 3.0) == index.within(a, o, category, 3.0)
+
+
+def test_from_json_file(tmp_path):
+    points = _points(n=20)
+    path = tmp_path / "poi.json"
+    path.write_text(
+        json.dumps(
+            [
+                {
+                    "poi_id": p.poi_id,
+                    "category": p.category,
+                    "latitude": p.latitude,
+                    "longitude": p.longitude,
+                    "name": p.name,
+                }
+                for p in points
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    loaded = POIIndex.from_file(str(path))
+    assert loaded.nearest(10.8, 106.7, "metro", k=5) == POIIndex(points).nearest(
+        10.8, 106.7, "metro", k=5
+    )
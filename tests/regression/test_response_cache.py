@@ -0,0 +1,122 @@
+"""
+Immutable artifact response cache: HIT / MISS / BYPASS and
+ETag / If-None-Match handling.
+"""
+
+import json
+
+from starlette.requests import Request
+
+from api.services.response_cache import (
+    CACHE_STATUS_HEADER,
+    ImmutableResponseCache,
+    cached_artifact_response,
+    compute_content_hash,
+)
+
+
+ARTIFACT = {"valuation_id": "v-1", "estimate": 4_250_000_000, "currency": "VND"}
+
+
+def _request(if_none_match=None):
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode("ascii")))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class _Loader:
+    def __init__(self, artifact):
+        self.artifact = artifact
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.artifact
+
+
+def _serve(cache, loader, if_none_match=None, **kwargs):
+    return cached_artifact_response(
+        _request(if_none_match),
+        artifact_type="valuation",
+        artifact_id="v-1",
+        loader=loader,
+        cache=cache,
+        **kwargs,
+    )
+
+
+def test_write_once_artifact_is_loaded_once():
+    cache = ImmutableResponseCache()
+    loader = _Loader(ARTIFACT)
+
+    first = _serve(cache, loader, write_once=True)
+    second = _serve(cache, loader, write_once=True)
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers[CACHE_STATUS_HEADER] == "MISS"
+    assert second.headers[CACHE_STATUS_HEADER] == "HIT"
+    assert json.loads(second.body) == ARTIFACT
+    assert first.headers["ETag"] == second.headers["ETag"]
+    assert loader.calls == 1
+
+
+def test_matching_etag_returns_304_without_body():
+    cache = ImmutableResponseCache()
+    loader = _Loader(ARTIFACT)
+    etag = _serve(cache, loader, write_once=True).headers["ETag"]
+
+    for if_none_match in (etag, "W/" + etag, '"other", ' + etag, "*"):
+        response = _serve(cache, loader, if_none_match, write_once=True)
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["ETag"] == etag
+
+    stale = _serve(cache, loader, '"other"', write_once=True)
+    assert stale.status_code == 200
+    assert loader.calls == 1
+
+
+def test_content_hash_key_never_serves_regenerated_artifact_stale():
+    cache = ImmutableResponseCache()
+    old = _Loader(ARTIFACT)
+    new = _Loader(dict(ARTIFACT, estimate=4_300_000_000))
+
+    _serve(cache, old, content_hash=compute_content_hash(old.artifact))
+    response = _serve(cache, new, content_hash=compute_content_hash(new.artifact))
+
+    assert response.headers[CACHE_STATUS_HEADER] == "MISS"
+    assert json.loads(response.body) == new.artifact
+
+
+def test_without_content_hash_the_body_cache_is_bypassed():
+    cache = ImmutableResponseCache()
+    loader = _Loader(ARTIFACT)
+
+    etag = _serve(cache, loader).headers["ETag"]
+    response = _serve(cache, loader, etag)
+
+    assert response.status_code == 304
+    assert response.headers[CACHE_STATUS_HEADER] == "BYPASS"
+    assert loader.calls == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_envelope_metadata_does_not_change_the_etag():
+    cache = ImmutableResponseCache()
+    loader = _Loader(ARTIFACT)
+
+    plain = _serve(cache, loader, write_once=True)
+    wrapped = _serve(
+        cache,
+        loader,
+        write_once=True,
+        envelope_key="report",
+        envelope_metadata={"request_id": "r-1"},
+    )
+
+    assert wrapped.headers["ETag"] == plain.headers["ETag"]
+    assert json.loads(wrapped.body) == {
+        "report": ARTIFACT,
+        "metadata": {"request_id": "r-1"},
+    }